@@ -1,17 +1,18 @@
 from __future__ import annotations
 
 import logging
+import math
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable, Literal
+from typing import TYPE_CHECKING, Coroutine, Iterable, Literal
 
 import trio
 from kivy._event import EventDispatcher
 from kivy.app import App
 from kivy.base import ExceptionManager, ExceptionHandler, async_runTouchApp
 from kivy.clock import Clock
-from kivy.config import Config
+from kivy.config import Config, ConfigParser
 from kivy.core.window import Window
 from kivy.metrics import dp
 from kivy.properties import (
@@ -28,6 +29,7 @@ from trio import Nursery
 
 from mvckivy.app import ScreenRegistrator
 from mvckivy.mvc_base import BaseScreen
+from mvckivy.network.http_cache import HttpCache
 from mvckivy.project_management import PathItem
 from mvckivy.project_management.path_manager import MVCPathManager
 from mvckivy.utils.builder import MVCBuilder
@@ -41,6 +43,9 @@ from mvckivy.utils.constants import (
     DESKTOP_PLATFORMS,
 )
 from mvckivy.utils.error_handlers import ClockHandler
+from mvckivy.utils.event_router import PENDING_POLICIES, PendingPolicy
+from mvckivy.utils.startup_hooks import StartupHooks
+from mvckivy.utils.write_behind_config import WriteBehindConfigParser
 
 try:
     from monotonic import monotonic
@@ -75,6 +80,10 @@ class PathManagerBehavior:
     def create_path_manager(self) -> MVCPathManager:
         return MVCPathManager(self.get_root_path())
 
+    def create_http_cache(self) -> HttpCache:
+        """Disk cache of the requests made with ``use_cache=True``; override to tune it."""
+        return HttpCache(self.path_manager.cache_dir.join("http").path())
+
 
 class ScreenRegistrationBehavior:
     _registrator: ObjectProperty[ScreenRegistrator] = ObjectProperty(rebind=False)
@@ -285,11 +294,21 @@ class AppInfoBehavior(EventDispatcher):
 class MKVApp(AppInfoBehavior, IdleBehavior, ThemeBehavior, App):
     debug_mode: BooleanProperty = BooleanProperty(False)
     icon: StringProperty = StringProperty("kivymd/images/logo/kivymd-icon-512.png")
+    config_flush_delay: NumericProperty = NumericProperty(1.0)
+    """
+    Debounce interval (seconds) of the write-behind app config.
+    Config writes are coalesced and flushed off the UI thread; 0 writes immediately.
+    """
+    startup_hook_timeout: NumericProperty = NumericProperty(30.0, allownone=True)
+    """
+    Default timeout (seconds) of async startup hooks; None disables it.
+    """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.session_id = datetime.now().strftime("%Y%m%d%H%M%S")
         self.nursery: Nursery | None = None
+        self.startup_hooks = StartupHooks()
 
         self.theme_cls: ThemeManager = ThemeManager()
         self.theme_cls.bind(
@@ -329,6 +348,30 @@ class MKVApp(AppInfoBehavior, IdleBehavior, ThemeBehavior, App):
         for _logger in urllib_loggers:
             _logger.setLevel(_logging.INFO if self.debug_mode else _logging.WARNING)
 
+    def load_config(self):
+        try:
+            config = ConfigParser.get_configparser("app")
+        except KeyError:
+            config = None
+
+        if config is None:
+            # App.load_config reuses the parser registered under "app"
+            self.config = WriteBehindConfigParser(
+                name="app", flush_delay=self.config_flush_delay
+            )
+
+        return super().load_config()
+
+    def flush_config(self) -> None:
+        """Write pending config changes to disk synchronously."""
+        flush = getattr(self.config, "flush", None)
+        if flush is not None:
+            flush()
+
+    def on_config_flush_delay(self, _instance, delay: float) -> None:
+        if isinstance(self.config, WriteBehindConfigParser):
+            self.config.flush_delay = delay
+
     def _configure_clock_behavior(self) -> None:
         Clock.max_iteration = 30
 
@@ -376,6 +419,34 @@ class MKVApp(AppInfoBehavior, IdleBehavior, ThemeBehavior, App):
         self.config_loggers()
         return super().on_start()
 
+    def on_pause(self):
+        self.flush_config()
+        return super().on_pause()
+
+    def on_stop(self):
+        self.startup_hooks.cancel()
+        self.flush_config()
+        if isinstance(self.config, WriteBehindConfigParser):
+            # stops the writer thread; later writes are flushed at once
+            self.config.close()
+        return super().on_stop()
+
+    def start_async_hook(
+        self, name: str, coro: Coroutine, timeout: float | None = None
+    ) -> bool:
+        """
+        Run a coroutine concurrently in the app nursery.
+        It is cancelled after ``timeout`` (``startup_hook_timeout`` by default) or on
+        stop; its timing is available in ``startup_hooks.timings()``.
+        :return: bool - False if the hook could not be started (no nursery).
+        """
+        if timeout is None:
+            timeout = self.startup_hook_timeout
+        if timeout is None:
+            # None means "use the default" for StartupHooks: disable explicitly
+            timeout = math.inf
+        return self.startup_hooks.start(self.nursery, name, coro, timeout)
+
     def switch_screen(self, *args, **kwargs):
         pass
 
@@ -389,12 +460,22 @@ class MVCApp(
     controller: ObjectProperty[BaseAppController] = ObjectProperty()
     screen: ObjectProperty[BaseAppScreen] = ObjectProperty()
     current_screen_name: StringProperty = StringProperty("initial_screen")
+    pending_controller_policy: OptionProperty = OptionProperty(
+        "skip", options=PENDING_POLICIES
+    )
+    """
+    What ``dispatch_to_all_controllers`` does with interested controllers that are
+    not created yet: ``skip`` the event, ``queue`` it until creation or ``create``
+    the controller to receive it.
+    """
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
         self.path_manager = self.create_path_manager()
+        self.http_cache: HttpCache = self.create_http_cache()
         self._registrator: ScreenRegistrator = self.create_screen_registrator()
+        self._registrator.router.on_coroutine = self._start_controller_hook
 
         MVCBuilder.load_libs_kv_files()
         self.load_all_screens_kv_files()
@@ -406,9 +487,28 @@ class MVCApp(
         self.screen: BaseAppScreen = self._registrator.get_app_screen()
         self.root = self.get_root()
 
-    def dispatch_to_all_controllers(self, event_type: str, *args):
-        for c in self.get_controllers():
-            c.dispatch(event_type, *args)
+    def dispatch_to_all_controllers(
+        self, event_type: str, *args, pending: PendingPolicy | None = None
+    ) -> int:
+        """
+        Dispatch an app-wide event to the controllers that handle it.
+
+        Controllers are looked up in the registrator's routing table: only those
+        overriding the event handler (or listing it in ``routed_events``) receive
+        the event. ``pending`` overrides ``pending_controller_policy`` for
+        controllers that are not created yet.
+        :return: int - Number of controllers the event was dispatched to.
+        """
+        return self._registrator.router.dispatch(
+            event_type, *args, pending=pending or self.pending_controller_policy
+        )
+
+    def _start_controller_hook(self, name: str, controller, coro: Coroutine) -> None:
+        self.start_async_hook(
+            f"{name}.{coro.__name__}",
+            coro,
+            timeout=getattr(controller, "app_start_timeout", None),
+        )
 
     def switch_screen(self, screen_name: str) -> None:
         """
@@ -496,8 +596,9 @@ class MVCApp(
         self.dispatch_to_all_controllers("on_app_start")
 
     def on_stop(self):
+        # Controllers may still write settings on exit: flush after them
+        self.dispatch_to_all_controllers("on_app_exit", pending="skip")
         super().on_stop()
-        self.dispatch_to_all_controllers("on_app_exit")
 
     def build(self):
         if not self.debug_mode:
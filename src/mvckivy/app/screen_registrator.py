@@ -19,6 +19,11 @@ from mvckivy.mvc_base.base_app_controller import BaseAppController
 from mvckivy.mvc_base.base_app_model import BaseAppModel
 from mvckivy.mvc_base.base_app_screen import BaseAppScreen
 from mvckivy.project_management import PathItem
+from mvckivy.utils.event_router import (
+    ControllerEventRouter,
+    PendingEvents,
+    ResultHandler,
+)
 
 if TYPE_CHECKING:
     from mvckivy.app.screens_schema import ScreensSchema
@@ -83,6 +88,13 @@ class MVCTrio:
         self._model: BaseModel | None = None
         self._controller: BaseController | None = None
         self._screen: BaseScreen | None = None
+        self._pending_events = PendingEvents()
+        # called when the trio's controller or screen is created or cleared
+        self.on_change: Callable[[], None] | None = None
+
+    def _changed(self) -> None:
+        if self.on_change is not None:
+            self.on_change()
 
     @log_registration
     def ensure_model(self) -> BaseModel:
@@ -94,6 +106,9 @@ class MVCTrio:
     def ensure_controller(self) -> BaseController:
         if self._controller is None:
             self._controller = self._controller_cls(model=self.ensure_model())
+            self._changed()
+            if self._pending_events:
+                self._pending_events.replay(self._controller)
         return self._controller
 
     @log_registration
@@ -104,6 +119,7 @@ class MVCTrio:
                 controller=self.ensure_controller(),
                 name=self.name,
             )
+            self._changed()
         return self._screen
 
     def get_model(self) -> BaseModel | None:
@@ -115,6 +131,16 @@ class MVCTrio:
     def get_screen(self) -> BaseScreen | None:
         return self._screen
 
+    def queue_event(
+        self, event_type: str, *args, on_result: ResultHandler | None = None
+    ) -> None:
+        """Deliver the event to the controller once it is created."""
+        self._pending_events.put(event_type, args, on_result)
+
+    @property
+    def controller_cls(self) -> Type[BaseController]:
+        return self._controller_cls
+
     @property
     def parent(self) -> str | None:
         return self._parent
@@ -128,10 +154,16 @@ class MVCTrio:
         return self._kv_path
 
     def clear_screen(self) -> None:
-        self._screen = None
+        if self._screen is not None:
+            self._screen.release_bindings()
+            self._screen = None
+            self._changed()
 
     def clear_controller(self) -> None:
-        self._controller = None
+        if self._controller is not None:
+            self._controller.release_bindings()
+            self._controller = None
+            self._changed()
 
     def clear_model(self) -> None:
         self._model = None
@@ -157,6 +189,9 @@ class ScreenRegistrator:
 
     def __init__(self, schema: list[ScreensSchema]):
         self.trios: dict[str, MVCTrio] = {t["name"]: MVCTrio(**t) for t in schema}
+        self.router = ControllerEventRouter(self.trios)
+        for trio in self.trios.values():
+            trio.on_change = self.router.invalidate
 
     def _trio(self, name: str) -> MVCTrio | None:
         return self.trios.get(name)
@@ -1,11 +1,21 @@
-from kivy.animation import Animation
+import re
+from contextlib import ExitStack
+
 from kivy.event import EventDispatcher
 from typing import Callable
 
 from mvckivy.uix.behaviors.mvc_behavior import MVCWidget
 from mvckivy import logger
+from mvckivy.properties.base_classes import ObservableStruct
+from mvckivy.properties.extended_alias_property import ExtendedAliasProperty
 from mvckivy.network import UrlRequestRequests
+from mvckivy.network.async_client import AsyncHttpClient, async_http_client
+from mvckivy.network.request_executor import Priority
+from mvckivy.network.response_decoder import summarize_result
+from mvckivy.network.stream_buffer import ChunkMode, OverflowPolicy
+from mvckivy.network.websocket_client import WebsocketClient
 from mvckivy.network.decorators import call_after
+from mvckivy.utils.animation_pool import AnimationPool, animation_pool
 
 
 class DispatchException(Exception):
@@ -14,10 +24,20 @@ class DispatchException(Exception):
 
 class BaseController(MVCWidget):
     __events__ = ("on_app_start", "on_app_exit")
+    # Routed even without an override: the default on_app_exit does the cleanup
+    routed_events: tuple[str, ...] = ("on_app_exit",)
+    # Timeout (s) of an async on_app_start; None uses MKVApp.startup_hook_timeout
+    app_start_timeout: float | None = None
+
+    # Shared by all controllers: one animation track per (model, property)
+    animation_pool: AnimationPool = animation_pool
+    # Shared trio-native client (same session pool as make_request)
+    http_client: AsyncHttpClient = async_http_client
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._to_cancel_requests: list[UrlRequestRequests] = []
+        self._websockets: list[WebsocketClient] = []
 
     def dispatch_to_model(
         self,
@@ -28,15 +48,16 @@ class BaseController(MVCWidget):
         force_dispatch: bool = False,
         custom_model: None | EventDispatcher = None,
         nested_assignment: bool = False,
+        batch: bool = False,
         **kwargs,
     ):
         """
         Dispatch properties to the target model with optional animation.
 
         This method updates properties on the provided model (or self.model by default) using either a direct
-        assignment or an animated transition. When animation is enabled via the ``animate`` flag, property updates
-        are passed to an Animation instance which is then started on the target model. The method supports both
-        sequential and parallel animations. In parallel mode, all animations are merged using the bitwise AND operator.
+        assignment or an animated transition. When animation is enabled via the ``animate`` flag, every property
+        is animated on its own pooled track (see ``AnimationPool``): a new value for a property that is still
+        animating retargets the running animation from its current value instead of stacking a competing one.
         Additionally, the method can handle nested assignments when property values are provided as tuples.
 
         Parameters
@@ -45,7 +66,8 @@ class BaseController(MVCWidget):
             If True, perform the update using an animation. Otherwise, update properties immediately.
             Default is False.
         parallel : bool, optional
-            When animate is True, if True, combine individual property animations in parallel.
+            Kept for compatibility: pooled tracks always animate properties in parallel. When True,
+            nested assignments are rejected as before.
             Default is False.
         duration : float, optional
             The duration of the animation (in seconds) when animate is True.
@@ -64,9 +86,17 @@ class BaseController(MVCWidget):
             For tuple values, if the tuple length is 2, the first element is considered an attribute key,
             and the second the value to be set on that nested attribute.
             Default is False.
+        batch : bool, optional
+            If True (without animation), apply all values first and notify dependents afterwards:
+            ExtendedAliasProperty dependents recompute once on the final state, nested assignments
+            into the same ExtendedList/DictProperty produce one coalesced notification, and
+            ``force_dispatch`` dispatches each property once after all values are set.
+            Coalescing is partial: plain Kivy properties dispatch, and KV rules and ``bind``
+            callbacks bound to them fire, once per assignment, exactly as without ``batch``.
+            Default is False.
         **kwargs
             A set of key-value pairs corresponding to the property names and the new values to assign.
-            When animate is True, these kwargs are passed to the Animation constructor.
+            When animate is True, each property is animated on its pooled track.
 
         Raises
         ------
@@ -82,8 +112,6 @@ class BaseController(MVCWidget):
             custom_model = self.model
 
         if animate:
-            anim = None
-
             if parallel:
                 for key, value in kwargs.items():
                     if isinstance(value, tuple) and nested_assignment:
@@ -91,32 +119,73 @@ class BaseController(MVCWidget):
                             f"Animations are not supported for nested assignment: {key}: {value}"
                         )
 
-                    if anim is not None:
-                        anim = anim & Animation(
-                            **{key: value}, d=duration, t=transition
-                        )
-                    else:
-                        anim = Animation(**{key: value}, d=duration, t=transition)
-            else:
-                anim = Animation(**kwargs, d=duration, t=transition)
+            self.animation_pool.animate(
+                custom_model, duration=duration, transition=transition, **kwargs
+            )
+
+        elif batch:
+            with ExitStack() as stack:
+                stack.enter_context(ExtendedAliasProperty.batch())
+                structs: set[int] = set()
 
-            anim.start(custom_model)
+                for key, value in kwargs.items():
+                    if isinstance(value, tuple) and nested_assignment:
+                        attr = getattr(custom_model, key, None)
+                        if (
+                            isinstance(attr, ObservableStruct)
+                            and id(attr) not in structs
+                        ):
+                            structs.add(id(attr))
+                            stack.enter_context(attr.batch())
+
+                    self._assign_to_model(
+                        custom_model, key, value, False, nested_assignment
+                    )
+
+                if force_dispatch:
+                    for key in kwargs:
+                        custom_model.property(key).dispatch(custom_model)
 
         else:
 
             for key, value in kwargs.items():
+                self._assign_to_model(
+                    custom_model, key, value, force_dispatch, nested_assignment
+                )
 
-                prop = custom_model.property(key)
+    def post_to_model(
+        self, custom_model: None | EventDispatcher = None, **kwargs
+    ) -> None:
+        """
+        Thread-safe counterpart of ``dispatch_to_model`` for worker threads.
 
-                if isinstance(value, tuple) and nested_assignment:
-                    attr = getattr(custom_model, key, None)
-                    if attr and len(value) == 2:
-                        attr[value[0]] = value[1]
-                else:
-                    prop.set(custom_model, value)
+        Values are queued in the model's update inbox; the main thread applies the latest value of each
+        property once per frame as a single batch instead of one scheduled callback per write.
+        """
+        if not custom_model:
+            custom_model = self.model
 
-                if force_dispatch:
-                    prop.dispatch(custom_model)
+        custom_model.post_update(**kwargs)
+
+    @staticmethod
+    def _assign_to_model(
+        model: EventDispatcher,
+        key: str,
+        value,
+        force_dispatch: bool,
+        nested_assignment: bool,
+    ) -> None:
+        prop = model.property(key)
+
+        if isinstance(value, tuple) and nested_assignment:
+            attr = getattr(model, key, None)
+            if attr and len(value) == 2:
+                attr[value[0]] = value[1]
+        else:
+            prop.set(model, value)
+
+        if force_dispatch:
+            prop.dispatch(model)
 
     def make_request(
         self,
@@ -127,11 +196,15 @@ class BaseController(MVCWidget):
         files: None | dict = None,
         jsonify_stream_chunk: bool = False,
         chunk_polling_frequency_hz: None | int = None,
+        chunk_mode: ChunkMode = "batch",
+        max_buffered_chunks: int = 1024,
+        chunk_overflow: OverflowPolicy = "drop_oldest",
         on_success=None,
         on_redirect=None,
         on_failure=None,
         on_error=None,
         on_stream_chunk: Callable | None = None,  # doesn't log
+        on_stream_batch: Callable | None = None,  # doesn't log
         on_cancel=None,  # doesn't log
         on_finish=None,  # doesn't log
         on_progress=None,  # doesn't log
@@ -151,6 +224,9 @@ class BaseController(MVCWidget):
         user_agent=None,
         cookies=None,
         auth=None,
+        priority: Priority = Priority.USER,
+        use_cache: bool = False,
+        dedupe: bool = True,
     ) -> UrlRequestRequests:
         """
         Initiates and returns a configured URL request.
@@ -177,7 +253,15 @@ class BaseController(MVCWidget):
         jsonify_stream_chunk : bool, optional
             If True, each chunk received during streaming will be converted to JSON. Defaults to False.
         chunk_polling_frequency_hz : int, optional
-            Frequency (in Hertz) for polling data chunks in streaming mode. Defaults to None.
+            Maximum frequency (in Hertz) at which stream chunks are delivered to the UI; chunks received
+            in between are buffered, not dropped. Defaults to None (every frame).
+        chunk_mode : str, optional
+            "batch" delivers every buffered chunk, "latest" only the newest one. Defaults to "batch".
+        max_buffered_chunks : int, optional
+            Bound of the chunk buffer in "batch" mode. Defaults to 1024.
+        chunk_overflow : str, optional
+            When the buffer is full: "drop_oldest" (counted in ``req.chunk_buffer.stats()``) or "block"
+            to stop reading the stream until the UI catches up. Defaults to "drop_oldest".
 
         Callback Parameters
         -------------------
@@ -191,6 +275,9 @@ class BaseController(MVCWidget):
             Callback function executed when an error occurs during the request.
         on_stream_chunk : callable, optional
             Callback function for each stream chunk received. (Does not perform any logging.)
+        on_stream_batch : callable, optional
+            Callback function receiving the list of chunks buffered since the previous delivery.
+            (Does not perform any logging.)
         on_cancel : callable, optional
             Callback function executed if the request is cancelled. (Does not perform any logging.)
         on_finish : callable, optional
@@ -201,7 +288,10 @@ class BaseController(MVCWidget):
         Additional Request Options
         --------------------------
         decode : bool, optional
-            If True, decode the response data; this feature is turned off by default. Defaults to False.
+            If True, decode the response body in the worker thread with the decoder registered for its
+            Content-Type in ``response_decoders`` (JSON, msgpack if installed, custom ones); callbacks
+            receive the decoded object instead of the response. Large bodies can be decoded in a process
+            pool (``response_decoders.process_threshold``). Defaults to False.
         req_body : any, optional
             The body of the request.
         req_headers : any, optional
@@ -232,6 +322,16 @@ class BaseController(MVCWidget):
             Cookies to be sent with the request.
         auth : any, optional
             Authentication credentials for the request.
+        priority : Priority, optional
+            Queue priority on the shared request executor: ``Priority.USER`` for requests the user
+            waits for, ``Priority.BACKGROUND`` for polling and prefetching. Defaults to USER.
+        use_cache : bool, optional
+            If True, GET requests go through the app's HTTP disk cache (``app.http_cache``, under
+            ``path_manager.cache_dir``): fresh responses are served from disk, stale ones are revalidated
+            with ETag/Last-Modified. Meant for reference data such as catalogs. Defaults to False.
+        dedupe : bool, optional
+            If True, a GET identical to one already in flight (same URL, params, headers) shares its call
+            and receives the same result; cancelling it does not abort the other callers. Defaults to True.
 
         Returns
         -------
@@ -243,7 +343,7 @@ class BaseController(MVCWidget):
         The internal helper callbacks (_on_success, _on_redirect, _on_failure, _on_error,
         _on_stream_chunk, _on_cancel, _on_finish, and _on_progress) wrap the provided callbacks using
         the ``@call_after`` decorator. Logging is performed for the error, failure, success, and redirect
-        events. The other callbacks serve to extend functionality without directly logging their events.
+        events; results are logged as a size summary with a truncated repr (``summarize_result``). The other callbacks serve to extend functionality without directly logging their events.
         If the request is a streaming request, the instance is added to an internal list used to
         track requests that may need to be cancelled.
 
@@ -253,17 +353,18 @@ class BaseController(MVCWidget):
         def _on_error(request, error) -> None:
             logger.error(error)
 
+        # Results are summarized: logging a decoded mission would format megabytes
         @call_after(on_failure)
         def _on_failure(request, result) -> None:
-            logger.warning(result)
+            logger.warning(summarize_result(result))
 
         @call_after(on_success)
         def _on_success(request, result) -> None:
-            logger.info(result)
+            logger.info(summarize_result(result))
 
         @call_after(on_redirect)
         def _on_redirect(request, result):
-            logger.info(result)
+            logger.info(summarize_result(result))
 
         @call_after(on_finish)
         def _on_finish(request):
@@ -277,6 +378,10 @@ class BaseController(MVCWidget):
         def _on_stream_chunk(request, stream_chunk):
             pass
 
+        @call_after(on_stream_batch)
+        def _on_stream_batch(request, stream_chunks):
+            pass
+
         @call_after(on_progress)
         def _on_progress(request, current_size, total_size):
             pass
@@ -290,6 +395,9 @@ class BaseController(MVCWidget):
             files=files,
             jsonify_stream_chunk=jsonify_stream_chunk,
             chunk_polling_frequency_hz=chunk_polling_frequency_hz,
+            chunk_mode=chunk_mode,
+            max_buffered_chunks=max_buffered_chunks,
+            chunk_overflow=chunk_overflow,
             on_success=_on_success,
             on_redirect=_on_redirect,
             on_failure=_on_failure,
@@ -297,7 +405,8 @@ class BaseController(MVCWidget):
             on_progress=_on_progress,
             on_cancel=_on_cancel,
             on_finish=_on_finish,
-            on_stream_chunk=_on_stream_chunk,
+            on_stream_chunk=_on_stream_chunk if on_stream_chunk else None,
+            on_stream_batch=_on_stream_batch if on_stream_batch else None,
             req_body=req_body,
             req_headers=req_headers,
             chunk_size=chunk_size,
@@ -314,6 +423,9 @@ class BaseController(MVCWidget):
             user_agent=user_agent,
             cookies=cookies,
             auth=auth,
+            priority=priority,
+            http_cache=self.app.http_cache if use_cache else None,
+            dedupe=dedupe,
         )
 
         if is_streaming:
@@ -321,9 +433,86 @@ class BaseController(MVCWidget):
 
         return req
 
+    async def request_async(self, endpoint: str, method: str = "GET", **kwargs):
+        """
+        Awaitable counterpart of ``make_request``.
+
+        Sends ``method`` to ``endpoint`` (appended to the app's base URL) through the shared
+        session pool and returns the ``requests.Response``. Cancelling the calling task's cancel
+        scope or nursery aborts the wait.
+
+        Parameters
+        ----------
+        endpoint : str
+            The API endpoint appended to the base URL.
+        method : str, optional
+            HTTP method. Defaults to "GET".
+        **kwargs
+            Passed to ``AsyncHttpClient.request`` (params, json, headers, timeout, raise_for_status...).
+
+        Raises
+        ------
+        AsyncRequestError
+            On transport errors (``on_error`` of ``make_request``).
+        ResponseStatusError
+            On 4xx/5xx responses (``on_failure`` of ``make_request``).
+        """
+        url = f"{self.app.model.gs_base_url}{endpoint}"
+        return await self.http_client.request(method, url, **kwargs)
+
+    def stream_async(self, endpoint: str, method: str = "GET", **kwargs):
+        """
+        Async context manager yielding an async iterator over the lines of a streaming
+        response (see ``AsyncHttpClient.stream``); the connection is closed on exit or
+        cancellation::
+
+            async with self.stream_async("/telemetry", jsonify=True) as chunks:
+                async for chunk in chunks:
+                    ...
+        """
+        url = f"{self.app.model.gs_base_url}{endpoint}"
+        return self.http_client.stream(url, method, **kwargs)
+
+    def open_websocket(self, endpoint: str, **kwargs) -> WebsocketClient:
+        """
+        Open a WebSocket to ``endpoint`` (the app's base URL with the ws/wss scheme) and keep it
+        connected in the app nursery until the app exits.
+
+        Received messages are delivered once per frame to ``on_batch`` / ``on_message``; see
+        ``WebsocketClient`` for reconnection, heartbeat and send queue options::
+
+            self.telemetry = self.open_websocket(
+                "/ws/telemetry", on_batch=self.on_telemetry, jsonify=True
+            )
+            self.telemetry.send({"subscribe": "vehicle/1"})
+
+        Raises
+        ------
+        RuntimeError
+            If the app's trio nursery is not running yet.
+        """
+        nursery = self.app.nursery
+        if nursery is None:
+            raise RuntimeError("open_websocket needs the app's trio nursery")
+
+        url = re.sub(r"^http", "ws", self.app.model.gs_base_url)
+        client = WebsocketClient(f"{url}{endpoint}", **kwargs)
+        nursery.start_soon(client.run)
+        self._websockets.append(client)
+        return client
+
     def on_app_start(self):
-        pass
+        """
+        Called once the app has started. May be overridden with an ``async def``:
+        the coroutine then runs concurrently with other controllers' hooks in the
+        app's trio nursery and is cancelled after ``app_start_timeout`` or on stop.
+        """
 
     def on_app_exit(self):
         for req in self._to_cancel_requests:
             req.cancel()
+        for client in self._websockets:
+            client.close()
+        if self.model is not None:
+            self.animation_pool.cancel(self.model)
+        self.release_bindings()
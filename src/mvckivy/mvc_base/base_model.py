@@ -1,17 +1,73 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from kivy.app import App
 from kivy.event import EventDispatcher
 from kivy.properties import ObjectProperty
 
+from mvckivy.utils.model_snapshot import ModelSnapshotter, SnapshotFormat
+from mvckivy.utils.update_inbox import UpdateInbox
+
 
 if TYPE_CHECKING:
     from mvckivy.app import MVCApp
 
 
 class BaseModel(EventDispatcher):
+    __events__ = ("on_restore",)
+
     app: ObjectProperty = ObjectProperty(None, rebind=True, allownone=False)
 
+    # Properties that are never written to snapshots
+    snapshot_exclude: tuple[str, ...] = ("app",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.app: MVCApp = App.get_running_app()
+        self._snapshotter: ModelSnapshotter | None = None
+        # created here, on the main thread: workers post to it concurrently
+        self._inbox = UpdateInbox(self)
+
+    @property
+    def inbox(self) -> UpdateInbox:
+        """Thread-safe update inbox, drained on the main thread once per frame."""
+        return self._inbox
+
+    def post_update(self, **values) -> None:
+        """
+        Queues property values from any thread. Only the latest value of each
+        property is applied on the next frame, all of them as one batch, in the
+        order the properties were first posted.
+        """
+        self.inbox.post_many(**values)
+
+    def post_append(self, name: str, *items: Any) -> None:
+        """Queues items for the list property ``name`` from any thread; none are dropped."""
+        self.inbox.append(name, *items)
+
+    @property
+    def snapshotter(self) -> ModelSnapshotter:
+        if self._snapshotter is None:
+            self._snapshotter = ModelSnapshotter(self, exclude=self.snapshot_exclude)
+        return self._snapshotter
+
+    def snapshot_state(self, delta: bool = False) -> dict[str, Any]:
+        """
+        Returns the model state as plain data, including nested models.
+        With ``delta=True`` only properties changed since the previous snapshot are included.
+        """
+        return self.snapshotter.state(delta=delta)
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Applies a state from ``snapshot_state`` and dispatches ``on_restore`` once."""
+        self.snapshotter.restore(state)
+
+    def snapshot(self, delta: bool = False, fmt: SnapshotFormat = "json") -> bytes:
+        """Serializes ``snapshot_state`` to a compact JSON or msgpack blob."""
+        return self.snapshotter.dumps(delta=delta, fmt=fmt)
+
+    def restore(self, blob: bytes, fmt: SnapshotFormat = "json") -> None:
+        """Restores a blob produced by ``snapshot``."""
+        self.snapshotter.loads(blob, fmt=fmt)
+
+    def on_restore(self):
+        pass
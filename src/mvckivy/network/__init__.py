@@ -1,3 +1,21 @@
 from .url_request_requests import UrlRequestRequests
 from .restful_url_request_swagger_client import RestfulUrlRequestSwaggerClient
-from .websocket_client import WebsocketClient
+from .websocket_client import (
+    ConnectionClosed,
+    WebSocketError,
+    WebSocketStats,
+    WebsocketClient,
+)
+from .session_pool import SessionPool, SessionPoolConfig, SessionPoolStats, session_pool
+from .request_executor import ExecutorStats, Priority, RequestExecutor, request_executor
+from .async_client import (
+    AsyncHttpClient,
+    AsyncRequestError,
+    ResponseStatusError,
+    async_http_client,
+)
+from .stream_buffer import ChunkBuffer, ChunkBufferStats
+from .response_decoder import DecoderRegistry, response_decoders, summarize_result
+from .http_cache import HttpCache, HttpCacheStats
+from .singleflight import SingleFlight, SingleFlightStats, singleflight
+from .openapi import OpenApiSchema, SchemaValidationError
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterator
+
+import requests
+import trio
+
+from mvckivy import logger
+from mvckivy.network.session_pool import SessionPool, session_pool
+
+
+class AsyncRequestError(Exception):
+    """Transport error (connection, timeout, TLS...) of an async request."""
+
+
+class ResponseStatusError(AsyncRequestError):
+    """The server answered with a 4xx/5xx status."""
+
+    def __init__(self, response: requests.Response):
+        super().__init__(f"HTTP {response.status_code} for {response.url}")
+        self.response = response
+
+
+class AsyncHttpClient:
+    """
+    trio-native HTTP client on top of the shared keep-alive session pool.
+
+    Blocking ``requests`` calls run in worker threads bounded by ``max_concurrency``.
+    Requests obey trio cancellation: cancelling the enclosing cancel scope or
+    nursery (e.g. a screen's) returns control immediately and discards the
+    response; a cancelled stream closes its connection.
+
+        async with trio.open_nursery() as nursery:
+            vehicles = await client.get_json("/vehicles")
+            async with client.stream("/telemetry", jsonify=True) as chunks:
+                async for chunk in chunks:
+                    ...
+
+    Errors follow UrlRequest: transport errors raise ``AsyncRequestError``
+    (UrlRequest's on_error), 4xx/5xx raise ``ResponseStatusError`` (on_failure)
+    unless ``raise_for_status=False``.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "",
+        pool: SessionPool | None = None,
+        max_concurrency: int = 8,
+        timeout: float | None = 30.0,
+    ):
+        self.base_url = base_url
+        self.pool = pool or session_pool
+        self.timeout = timeout
+        self._limiter = trio.CapacityLimiter(max_concurrency)
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        raise_for_status: bool = True,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a request; ``kwargs`` are passed to ``requests.Session.request``
+        (params, json, data, headers, files, auth, timeout...).
+        """
+        response = await self._send(method, endpoint, stream=False, **kwargs)
+        if raise_for_status:
+            self._check_status(response)
+        return response
+
+    async def get(self, endpoint: str, **kwargs) -> requests.Response:
+        return await self.request("GET", endpoint, **kwargs)
+
+    async def post(self, endpoint: str, **kwargs) -> requests.Response:
+        return await self.request("POST", endpoint, **kwargs)
+
+    async def get_json(self, endpoint: str, **kwargs) -> Any:
+        response = await self.request("GET", endpoint, **kwargs)
+        return response.json()
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        *,
+        jsonify: bool = False,
+        **kwargs,
+    ) -> AsyncIterator[AsyncIterator[Any]]:
+        """
+        Open a streaming response and yield an async iterator of its lines
+        (decoded with ``json.loads`` if ``jsonify``). The connection is closed
+        when the block exits, including on cancellation.
+        """
+        response = await self._send(method, endpoint, stream=True, **kwargs)
+        try:
+            self._check_status(response)
+            yield self._iter_lines(response.iter_lines(), jsonify)
+        finally:
+            # Closing from here also unblocks a worker thread stuck in a read
+            response.close()
+
+    # ---------- Internals ----------
+
+    async def _send(
+        self, method: str, endpoint: str, *, stream: bool, **kwargs
+    ) -> requests.Response:
+        url = f"{self.base_url}{endpoint}"
+        session = self.pool.session_for(url)
+        kwargs.setdefault("timeout", self.timeout)
+
+        abandoned = threading.Event()
+
+        def send() -> requests.Response:
+            response = session.request(method, url, stream=stream, **kwargs)
+            if abandoned.is_set():
+                # the caller was cancelled: give the connection back to the pool
+                response.close()
+            return response
+
+        try:
+            return await trio.to_thread.run_sync(
+                send, abandon_on_cancel=True, limiter=self._limiter
+            )
+        except trio.Cancelled:
+            abandoned.set()
+            raise
+        except requests.RequestException as e:
+            logger.debug("AsyncHttpClient: %s %s failed: %s", method, url, e)
+            raise AsyncRequestError(str(e)) from e
+
+    async def _iter_lines(self, lines: Iterator[bytes], jsonify: bool):
+        sentinel = object()
+        while True:
+            try:
+                line = await trio.to_thread.run_sync(
+                    next, lines, sentinel, abandon_on_cancel=True
+                )
+            except requests.RequestException as e:
+                raise AsyncRequestError(str(e)) from e
+            if line is sentinel:
+                return
+            if not line:
+                continue  # keep-alive newlines
+            yield json.loads(line) if jsonify else line
+
+    @staticmethod
+    def _check_status(response: requests.Response) -> None:
+        if response.status_code >= 400:
+            response.close()
+            raise ResponseStatusError(response)
+
+
+async_http_client = AsyncHttpClient()
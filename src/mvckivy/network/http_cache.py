@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from mvckivy import logger
+from mvckivy.network.request_executor import (
+    Priority,
+    RequestExecutor,
+    request_executor,
+)
+
+
+_DIRECTIVE = re.compile(r'([\w-]+)(?:=("[^"]*"|[^,\s]*))?')
+# Heuristic freshness from Last-Modified (RFC 9111 4.2.2), capped at a day
+_HEURISTIC_FRACTION = 0.1
+_HEURISTIC_MAX = 24 * 3600
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """``"max-age=60, no-cache"`` -> ``{"max-age": "60", "no-cache": None}``."""
+    if not value:
+        return {}
+    return {
+        name.lower(): arg.strip('"') if arg else None
+        for name, arg in _DIRECTIVE.findall(value)
+    }
+
+
+def _seconds(directives: dict, name: str) -> int | None:
+    try:
+        return max(int(directives[name]), 0)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    url: str
+    status: int
+    headers: CaseInsensitiveDict
+    stored_at: float
+    vary: dict[str, str] = field(default_factory=dict)
+    size: int = 0
+
+    def __post_init__(self):
+        # header names are case-insensitive: proxies may lowercase them
+        self.headers = CaseInsensitiveDict(self.headers)
+
+    @property
+    def cache_control(self) -> dict[str, str | None]:
+        return parse_cache_control(self.headers.get("Cache-Control"))
+
+    def freshness_lifetime(self) -> float:
+        directives = self.cache_control
+        if "no-cache" in directives:
+            return 0
+        max_age = _seconds(directives, "max-age")
+        if max_age is not None:
+            return max_age
+
+        headers = self.headers
+        date = _http_date(headers.get("Date")) or self.stored_at
+        expires = _http_date(headers.get("Expires"))
+        if expires is not None:
+            return max(expires - date, 0)
+        last_modified = _http_date(headers.get("Last-Modified"))
+        if last_modified is not None:
+            return min((date - last_modified) * _HEURISTIC_FRACTION, _HEURISTIC_MAX)
+        return 0
+
+    def age(self, now: float) -> float:
+        try:
+            initial = int(self.headers.get("Age", 0))
+        except ValueError:
+            initial = 0
+        return initial + max(now - self.stored_at, 0)
+
+    def is_fresh(self, now: float) -> bool:
+        return self.age(now) < self.freshness_lifetime()
+
+    def may_serve_stale(self) -> bool:
+        """False if the response must be revalidated once stale (RFC 9111 4.2.4)."""
+        directives = self.cache_control
+        return "must-revalidate" not in directives and "no-cache" not in directives
+
+    def stale_window(self) -> float:
+        """Seconds past expiry the server allows serving it while revalidating."""
+        if not self.may_serve_stale():
+            return 0
+        return _seconds(self.cache_control, "stale-while-revalidate") or 0
+
+
+@dataclass(slots=True)
+class HttpCacheStats:
+    hits: int = 0
+    """Fresh responses served from disk without a request."""
+    revalidated: int = 0
+    """Stale responses confirmed by a 304."""
+    stale_served: int = 0
+    """Stale responses served while refreshing in the background."""
+    misses: int = 0
+    stored: int = 0
+    evicted: int = 0
+    entries: int = 0
+    size: int = 0
+
+
+class HttpCache:
+    """
+    Private HTTP cache of GET responses on disk (``MVCPathManager.cache_dir``).
+
+    Responses are stored when Cache-Control allows it (no ``no-store``, no
+    ``Vary: *``) and served while fresh (``max-age``, ``Expires`` or the
+    Last-Modified heuristic). Stale ones are revalidated with
+    ``If-None-Match``/``If-Modified-Since``; a 304 renews the stored copy.
+    Entries are evicted least recently used above ``max_size`` bytes.
+
+    With ``stale_while_revalidate`` a stale response is returned at once and
+    refreshed on the request executor with background priority; without it
+    only responses carrying the ``stale-while-revalidate=N`` directive are
+    served that way within N seconds. Responses with ``must-revalidate`` or
+    ``no-cache`` are never served stale.
+
+    Responses served from the cache have ``from_cache = True``.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_size: int = 50 * 1024 * 1024,
+        stale_while_revalidate: bool = False,
+        executor: RequestExecutor | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.stale_while_revalidate = stale_while_revalidate
+        self.executor = executor or request_executor
+        self._clock = clock
+
+        self._lock = threading.RLock()
+        self._index: OrderedDict[str, int] | None = None  # key -> size, LRU first
+        self._size = 0
+        self._refreshing: set[str] = set()
+        self._stats = HttpCacheStats()
+
+    def request(
+        self, session: requests.Session, method: str, url: str, **kwargs
+    ) -> requests.Response:
+        """``session.request`` going through the cache for GET requests."""
+        if method.upper() != "GET" or kwargs.get("stream"):
+            return session.request(method, url, **kwargs)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        request_directives = parse_cache_control(
+            CaseInsensitiveDict(headers).get("Cache-Control")
+        )
+        if "no-store" in request_directives:
+            return session.request(method, url, headers=headers, **kwargs)
+
+        key_url = (
+            requests.Request("GET", url, params=kwargs.get("params")).prepare().url
+        )
+        key = self._key(key_url)
+        sent_headers = CaseInsensitiveDict({**session.headers, **headers})
+        entry = self._load(key, sent_headers)
+
+        if entry is not None and "no-cache" not in request_directives:
+            now = self._clock()
+            response = None
+            if entry.is_fresh(now):
+                response = self._serve(key, entry, "hits")
+            else:
+                overdue = entry.age(now) - entry.freshness_lifetime()
+                if entry.may_serve_stale() and (
+                    self.stale_while_revalidate or overdue < entry.stale_window()
+                ):
+                    response = self._serve(key, entry, "stale_served")
+                    if response is not None:
+                        self._refresh_later(key, session, url, headers, kwargs)
+            if response is not None:
+                return response
+
+        return self._fetch(key, entry, session, url, headers, kwargs)
+
+    def stats(self) -> HttpCacheStats:
+        with self._lock:
+            self._ensure_index()
+            s = self._stats
+            return HttpCacheStats(
+                s.hits,
+                s.revalidated,
+                s.stale_served,
+                s.misses,
+                s.stored,
+                s.evicted,
+                len(self._index),
+                self._size,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._ensure_index()):
+                self._remove(key)
+
+    # ---------- Network ----------
+
+    def _fetch(
+        self,
+        key: str,
+        entry: CacheEntry | None,
+        session: requests.Session,
+        url: str,
+        headers: dict,
+        kwargs: dict,
+    ) -> requests.Response:
+        if entry is not None:
+            stored = entry.headers
+            if "ETag" in stored:
+                headers.setdefault("If-None-Match", stored["ETag"])
+            if "Last-Modified" in stored:
+                headers.setdefault("If-Modified-Since", stored["Last-Modified"])
+
+        response = session.request("GET", url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self._renew(key, entry, response)
+            cached = self._serve(key, entry, "revalidated")
+            if cached is not None:
+                return cached
+            # the body was evicted meanwhile: fetch it unconditionally
+            headers.pop("If-None-Match", None)
+            headers.pop("If-Modified-Since", None)
+            response = session.request("GET", url, headers=headers, **kwargs)
+
+        with self._lock:
+            self._stats.misses += 1
+        self._store(key, response, CaseInsensitiveDict({**session.headers, **headers}))
+        return response
+
+    def _refresh_later(self, key, session, url, headers, kwargs) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                entry = self._load(key, None)
+                self._fetch(key, entry, session, url, dict(headers), dict(kwargs))
+            except requests.RequestException as e:
+                logger.debug("HttpCache: background refresh of %s failed: %s", url, e)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self.executor.submit(refresh, urlsplit(url).netloc, Priority.BACKGROUND)
+
+    # ---------- Storage ----------
+
+    def _store(
+        self, key: str, response: requests.Response, sent_headers: CaseInsensitiveDict
+    ) -> None:
+        if response.status_code != 200:
+            return
+        directives = parse_cache_control(response.headers.get("Cache-Control"))
+        vary = response.headers.get("Vary", "")
+        if "no-store" in directives or vary.strip() == "*":
+            return
+
+        body = response.content
+        if len(body) > self.max_size:
+            return
+
+        entry = CacheEntry(
+            url=response.url,
+            status=response.status_code,
+            headers=response.headers,
+            stored_at=self._clock(),
+            vary={
+                name.strip().lower(): sent_headers.get(name.strip(), "")
+                for name in vary.split(",")
+                if name.strip()
+            },
+            size=len(body),
+        )
+        with self._lock:
+            self._ensure_index()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._write(self._body_path(key), body)
+            self._write_meta(key, entry)
+
+            self._size += entry.size - self._index.pop(key, 0)
+            self._index[key] = entry.size
+            self._stats.stored += 1
+            self._evict()
+
+    def _renew(self, key: str, entry: CacheEntry, response: requests.Response) -> None:
+        # a 304 carries updated freshness headers for the stored body;
+        # the case-insensitive mapping replaces "etag" with "ETag" in place
+        for name, value in response.headers.items():
+            if name.lower() not in ("content-length", "transfer-encoding"):
+                entry.headers[name] = value
+        entry.stored_at = self._clock()
+        with self._lock:
+            self._write_meta(key, entry)
+
+    def _load(
+        self, key: str, sent_headers: CaseInsensitiveDict | None
+    ) -> CacheEntry | None:
+        with self._lock:
+            if key not in self._ensure_index():
+                return None
+            try:
+                with open(self._meta_path(key), encoding="utf-8") as f:
+                    entry = CacheEntry(**json.load(f))
+            except (OSError, ValueError, TypeError):
+                self._remove(key)
+                return None
+
+        if sent_headers is not None:
+            for name, value in entry.vary.items():
+                if sent_headers.get(name, "") != value:
+                    return None
+        return entry
+
+    def _serve(
+        self, key: str, entry: CacheEntry, counter: str
+    ) -> requests.Response | None:
+        with self._lock:
+            try:
+                body = self._body_path(key).read_bytes()
+            except OSError:
+                self._remove(key)
+                return None
+            setattr(self._stats, counter, getattr(self._stats, counter) + 1)
+            self._touch(key)
+
+        response = requests.Response()
+        response.status_code = entry.status
+        response.reason = "OK"
+        response.url = entry.url
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.headers["Age"] = str(int(entry.age(self._clock())))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response._content_consumed = True
+        response.from_cache = True
+        return response
+
+    def _ensure_index(self) -> OrderedDict[str, int]:
+        """Load the LRU index from the directory on first use (under the lock)."""
+        if self._index is None:
+            found = []
+            if self.directory.is_dir():
+                for body in self.directory.glob("*.body"):
+                    try:
+                        st = body.stat()
+                    except OSError:
+                        continue
+                    if body.with_suffix(".json").exists():
+                        found.append((st.st_mtime, body.stem, st.st_size))
+            found.sort()
+            self._index = OrderedDict((key, size) for _, key, size in found)
+            self._size = sum(self._index.values())
+        return self._index
+
+    def _touch(self, key: str) -> None:
+        self._index.move_to_end(key)
+        try:
+            # the mtime keeps the LRU order across launches
+            os.utime(self._body_path(key))
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        while self._size > self.max_size and self._index:
+            self._remove(next(iter(self._index)))
+            self._stats.evicted += 1
+
+    def _remove(self, key: str) -> None:
+        self._size -= self._index.pop(key, 0)
+        for path in (self._body_path(key), self._meta_path(key)):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _write_meta(self, key: str, entry: CacheEntry) -> None:
+        meta = {
+            "url": entry.url,
+            "status": entry.status,
+            "headers": dict(entry.headers),
+            "stored_at": entry.stored_at,
+            "vary": entry.vary,
+            "size": entry.size,
+        }
+        self._write(self._meta_path(key), json.dumps(meta).encode("utf-8"))
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def _body_path(self, key: str) -> Path:
+        return self.directory / f"{key}.body"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
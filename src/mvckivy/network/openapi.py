@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import json
+import keyword
+import re
+import threading
+from dataclasses import field, make_dataclass
+from pathlib import Path
+from typing import Any, Callable, Literal
+
+from mvckivy import logger
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+DecodeMode = Literal["strict", "lenient"]
+Decoder = Callable[[Any, str], Any]
+
+_PRIMITIVES: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+}
+_HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+
+
+class SchemaValidationError(ValueError):
+    """A response does not match its OpenAPI schema (strict mode)."""
+
+    def __init__(self, path: str, message: str):
+        super().__init__(f"{path}: {message}")
+        self.path = path
+
+
+def _identifier(name: str) -> str:
+    ident = re.sub(r"\W", "_", name)
+    if not ident or ident[0].isdigit():
+        ident = f"_{ident}"
+    return f"{ident}_" if keyword.iskeyword(ident) else ident
+
+
+def _class_name(name: str) -> str:
+    return "".join(
+        part[:1].upper() + part[1:] for part in re.split(r"\W+", name) if part
+    )
+
+
+class OpenApiSchema:
+    """
+    Typed decoders derived from an OpenAPI 3 document.
+
+    Every object schema becomes a slotted dataclass (``model(name)``); JSON
+    responses are validated and converted once, in the request's worker thread,
+    into these compact objects instead of nested dicts:
+
+        api = OpenApiSchema.from_file(path_manager.proj_dir.join("openapi.json"))
+        vehicle = api.decode("Vehicle", payload)
+        vehicle.battery.voltage
+
+    In ``strict`` mode a missing required field, a wrong type or a value outside
+    the enum raises ``SchemaValidationError``. In ``lenient`` mode missing
+    fields are None, numbers and booleans sent as strings are converted and
+    other mismatches keep the raw value (logged at debug level).
+
+    Decoders are compiled on first use and cached; ``$ref`` cycles are allowed.
+    """
+
+    def __init__(self, document: dict, mode: DecodeMode = "strict"):
+        if mode not in ("strict", "lenient"):
+            raise ValueError(f"Unknown decode mode: {mode!r}")
+        self.document = document
+        self.mode = mode
+        self._components: dict = document.get("components", {}).get("schemas", {})
+        self._models: dict[str, type] = {}
+        # compiled decoders only: placeholders of schemas being compiled live in
+        # _compiling, visible to the compiling thread alone (under _lock)
+        self._decoders: dict[str, Decoder] = {}
+        self._compiling: dict[str, Decoder] = {}
+        self._responses: dict[tuple, Decoder | None] = {}
+        # requests decode in executor worker threads
+        self._lock = threading.RLock()
+        # lenient unions tell alternatives apart by strict validation
+        self._strict = OpenApiSchema(document) if mode == "lenient" else None
+        self._routes = [
+            (re.compile("^" + re.sub(r"\\{[^}]+\\}", "[^/]+", re.escape(p)) + "$"), p)
+            for p in document.get("paths", {})
+        ]
+
+    @classmethod
+    def from_file(cls, path, mode: DecodeMode = "strict") -> OpenApiSchema:
+        """Load a ``.json`` document, or ``.yaml``/``.yml`` if PyYAML is installed."""
+        path = Path(str(path))
+        text = path.read_text(encoding="utf-8")
+        if path.suffix in (".yaml", ".yml"):
+            if yaml is None:
+                raise ImportError("PyYAML is required to load YAML OpenAPI documents")
+            return cls(yaml.safe_load(text), mode)
+        return cls(json.loads(text), mode)
+
+    # ---------- Public API ----------
+
+    def model(self, name: str) -> type:
+        """Slotted dataclass of the component schema ``name``."""
+        self._component_decoder(name)
+        return self._models[name]
+
+    def decode(self, name: str, data: Any) -> Any:
+        """Decode ``data`` with the component schema ``name``."""
+        return self._component_decoder(name)(data, "$")
+
+    def operation_decoder(
+        self, operation_id: str, status: int = 200
+    ) -> Callable[[Any], Any] | None:
+        for path, item in self.document.get("paths", {}).items():
+            for method in _HTTP_METHODS:
+                op = item.get(method)
+                if op and op.get("operationId") == operation_id:
+                    return self.response_decoder(method, path, status)
+        return None
+
+    def response_decoder(
+        self, method: str, path: str, status: int = 200
+    ) -> Callable[[Any], Any] | None:
+        """
+        Decoder of the JSON response of ``method path`` (a concrete path such
+        as ``/vehicles/42`` matches ``/vehicles/{id}``), or None if undocumented.
+        """
+        key = (method.lower(), path, status)
+        if key not in self._responses:
+            with self._lock:
+                if key not in self._responses:
+                    self._responses[key] = self._build_response_decoder(*key)
+        decoder = self._responses[key]
+        if decoder is None:
+            return None
+        return lambda data: decoder(data, "$")
+
+    # ---------- Compilation ----------
+
+    def _build_response_decoder(
+        self, method: str, path: str, status: int
+    ) -> Decoder | None:
+        paths = self.document.get("paths", {})
+        template = path if path in paths else None
+        if template is None:
+            template = next((t for regex, t in self._routes if regex.match(path)), None)
+        op = paths.get(template, {}).get(method) if template else None
+        if not op:
+            return None
+
+        responses = op.get("responses", {})
+        response = (
+            responses.get(str(status))
+            or responses.get(f"{status // 100}XX")
+            or responses.get("default")
+        )
+        if response is None:
+            return None
+        response = self._resolve(response)
+        for content_type, media in response.get("content", {}).items():
+            if "json" in content_type and "schema" in media:
+                return self._compile(
+                    media["schema"], _class_name(op.get("operationId", "Response"))
+                )
+        return None
+
+    def _component_decoder(self, name: str) -> Decoder:
+        decoder = self._decoders.get(name)
+        if decoder is not None:
+            return decoder
+
+        with self._lock:
+            decoder = self._decoders.get(name) or self._compiling.get(name)
+            if decoder is not None:
+                return decoder
+            if name not in self._components:
+                raise KeyError(f"No schema '{name}' in components")
+
+            # placeholder first: a self-referencing schema resolves to it
+            def deferred(data, path):
+                return self._decoders[name](data, path)
+
+            self._compiling[name] = deferred
+            try:
+                decoder = self._compile(self._components[name], name)
+            finally:
+                del self._compiling[name]
+            self._decoders[name] = decoder
+            return decoder
+
+    def _resolve(self, node: dict) -> dict:
+        while "$ref" in node:
+            node = self._lookup(node["$ref"])
+        return node
+
+    def _lookup(self, ref: str) -> dict:
+        if not ref.startswith("#/"):
+            raise ValueError(f"Only local $ref are supported: {ref}")
+        node = self.document
+        for part in ref[2:].split("/"):
+            node = node[part.replace("~1", "/").replace("~0", "~")]
+        return node
+
+    def _compile(self, schema: dict, name: str) -> Decoder:
+        ref = schema.get("$ref")
+        if ref is not None:
+            prefix = "#/components/schemas/"
+            if ref.startswith(prefix):
+                return self._component_decoder(ref[len(prefix) :])
+            return self._compile(self._lookup(ref), name)
+
+        types = schema.get("type")
+        nullable = schema.get("nullable", False)
+        if isinstance(types, list):  # OpenAPI 3.1: ["string", "null"]
+            nullable = nullable or "null" in types
+            types = next((t for t in types if t != "null"), None)
+
+        if "allOf" in schema:
+            decoder = self._compile_object(self._merge_all_of(schema), name)
+        elif "oneOf" in schema:
+            decoder = self._compile_union(schema["oneOf"], name, exclusive=True)
+        elif "anyOf" in schema:
+            decoder = self._compile_union(schema["anyOf"], name, exclusive=False)
+        elif types == "object" or (types is None and "properties" in schema):
+            decoder = self._compile_object(schema, name)
+        elif types == "array":
+            decoder = self._compile_array(schema, name)
+        elif types in _PRIMITIVES:
+            decoder = self._compile_primitive(types, schema.get("enum"))
+        else:
+            decoder = _passthrough
+
+        if not nullable:
+            return decoder
+
+        def decode_nullable(data, path):
+            return None if data is None else decoder(data, path)
+
+        return decode_nullable
+
+    def _merge_all_of(self, schema: dict) -> dict:
+        merged = {"type": "object", "properties": {}, "required": []}
+        for part in schema["allOf"] + [
+            {k: v for k, v in schema.items() if k != "allOf"}
+        ]:
+            part = self._resolve(part)
+            if "allOf" in part:
+                part = self._merge_all_of(part)
+            merged["properties"].update(part.get("properties", {}))
+            merged["required"] += part.get("required", [])
+        return merged
+
+    def _compile_object(self, schema: dict, name: str) -> Decoder:
+        properties: dict = schema.get("properties", {})
+        additional = schema.get("additionalProperties")
+        if not properties and isinstance(additional, dict):
+            values = self._compile(additional, f"{name}Value")
+
+            def decode_map(data, path):
+                if not isinstance(data, dict):
+                    return self._mismatch(path, "expected an object", data)
+                return {k: values(v, f"{path}.{k}") for k, v in data.items()}
+
+            return decode_map
+
+        required = set(schema.get("required", ()))
+        class_name = _class_name(name) or "Model"
+        # (json key, attribute, decoder, required), required fields first
+        fields = sorted(
+            (
+                (
+                    key,
+                    _identifier(key),
+                    self._compile(sub, f"{class_name}_{key}"),
+                    key in required,
+                )
+                for key, sub in properties.items()
+            ),
+            key=lambda f: not f[3],
+        )
+        model = make_dataclass(
+            class_name,
+            [
+                (attr, Any) if req else (attr, Any, field(default=None))
+                for _, attr, _, req in fields
+            ],
+            slots=True,
+        )
+        model.__module__ = __name__
+        self._models.setdefault(name, model)
+        strict = self.mode == "strict"
+
+        def decode_object(data, path):
+            if not isinstance(data, dict):
+                return self._mismatch(path, "expected an object", data)
+            values = {}
+            for key, attr, decoder, req in fields:
+                if key in data:
+                    # null goes through the decoder too: only nullable fields accept it
+                    values[attr] = decoder(data[key], f"{path}.{key}")
+                elif req and strict:
+                    raise SchemaValidationError(path, f"missing required field '{key}'")
+                else:
+                    values[attr] = None
+            return model(**values)
+
+        return decode_object
+
+    def _compile_array(self, schema: dict, name: str) -> Decoder:
+        items = self._compile(schema.get("items", {}), f"{name}Item")
+
+        def decode_array(data, path):
+            if not isinstance(data, list):
+                return self._mismatch(path, "expected an array", data)
+            return [items(item, f"{path}[{i}]") for i, item in enumerate(data)]
+
+        return decode_array
+
+    def _compile_union(self, options: list, name: str, exclusive: bool) -> Decoder:
+        """
+        ``anyOf`` takes the first matching alternative. ``oneOf`` (``exclusive``)
+        checks them all: several matches are an error in strict mode and the
+        first one wins in lenient mode. In strict mode the probe's result is the
+        decoded value; a lenient probe builds the strict twin's models, so the
+        match is decoded again with the lenient decoder.
+        """
+        decoders = [
+            self._compile(option, f"{name}{i}") for i, option in enumerate(options)
+        ]
+        strict = self._strict is None
+        if strict:
+            probes = decoders
+        else:
+            probes = [
+                self._strict._compile(option, f"{name}{i}")
+                for i, option in enumerate(options)
+            ]
+
+        def decode_union(data, path):
+            match = None
+            for i, probe in enumerate(probes):
+                try:
+                    value = probe(data, path)
+                except SchemaValidationError:
+                    continue
+                if match is None:
+                    match = i, value
+                    if exclusive:
+                        continue
+                else:
+                    message = f"matches alternatives {match[0]} and {i} of oneOf"
+                    if strict:
+                        raise SchemaValidationError(path, message)
+                    logger.debug("OpenApiSchema: %s: %s", path, message)
+                break
+            if match is None:
+                return self._mismatch(path, "matches none of the alternatives", data)
+            i, value = match
+            return value if strict else decoders[i](data, path)
+
+        return decode_union
+
+    def _compile_primitive(self, type_name: str, enum: list | None) -> Decoder:
+        accepted = _PRIMITIVES[type_name]
+        strict = self.mode == "strict"
+
+        def decode_primitive(data, path):
+            # bool is an int subclass, but not a JSON integer
+            if not isinstance(data, accepted) or (
+                isinstance(data, bool) and type_name != "boolean"
+            ):
+                if strict:
+                    raise SchemaValidationError(
+                        path, f"expected {type_name}, got {data!r}"
+                    )
+                data = _coerce(type_name, data, path)
+            if enum is not None and data not in enum:
+                return self._mismatch(path, f"{data!r} not in {enum}", data)
+            return data
+
+        return decode_primitive
+
+    def _mismatch(self, path: str, message: str, data: Any) -> Any:
+        if self.mode == "strict":
+            raise SchemaValidationError(path, message)
+        logger.debug("OpenApiSchema: %s: %s", path, message)
+        return data
+
+
+def _passthrough(data, _path):
+    return data
+
+
+def _coerce(type_name: str, data: Any, path: str) -> Any:
+    try:
+        if type_name == "integer" and isinstance(data, (str, float)):
+            return int(data)
+        if type_name == "number" and isinstance(data, str):
+            return float(data)
+        if type_name == "boolean" and isinstance(data, str):
+            if data.lower() in ("true", "false"):
+                return data.lower() == "true"
+        if type_name == "string" and isinstance(data, (int, float)):
+            return str(data)
+    except ValueError:
+        pass
+    logger.debug("OpenApiSchema: %s: expected %s, got %r", path, type_name, data)
+    return data
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import bisect
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Callable
+from urllib.parse import urlsplit
+
+from kivy.network.urlrequest import g_requests
+
+from mvckivy import logger
+
+
+class Priority(IntEnum):
+    """Lower value runs first."""
+
+    USER = 0
+    BACKGROUND = 1
+
+
+@dataclass(slots=True, order=True)
+class _Job:
+    priority: int
+    seq: int
+    fn: Callable[[], None] = field(compare=False)
+    host: str = field(compare=False)
+    enqueued: float = field(compare=False)
+
+
+@dataclass(slots=True)
+class ExecutorStats:
+    workers: int = 0
+    running: int = 0
+    queued: int = 0
+    peak_queued: int = 0
+    completed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def avg_wait(self) -> float:
+        started = self.completed + self.running
+        return self.total_wait / started if started else 0.0
+
+
+class RequestExecutor:
+    """
+    Bounded pool of worker threads for UrlRequest jobs.
+
+    Jobs wait in a queue ordered by priority, then by submission. At most
+    ``max_workers`` threads run and at most ``per_host_limit`` jobs per host run
+    at once; a job whose host is saturated lets later jobs for other hosts go
+    first. Workers are started on demand and exit after ``idle_timeout`` seconds
+    without work.
+    """
+
+    def __init__(
+        self, max_workers: int = 8, per_host_limit: int = 4, idle_timeout: float = 30.0
+    ):
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.idle_timeout = idle_timeout
+
+        self._cond = threading.Condition()
+        self._queue: list[_Job] = []
+        self._host_running: dict[str, int] = {}
+        self._seq = itertools.count()
+        self._idle = 0
+        self._stats = ExecutorStats()
+
+    def submit(
+        self, fn: Callable[[], None], host: str = "", priority: int = Priority.USER
+    ) -> None:
+        job = _Job(int(priority), next(self._seq), fn, host, time.perf_counter())
+        with self._cond:
+            bisect.insort(self._queue, job)
+            stats = self._stats
+            stats.queued = len(self._queue)
+            stats.peak_queued = max(stats.peak_queued, stats.queued)
+
+            if self._idle:
+                self._cond.notify()
+            elif stats.workers < self.max_workers:
+                stats.workers += 1
+                threading.Thread(
+                    target=self._work, name="UrlRequestWorker", daemon=True
+                ).start()
+
+    def stats(self) -> ExecutorStats:
+        with self._cond:
+            s = self._stats
+            return ExecutorStats(
+                s.workers,
+                s.running,
+                s.queued,
+                s.peak_queued,
+                s.completed,
+                s.total_wait,
+                s.max_wait,
+            )
+
+    def reset_stats(self) -> None:
+        with self._cond:
+            s = self._stats
+            self._stats = ExecutorStats(s.workers, s.running, s.queued, s.queued)
+
+    def _take(self) -> _Job | None:
+        """Pop the first job whose host is below the limit (under the lock)."""
+        for i, job in enumerate(self._queue):
+            if self._host_running.get(job.host, 0) < self.per_host_limit:
+                del self._queue[i]
+                self._host_running[job.host] = self._host_running.get(job.host, 0) + 1
+
+                stats = self._stats
+                wait = time.perf_counter() - job.enqueued
+                stats.queued = len(self._queue)
+                stats.running += 1
+                stats.total_wait += wait
+                stats.max_wait = max(stats.max_wait, wait)
+                return job
+        return None
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                job = self._take()
+                while job is None:
+                    self._idle += 1
+                    notified = self._cond.wait(self.idle_timeout)
+                    self._idle -= 1
+                    job = self._take()
+                    if job is None and not notified:
+                        self._stats.workers -= 1
+                        return
+
+            try:
+                job.fn()
+            except Exception:
+                logger.exception("RequestExecutor: job for '%s' failed", job.host)
+            finally:
+                with self._cond:
+                    left = self._host_running[job.host] - 1
+                    if left:
+                        self._host_running[job.host] = left
+                    else:
+                        del self._host_running[job.host]
+                    self._stats.running -= 1
+                    self._stats.completed += 1
+                    # a job waiting for this host may run now
+                    if self._queue and self._idle:
+                        self._cond.notify()
+
+
+request_executor = RequestExecutor()
+
+
+class ExecutorRequestMixin:
+    """
+    Runs a UrlRequest on the shared ``executor`` instead of its own thread.
+
+    Streaming requests keep a dedicated thread: they hold it until the stream
+    ends and would starve the pool. Results are not polled: the worker marks the
+    request done and arms the Clock trigger; ``_dispatch_result`` releases the
+    request from ``g_requests`` once everything has been dispatched.
+
+    A pooled request is still a ``threading.Thread`` that is never started, so
+    ``is_alive()``, ``join()`` and ``wait()`` follow the worker instead of the
+    thread: the request is alive until its worker is done.
+    """
+
+    executor: RequestExecutor | None = request_executor
+    priority: int = Priority.USER
+    _own_thread: bool = False
+
+    def __init__(self, *args, **kwargs):
+        # created before UrlRequest.__init__ starts the request
+        self._worker_finished = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    @property
+    def _worker_done(self) -> bool:
+        return self._worker_finished.is_set()
+
+    @_worker_done.setter
+    def _worker_done(self, done: bool) -> None:
+        if done:
+            self._worker_finished.set()
+
+    def start(self):
+        if self.executor is None or self.is_streaming:
+            self._own_thread = True
+            return super().start()
+        self.executor.submit(self._run_pooled, urlsplit(self.url).netloc, self.priority)
+
+    def is_alive(self) -> bool:
+        if self._own_thread:
+            return super().is_alive()
+        return not self._worker_finished.is_set()
+
+    def join(self, timeout: float | None = None) -> None:
+        if self._own_thread:
+            return super().join(timeout)
+        self._worker_finished.wait(timeout)
+
+    def wait(self, delay: float = 0.5) -> None:
+        """
+        Dispatch results until the worker is done and its queue is drained.
+
+        Unlike ``UrlRequest.wait`` this also returns for cancelled requests and
+        for errors without a response (``resp_status`` stays ``None``).
+        """
+        while True:
+            self._dispatch_result(delay)
+            if self._worker_done and not self._queue:
+                return
+            time.sleep(delay)
+
+    def _run_pooled(self) -> None:
+        if self._cancel_event.is_set():
+            # cancelled while queued: do not hit the network
+            self._queue.appendleft(("killed", None, None))
+            self._finish_worker()
+            return
+        self.run()
+
+    def _finish_worker(self) -> None:
+        self._worker_done = True
+        self._trigger_result()
+
+    def _release_if_done(self) -> None:
+        if self._worker_done and not self._queue and self in g_requests:
+            g_requests.remove(self)
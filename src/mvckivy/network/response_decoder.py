@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import reprlib
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+from mvckivy import logger
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+Decoder = Callable[[bytes], Any]
+"""Turns a response body into an object; must be a module-level function to
+run in the process pool."""
+
+
+def decode_json(data: bytes) -> Any:
+    return json.loads(data)
+
+
+def decode_msgpack(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False)
+
+
+class DecoderRegistry:
+    """
+    Maps response content types to decoders.
+
+    Decoding runs in the request's worker thread, so only the decoded object
+    reaches the main thread. Bodies of at least ``process_threshold`` bytes are
+    decoded in a process pool instead: a large ``json.loads`` holds the GIL and
+    would still stall the UI thread while the worker runs.
+
+        response_decoders.register("application/x-protobuf", decode_mission)
+        response_decoders.process_threshold = 1 << 20
+    """
+
+    def __init__(
+        self, process_threshold: int | None = None, max_processes: int | None = 2
+    ):
+        self.process_threshold = process_threshold
+        self.max_processes = max_processes
+        self._decoders: dict[str, Decoder] = {}
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+        self.register("application/json", decode_json)
+        if msgpack is not None:
+            self.register("application/msgpack", decode_msgpack)
+            self.register("application/x-msgpack", decode_msgpack)
+
+    def register(self, content_type: str, decoder: Decoder) -> None:
+        self._decoders[content_type.lower()] = decoder
+
+    def unregister(self, content_type: str) -> None:
+        self._decoders.pop(content_type.lower(), None)
+
+    def decoder_for(self, content_type: str | None) -> Decoder | None:
+        if not content_type:
+            return None
+        mime = content_type.split(";")[0].strip().lower()
+        decoder = self._decoders.get(mime)
+        if decoder is None and mime.endswith("+json"):
+            # application/problem+json, application/vnd.api+json...
+            decoder = self._decoders.get("application/json")
+        return decoder
+
+    def decode(self, content_type: str | None, data: bytes) -> Any:
+        """Decode ``data``; raises ``LookupError`` for an unknown content type."""
+        decoder = self.decoder_for(content_type)
+        if decoder is None:
+            raise LookupError(f"No decoder for content type {content_type!r}")
+
+        threshold = self.process_threshold
+        if threshold is not None and len(data) >= threshold:
+            return self._process_pool().submit(decoder, data).result()
+        return decoder(data)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # fork is unsafe in the multi-threaded app process
+                self._pool = ProcessPoolExecutor(
+                    self.max_processes, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+
+response_decoders = DecoderRegistry()
+
+
+class DecodingRequestMixin:
+    """
+    Decodes UrlRequest responses in the worker thread (``decode=True``).
+
+    The body is decoded by the decoder registered for its Content-Type; other
+    content types, streaming responses and bodies that fail to decode are
+    handed over unchanged, as with Kivy's ``decode_result``. Unlike Kivy,
+    ``decode`` defaults to False: callbacks keep receiving the response object
+    unless decoding is requested.
+    """
+
+    decoders: DecoderRegistry = response_decoders
+
+    def __init__(self, *args, decode: bool = False, **kwargs):
+        super().__init__(*args, decode=decode, **kwargs)
+
+    def decode_result(self, result, resp):
+        if self.is_streaming or resp is None:
+            return result
+
+        content_type = resp.headers.get("Content-Type")
+        if self.decoders.decoder_for(content_type) is None:
+            return result
+
+        data = resp.content if result is resp else result
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        try:
+            return self.decoders.decode(content_type, data)
+        except Exception as e:
+            logger.warning(
+                "UrlRequest: cannot decode %s response of %s: %s",
+                content_type,
+                self.url,
+                e,
+            )
+            return result
+
+
+_summary_repr = reprlib.Repr()
+_summary_repr.maxlevel = 3
+_summary_repr.maxdict = 8
+_summary_repr.maxlist = 8
+_summary_repr.maxtuple = 8
+_summary_repr.maxstring = 120
+_summary_repr.maxother = 120
+
+
+def summarize_result(result: Any, max_length: int = 300) -> str:
+    """
+    Short description of a request result for logs: the size of bodies and
+    containers plus a truncated repr, never the whole payload.
+    """
+    if hasattr(result, "status_code") and hasattr(result, "headers"):
+        size = result.headers.get("Content-Length")
+        if size is None and getattr(result, "_content_consumed", False):
+            size = len(result.content or b"")
+        content_type = result.headers.get("Content-Type", "?")
+        return (
+            f"<Response {result.status_code} {content_type}, "
+            f"{_format_size(size)} from {result.url}>"
+        )
+
+    if isinstance(result, (bytes, bytearray, str)):
+        prefix = f"<{type(result).__name__}, {_format_size(len(result))}> "
+    elif isinstance(result, (dict, list, tuple, set)):
+        prefix = f"<{type(result).__name__}, {len(result)} items> "
+    else:
+        prefix = ""
+
+    text = prefix + _summary_repr.repr(result)
+    if len(text) > max_length:
+        text = text[: max_length - 3] + "..."
+    return text
+
+
+def _format_size(size) -> str:
+    if size is None:
+        return "unknown size"
+    size = int(size)
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024**2:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / 1024**2:.1f} MB"
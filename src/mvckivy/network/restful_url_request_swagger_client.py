@@ -1,18 +1,33 @@
-from time import sleep, time
 from kivy import Config, Logger
 from typing import Callable, Iterator, Optional
 import json
-import requests
-from kivy.network.urlrequest import g_requests
+from functools import partial
 from kivy.network.urlrequest import UrlRequestRequests as BaseUrlRequestRequests
 from kivy.weakmethod import WeakMethod
 
+from mvckivy.network.http_cache import HttpCache
+from mvckivy.network.openapi import OpenApiSchema
+from mvckivy.network.request_executor import ExecutorRequestMixin, Priority
+from mvckivy.network.response_decoder import DecodingRequestMixin
+from mvckivy.network.session_pool import SessionPool, session_pool
+from mvckivy.network.singleflight import SingleFlightRequestMixin
+from mvckivy.network.stream_buffer import ChunkMode, OverflowPolicy, StreamBufferMixin
+
 
 class ResultCodeException(Exception):
     pass
 
 
-class RestfulUrlRequestSwaggerClient(BaseUrlRequestRequests):
+class RestfulUrlRequestSwaggerClient(
+        SingleFlightRequestMixin,
+        ExecutorRequestMixin,
+        StreamBufferMixin,
+        DecodingRequestMixin,
+        BaseUrlRequestRequests,
+):
+    # Shared keep-alive sessions, one per host
+    session_pool: SessionPool = session_pool
+
     def __init__(
             self,
             base_url: str,
@@ -24,18 +39,39 @@ class RestfulUrlRequestSwaggerClient(BaseUrlRequestRequests):
             on_stream_chunk: Optional[Callable] = None,
             jsonify_stream_chunk: bool = False,
             chunk_polling_frequency_hz: Optional[int] = None,
+            priority: Priority = Priority.USER,
+            chunk_mode: ChunkMode = "batch",
+            max_buffered_chunks: int = 1024,
+            chunk_overflow: OverflowPolicy = "drop_oldest",
+            on_stream_batch: Optional[Callable] = None,
+            http_cache: Optional[HttpCache] = None,
+            dedupe: bool = True,
+            openapi_schema: Optional[OpenApiSchema] = None,
+            operation_id: Optional[str] = None,
             **kwargs
     ):
+        # Typed responses: JSON bodies are decoded into the schema's slotted
+        # dataclasses in the worker thread (strict or lenient per the schema)
+        self.endpoint = endpoint
+        self.openapi_schema = openapi_schema
+        self.operation_id = operation_id
+        self._http_method = None
+        if openapi_schema is not None:
+            kwargs.setdefault('decode', True)
+        self.priority = priority
+        self.http_cache = http_cache
+        self.dedupe = dedupe
         self.params = params if params is not None else dict()
         self._json = post_req_json if post_req_json is not None else dict()
         self.files = files if files is not None else dict()
-        self.is_streaming = is_streaming or bool(on_stream_chunk)
+        self.is_streaming = is_streaming or bool(on_stream_chunk or on_stream_batch)
         self.on_stream_chunk = WeakMethod(on_stream_chunk) if on_stream_chunk else None
         self.jsonify_stream_chunk = jsonify_stream_chunk
-        self.__current_chunk = dict()
         self.__avaliable_result_codes = ["success", "error", "progress", "streaming", "killed", "finished"]
         self.chunk_polling_frequency_hz = chunk_polling_frequency_hz
-        self.__last_timestamp: float = .0
+        self._init_stream_buffer(
+            chunk_mode, max_buffered_chunks, chunk_overflow, on_stream_batch
+        )
         super().__init__(
             url=f"{base_url}{endpoint}", **kwargs
         )
@@ -79,17 +115,9 @@ class RestfulUrlRequestSwaggerClient(BaseUrlRequestRequests):
             else:
                 q(('killed', None, None))
 
-        # using trigger can result in a missed on_success event
-        self._trigger_result()
-
-        # clean ourself when the queue is empty
-        while len(self._queue):
-            sleep(.1)
-            self._trigger_result()
-
-        # ok, authorize the GC to clean us.
-        if self in g_requests:
-            g_requests.remove(self)
+        # using trigger can result in a missed on_success event.
+        # _dispatch_result authorizes the GC to clean us once the queue is empty
+        self._finish_worker()
 
     def _fetch_url(self, url, body, headers, q):
         # Parse and fetch the current url
@@ -146,17 +174,7 @@ class RestfulUrlRequestSwaggerClient(BaseUrlRequestRequests):
         # return everything
         return result, resp
 
-    def _dispatch_chunk(self, q) -> None:
-        if self.chunk_polling_frequency_hz is not None and (round(time() - self.__last_timestamp, 3) < 1 / self.chunk_polling_frequency_hz):
-            return
-
-        q(('streaming', None, self.__current_chunk))
-        self._trigger_result()
-        self.__last_timestamp = time()
-
     def _stream_data(self, q, result) -> None:
-        self.__last_timestamp = time()
-
         try:
             telem_iter: Iterator = result.iter_lines()
         except Exception as ex:
@@ -167,13 +185,14 @@ class RestfulUrlRequestSwaggerClient(BaseUrlRequestRequests):
         while not self._cancel_event.is_set():
             try:
                 # Waits for the next chunk from a server
-                self.__current_chunk = next(telem_iter)
+                chunk = next(telem_iter)
             except StopIteration:
                 q(('finished', None, None))
                 self._trigger_result()
                 return
 
-            self._dispatch_chunk(q)
+            # Buffered, never dropped: delivered at most chunk_polling_frequency_hz
+            self._buffer_chunk(chunk)
 
         q(('killed', None, None))
         self._trigger_result()
@@ -184,11 +203,16 @@ class RestfulUrlRequestSwaggerClient(BaseUrlRequestRequests):
             try:
                 result, resp, data = self._queue.pop()
             except IndexError:
+                self._release_if_done()
                 return
 
             if result not in self.__avaliable_result_codes:
                 raise ResultCodeException(f'Current result code "{result}" not in {self.__avaliable_result_codes}')
 
+            if result in ('finished', 'killed', 'error'):
+                # deliver the chunks still buffered before the final result
+                self._flush_stream()
+
             if resp:
                 # Small workaround in order to prevent the situation mentioned
                 # in the comment below
@@ -271,14 +295,6 @@ class RestfulUrlRequestSwaggerClient(BaseUrlRequestRequests):
                     if func:
                         func(self, data[0], data[1])
 
-            elif result == 'streaming':
-                stream_chunk = json.loads(data) if self.jsonify_stream_chunk else data
-
-                if self.on_stream_chunk:
-                    func = self.on_stream_chunk()
-                    if func:
-                        func(self, stream_chunk)
-
             elif result == 'killed':
                 if self._debug:
                     Logger.debug('UrlRequest: Cancelled by user')
@@ -294,6 +310,33 @@ class RestfulUrlRequestSwaggerClient(BaseUrlRequestRequests):
                 if func:
                     func(self)
 
+    def decode_result(self, result, resp):
+        result = super().decode_result(result, resp)
+        if (
+            self.openapi_schema is None
+            or resp is None
+            or not isinstance(result, (dict, list))
+        ):
+            return result
+
+        status = self.get_status_code(resp)
+        if self.operation_id is not None:
+            decoder = self.openapi_schema.operation_decoder(self.operation_id, status)
+        else:
+            method = self._http_method or (self._method or 'get').lower()
+            decoder = self.openapi_schema.response_decoder(
+                method, self.endpoint.split('?', 1)[0], status
+            )
+        # SchemaValidationError (strict mode) is dispatched to on_error
+        return result if decoder is None else decoder(result)
+
+    def _flight_key(self):
+        key = super()._flight_key()
+        if key is None or self.openapi_schema is None:
+            return key
+        # callers decoding with another schema must not share the result
+        return f'{key}|{id(self.openapi_schema)}|{self.operation_id}'
+
     def get_response(self, resp):
         return resp
 
@@ -304,7 +347,7 @@ class RestfulUrlRequestSwaggerClient(BaseUrlRequestRequests):
         url = self._requested_url
         auth = self._auth
 
-        req = requests
+        req = self.session_pool.session_for(url)
         kwargs = dict()
 
         body = body if body is not None else json.dumps(self._json)
@@ -315,7 +358,10 @@ class RestfulUrlRequestSwaggerClient(BaseUrlRequestRequests):
         else:
             method = self._method.lower()
 
+        self._http_method = method
         req_call = getattr(req, method)
+        if self.http_cache is not None:
+            req_call = partial(self.http_cache.request, req, method)
 
         if auth:
             kwargs["auth"] = auth
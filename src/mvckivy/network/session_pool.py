@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+
+@dataclass(slots=True)
+class SessionPoolConfig:
+    """
+    Settings of the per-host sessions.
+
+    ``max_connections`` bounds the kept-alive connections per host;
+    ``max_retries``/``backoff_factor``/``retry_statuses`` configure urllib3 retries
+    (idempotent methods only); ``default_headers`` are sent with every request.
+    """
+
+    max_connections: int = 10
+    keep_alive: bool = True
+    max_retries: int = 2
+    backoff_factor: float = 0.3
+    retry_statuses: tuple[int, ...] = (502, 503, 504)
+    default_headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class SessionPoolStats:
+    hosts: int = 0
+    requests: int = 0
+    new_connections: int = 0
+
+    @property
+    def reused_connections(self) -> int:
+        return max(self.requests - self.new_connections, 0)
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of requests sent over an already open connection."""
+        return self.reused_connections / self.requests if self.requests else 0.0
+
+
+class _CountingHTTPConnection(HTTPConnection):
+    def connect(self):
+        super().connect()
+        self.mvc_pool.num_connects += 1
+
+
+class _CountingHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        super().connect()
+        self.mvc_pool.num_connects += 1
+
+
+class _CountingPoolMixin:
+    """
+    Counts real TCP connects: urllib3's num_connections only counts connection
+    objects, which silently reconnect when the server closed the socket.
+    """
+
+    num_connects = 0
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn.mvc_pool = self
+        return conn
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+
+class _CountingAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+class SessionPool:
+    """
+    Thread-safe pool of ``requests.Session`` objects, one per scheme://host:port.
+
+    Sessions keep connections alive between requests, so polling the same REST
+    endpoints does not repeat TCP/TLS handshakes. All UrlRequest instances share
+    the module-level ``session_pool``.
+    """
+
+    def __init__(self, config: SessionPoolConfig | None = None):
+        self.config = config or SessionPoolConfig()
+        self._sessions: dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def session_for(self, url: str) -> requests.Session:
+        key = self._host_key(url)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._sessions[key] = self._create_session()
+            return session
+
+    def configure(self, config: SessionPoolConfig) -> None:
+        """Replace the settings; existing sessions are closed and recreated lazily."""
+        with self._lock:
+            self.config = config
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+    def stats(self) -> SessionPoolStats:
+        with self._lock:
+            sessions = list(self._sessions.values())
+
+        stats = SessionPoolStats(hosts=len(sessions))
+        for session in sessions:
+            # the same adapter is mounted for http:// and https://
+            adapters = {id(a): a for a in session.adapters.values()}
+            for adapter in adapters.values():
+                for pool in self._connection_pools(adapter):
+                    stats.requests += pool.num_requests
+                    stats.new_connections += getattr(pool, "num_connects", 0)
+        return stats
+
+    def _create_session(self) -> requests.Session:
+        config = self.config
+        session = requests.Session()
+        session.headers.update(config.default_headers)
+        if not config.keep_alive:
+            session.headers["Connection"] = "close"
+
+        retry = Retry(
+            total=config.max_retries,
+            backoff_factor=config.backoff_factor,
+            status_forcelist=config.retry_statuses,
+            raise_on_status=False,
+        )
+        # One host per session: a single urllib3 pool of max_connections
+        adapter = _CountingAdapter(
+            pool_connections=1,
+            pool_maxsize=config.max_connections,
+            max_retries=retry,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @staticmethod
+    def _connection_pools(adapter) -> list:
+        pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+        if pools is None:
+            return []
+        with pools.lock:
+            return [pools[key] for key in pools.keys()]
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+session_pool = SessionPool()
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class SingleFlightStats:
+    in_flight: int = 0
+    started: int = 0
+    """Underlying calls made."""
+    joined: int = 0
+    """Requests served by a call another request had already started."""
+
+
+@dataclass(slots=True, eq=False)
+class _Flight:
+    key: str
+    runner: Any
+    callers: list = field(default_factory=list)
+    history: list = field(default_factory=list)
+
+
+class _FanoutQueue(deque):
+    """Result queue of the running request; copies every result to the callers."""
+
+    def __init__(self, group: SingleFlight, flight: _Flight):
+        super().__init__()
+        self._group = group
+        self._flight = flight
+
+    def appendleft(self, item) -> None:
+        self._group._publish(self._flight, item)
+
+
+class SingleFlight:
+    """
+    Registry of in-flight requests shared by identical callers.
+
+    The first request for a key runs the call; identical requests made while it
+    is in flight join it and receive a copy of every result (they do not start
+    a thread). Results are replayed to late joiners, so each caller gets the
+    usual callbacks in order. Cancelling detaches only that caller: the call is
+    aborted when the last one leaves.
+
+    Joined callers receive the same result objects: callbacks must not mutate
+    them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self._stats = SingleFlightStats()
+
+    def join(self, key: str, request) -> bool:
+        """Attach ``request`` to the flight of ``key``; True if it must run it."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight(key, request)
+                request._flight = flight
+                flight.callers.append(request)
+                request._queue = _FanoutQueue(self, flight)
+                self._stats.started += 1
+                return True
+
+            request._flight = flight
+            flight.callers.append(request)
+            self._stats.joined += 1
+            for item in flight.history:
+                request._queue.appendleft(item)
+            if flight.history:
+                request._trigger_result()
+            return False
+
+    def leave(self, request) -> None:
+        """Cancel ``request``; abort the call if no caller is left."""
+        flight: _Flight = request._flight
+        with self._lock:
+            if request not in flight.callers:
+                return  # already finished or cancelled
+            flight.callers.remove(request)
+            abort = not flight.callers
+            if abort and self._flights.get(flight.key) is flight:
+                # an identical request made from now on starts a new call
+                del self._flights[flight.key]
+
+            # the caller stops receiving results and gets on_cancel
+            deque.appendleft(request._queue, ("killed", None, None))
+            if request is not flight.runner:
+                request._worker_done = True
+        request._trigger_result()
+
+        if abort:
+            flight.runner._cancel_event.set()
+
+    def finish(self, flight: _Flight) -> None:
+        """Called by the runner once all its results were published."""
+        with self._lock:
+            if self._flights.get(flight.key) is flight:
+                del self._flights[flight.key]
+            followers = [r for r in flight.callers if r is not flight.runner]
+            flight.callers.clear()
+
+        for request in followers:
+            request._worker_done = True
+            request._trigger_result()
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            s = self._stats
+            return SingleFlightStats(len(self._flights), s.started, s.joined)
+
+    def _publish(self, flight: _Flight, item) -> None:
+        with self._lock:
+            flight.history.append(item)
+            for request in flight.callers:
+                if request is flight.runner:
+                    # the runner triggers its own dispatch
+                    deque.appendleft(request._queue, item)
+                else:
+                    request._queue.appendleft(item)
+                    request._trigger_result()
+
+
+singleflight = SingleFlight()
+
+
+class SingleFlightRequestMixin:
+    """
+    Deduplicates identical in-flight GET/HEAD UrlRequests (see ``SingleFlight``).
+
+    Requests are identical when method, URL, params, headers, auth and decoding
+    match. Streaming and file downloads are never shared; ``dedupe=False``
+    opts a request out.
+    """
+
+    singleflight: SingleFlight | None = singleflight
+    dedupe: bool = True
+    _flight: _Flight | None = None
+
+    def start(self):
+        key = self._flight_key()
+        if key is None or self.singleflight.join(key, self):
+            super().start()
+
+    def cancel(self):
+        if self._flight is None:
+            return super().cancel()
+        self.singleflight.leave(self)
+
+    def _finish_worker(self) -> None:
+        if self._flight is not None:
+            self.singleflight.finish(self._flight)
+        super()._finish_worker()
+
+    def _flight_key(self) -> str | None:
+        if (
+            self.singleflight is None
+            or not self.dedupe
+            or self.is_streaming
+            or self.file_path is not None
+        ):
+            return None
+        method = (self._method or "").upper()
+        if method not in ("GET", "HEAD"):
+            return None
+        return json.dumps(
+            [
+                method,
+                self.url,
+                self.params,
+                self.req_headers,
+                self._user_agent,
+                self._cookies,
+                self._auth,
+                self.decode,
+            ],
+            sort_keys=True,
+            default=repr,
+        )
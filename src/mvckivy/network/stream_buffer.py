@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Literal, Optional
+
+from kivy.clock import Clock
+from kivy.weakmethod import WeakMethod
+
+from mvckivy import logger
+
+
+ChunkMode = Literal["batch", "latest"]
+OverflowPolicy = Literal["drop_oldest", "block"]
+
+
+@dataclass(slots=True)
+class ChunkBufferStats:
+    received: int = 0
+    delivered: int = 0
+    coalesced: int = 0
+    """Chunks replaced by a newer one in ``latest`` mode."""
+    overflowed: int = 0
+    """Chunks dropped because the ``batch`` buffer was full."""
+    blocked: int = 0
+    """Times the reader waited for the UI in ``block`` mode."""
+
+
+class ChunkBuffer:
+    """
+    Thread-safe buffer between a streaming reader thread and the UI.
+
+    ``batch`` keeps every chunk until the next drain (up to ``maxlen``); on
+    overflow it either drops the oldest chunk (``drop_oldest``) or blocks the
+    reader until the UI drains (``block``, backpressure down to the socket).
+    ``latest`` keeps only the newest chunk.
+    """
+
+    def __init__(
+        self,
+        mode: ChunkMode = "batch",
+        maxlen: int = 1024,
+        overflow: OverflowPolicy = "drop_oldest",
+    ):
+        if mode not in ("batch", "latest"):
+            raise ValueError(f"Unknown chunk mode: {mode!r}")
+        if overflow not in ("drop_oldest", "block"):
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+
+        self.mode = mode
+        self.overflow = overflow
+        self.maxlen = 1 if mode == "latest" else maxlen
+        self._chunks: deque = deque()
+        self._cond = threading.Condition()
+        self._stats = ChunkBufferStats()
+
+    def put(self, chunk: Any, cancel_event: threading.Event | None = None) -> bool:
+        """Buffer a chunk; False if the reader was cancelled while blocked."""
+        with self._cond:
+            stats = self._stats
+            stats.received += 1
+            chunks = self._chunks
+
+            if len(chunks) >= self.maxlen:
+                if self.mode == "latest":
+                    stats.coalesced += 1
+                    chunks.clear()
+                elif self.overflow == "drop_oldest":
+                    stats.overflowed += 1
+                    chunks.popleft()
+                else:
+                    stats.blocked += 1
+                    while len(chunks) >= self.maxlen:
+                        if cancel_event is not None and cancel_event.is_set():
+                            return False
+                        self._cond.wait(0.1)
+
+            chunks.append(chunk)
+            return True
+
+    def drain(self) -> list:
+        with self._cond:
+            chunks = list(self._chunks)
+            self._chunks.clear()
+            self._stats.delivered += len(chunks)
+            self._cond.notify_all()
+            return chunks
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._chunks)
+
+    def stats(self) -> ChunkBufferStats:
+        with self._cond:
+            s = self._stats
+            return ChunkBufferStats(
+                s.received, s.delivered, s.coalesced, s.overflowed, s.blocked
+            )
+
+
+class StreamBufferMixin:
+    """
+    Lossless chunk delivery for streaming UrlRequests.
+
+    The reader thread decodes chunks (``jsonify_stream_chunk``), puts them into
+    a ``ChunkBuffer`` and arms a Clock trigger whose timeout is
+    ``1 / chunk_polling_frequency_hz``: while it is pending, further chunks
+    accumulate instead of being dropped, and the trigger delivers them on the
+    main thread as one batch (``on_stream_batch``) or chunk by chunk
+    (``on_stream_chunk``).
+    """
+
+    chunk_buffer: ChunkBuffer
+
+    def _init_stream_buffer(
+        self,
+        chunk_mode: ChunkMode,
+        max_buffered_chunks: int,
+        chunk_overflow: OverflowPolicy,
+        on_stream_batch: Optional[Callable],
+    ) -> None:
+        self.chunk_buffer = ChunkBuffer(chunk_mode, max_buffered_chunks, chunk_overflow)
+        self.on_stream_batch = WeakMethod(on_stream_batch) if on_stream_batch else None
+        hz = self.chunk_polling_frequency_hz
+        self._trigger_stream = Clock.create_trigger(
+            self._flush_stream, 1 / hz if hz else 0
+        )
+
+    def _buffer_chunk(self, chunk) -> None:
+        if self.jsonify_stream_chunk:
+            # decoded here, in the reader thread, not on the main thread
+            try:
+                chunk = json.loads(chunk)
+            except ValueError as e:
+                logger.warning("UrlRequest: skipped undecodable stream chunk: %s", e)
+                return
+        if self.chunk_buffer.put(chunk, self._cancel_event):
+            self._trigger_stream()
+
+    def _flush_stream(self, *_) -> None:
+        chunks = self.chunk_buffer.drain()
+        if not chunks:
+            return
+
+        if self.on_stream_batch:
+            func = self.on_stream_batch()
+            if func:
+                func(self, chunks)
+
+        if self.on_stream_chunk:
+            func = self.on_stream_chunk()
+            if func:
+                for chunk in chunks:
+                    func(self, chunk)
@@ -1,20 +1,37 @@
-from time import sleep, time
 from kivy import Config
 from typing import Callable, Iterator, Optional
 import json
-import requests
-from kivy.network.urlrequest import g_requests
+from functools import partial
 from kivy.network.urlrequest import UrlRequestRequests as BaseUrlRequestRequests
 from kivy.weakmethod import WeakMethod
 
 from mvckivy import logger
+from mvckivy.network.http_cache import HttpCache
+from mvckivy.network.request_executor import ExecutorRequestMixin, Priority
+from mvckivy.network.response_decoder import DecodingRequestMixin
+from mvckivy.network.session_pool import SessionPool, session_pool
+from mvckivy.network.singleflight import SingleFlightRequestMixin
+from mvckivy.network.stream_buffer import (
+    ChunkMode,
+    OverflowPolicy,
+    StreamBufferMixin,
+)
 
 
 class ResultCodeException(Exception):
     pass
 
 
-class UrlRequestRequests(BaseUrlRequestRequests):
+class UrlRequestRequests(
+    SingleFlightRequestMixin,
+    ExecutorRequestMixin,
+    StreamBufferMixin,
+    DecodingRequestMixin,
+    BaseUrlRequestRequests,
+):
+    # Shared keep-alive sessions, one per host
+    session_pool: SessionPool = session_pool
+
     def __init__(
         self,
         base_url: str,
@@ -26,15 +43,24 @@ class UrlRequestRequests(BaseUrlRequestRequests):
         on_stream_chunk: Optional[Callable] = None,
         jsonify_stream_chunk: bool = False,
         chunk_polling_frequency_hz: Optional[int] = None,
+        priority: Priority = Priority.USER,
+        chunk_mode: ChunkMode = "batch",
+        max_buffered_chunks: int = 1024,
+        chunk_overflow: OverflowPolicy = "drop_oldest",
+        on_stream_batch: Optional[Callable] = None,
+        http_cache: Optional[HttpCache] = None,
+        dedupe: bool = True,
         **kwargs,
     ):
+        self.priority = priority
+        self.http_cache = http_cache
+        self.dedupe = dedupe
         self.params = params if params is not None else dict()
         self._json = post_req_json if post_req_json is not None else dict()
         self.files = files if files is not None else dict()
-        self.is_streaming = is_streaming or bool(on_stream_chunk)
+        self.is_streaming = is_streaming or bool(on_stream_chunk or on_stream_batch)
         self.on_stream_chunk = WeakMethod(on_stream_chunk) if on_stream_chunk else None
         self.jsonify_stream_chunk = jsonify_stream_chunk
-        self.__current_chunk = dict()
         self.__available_result_codes = [
             "success",
             "error",
@@ -44,7 +70,9 @@ class UrlRequestRequests(BaseUrlRequestRequests):
             "finished",
         ]
         self.chunk_polling_frequency_hz = chunk_polling_frequency_hz
-        self.__last_timestamp: float = 0.0
+        self._init_stream_buffer(
+            chunk_mode, max_buffered_chunks, chunk_overflow, on_stream_batch
+        )
         super().__init__(url=f"{base_url}{endpoint}", **kwargs)
 
     def run(self):
@@ -83,17 +111,9 @@ class UrlRequestRequests(BaseUrlRequestRequests):
             else:
                 q(("killed", None, None))
 
-        # using trigger can result in a missed on_success event
-        self._trigger_result()
-
-        # clean ourself when the queue is empty
-        while len(self._queue):
-            sleep(0.1)
-            self._trigger_result()
-
-        # ok, authorize the GC to clean us.
-        if self in g_requests:
-            g_requests.remove(self)
+        # using trigger can result in a missed on_success event.
+        # _dispatch_result authorizes the GC to clean us once the queue is empty
+        self._finish_worker()
 
     def _fetch_url(self, url, body, headers, q):
         # Parse and fetch the current url
@@ -146,20 +166,7 @@ class UrlRequestRequests(BaseUrlRequestRequests):
         # return everything
         return result, resp
 
-    def _dispatch_chunk(self, q) -> None:
-        if self.chunk_polling_frequency_hz is not None and (
-            round(time() - self.__last_timestamp, 3)
-            < 1 / self.chunk_polling_frequency_hz
-        ):
-            return
-
-        q(("streaming", None, self.__current_chunk))
-        self._trigger_result()
-        self.__last_timestamp = time()
-
     def _stream_data(self, q, result) -> None:
-        self.__last_timestamp = time()
-
         try:
             telem_iter: Iterator = result.iter_lines()
         except Exception as ex:
@@ -170,13 +177,14 @@ class UrlRequestRequests(BaseUrlRequestRequests):
         while not self._cancel_event.is_set():
             try:
                 # Waits for the next chunk from a server
-                self.__current_chunk = next(telem_iter)
+                chunk = next(telem_iter)
             except StopIteration:
                 q(("finished", None, None))
                 self._trigger_result()
                 return
 
-            self._dispatch_chunk(q)
+            # Buffered, never dropped: delivered at most chunk_polling_frequency_hz
+            self._buffer_chunk(chunk)
 
         q(("killed", None, None))
         self._trigger_result()
@@ -187,6 +195,7 @@ class UrlRequestRequests(BaseUrlRequestRequests):
             try:
                 result, resp, data = self._queue.pop()
             except IndexError:
+                self._release_if_done()
                 return
 
             if result not in self.__available_result_codes:
@@ -194,6 +203,10 @@ class UrlRequestRequests(BaseUrlRequestRequests):
                     f'Current result code "{result}" not in {self.__available_result_codes}'
                 )
 
+            if result in ("finished", "killed", "error"):
+                # deliver the chunks still buffered before the final result
+                self._flush_stream()
+
             if resp:
                 # Small workaround in order to prevent the situation mentioned
                 # in the comment below
@@ -277,14 +290,6 @@ class UrlRequestRequests(BaseUrlRequestRequests):
                     if func:
                         func(self, data[0], data[1])
 
-            elif result == "streaming":
-                stream_chunk = json.loads(data) if self.jsonify_stream_chunk else data
-
-                if self.on_stream_chunk:
-                    func = self.on_stream_chunk()
-                    if func:
-                        func(self, stream_chunk)
-
             elif result == "killed":
                 if self._debug:
                     logger.debug("UrlRequest: Cancelled by user")
@@ -310,7 +315,7 @@ class UrlRequestRequests(BaseUrlRequestRequests):
         url = self._requested_url
         auth = self._auth
 
-        req = requests
+        req = self.session_pool.session_for(url)
         kwargs = dict()
 
         body = body if body is not None else json.dumps(self._json)
@@ -322,6 +327,8 @@ class UrlRequestRequests(BaseUrlRequestRequests):
             method = self._method.lower()
 
         req_call = getattr(req, method)
+        if self.http_cache is not None:
+            req_call = partial(self.http_cache.request, req, method)
 
         if auth:
             kwargs["auth"] = auth
@@ -1,2 +1,631 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import random
+import ssl
+import struct
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Callable, Iterator, Literal, Optional
+from urllib.parse import urlsplit
+
+import trio
+from kivy.clock import Clock
+from kivy.weakmethod import WeakMethod
+
+from mvckivy import logger
+from mvckivy.network.stream_buffer import ChunkBuffer, ChunkMode
+
+
+_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_MAX_HANDSHAKE = 64 * 1024
+
+Message = str | bytes
+ClientState = Literal["idle", "connecting", "open", "reconnecting", "closed"]
+SendOverflow = Literal["drop_oldest", "drop_newest"]
+
+
+class WebSocketError(Exception):
+    """Handshake or protocol error."""
+
+
+class ConnectionClosed(WebSocketError):
+    def __init__(self, code: int, reason: str = ""):
+        super().__init__(f"WebSocket closed ({code}) {reason}".rstrip())
+        self.code = code
+        self.reason = reason
+
+
+class Opcode(IntEnum):
+    CONTINUATION = 0x0
+    TEXT = 0x1
+    BINARY = 0x2
+    CLOSE = 0x8
+    PING = 0x9
+    PONG = 0xA
+
+
+def accept_key(key: str) -> str:
+    """Sec-WebSocket-Accept value for a Sec-WebSocket-Key (RFC 6455 4.2.2)."""
+    return base64.b64encode(hashlib.sha1(key.encode("ascii") + _GUID).digest()).decode()
+
+
+def _apply_mask(data: bytes, key: bytes) -> bytes:
+    if not data:
+        return b""
+    # one big-int XOR instead of a Python loop over the bytes
+    mask = (key * (len(data) // 4 + 1))[: len(data)]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(mask, "big")).to_bytes(
+        len(data), "big"
+    )
+
+
+def encode_frame(opcode: int, payload: bytes, *, mask: bool, fin: bool = True) -> bytes:
+    """Frame ``payload``; clients must mask their frames, servers must not."""
+    head = bytearray([(0x80 if fin else 0) | opcode])
+    mask_bit = 0x80 if mask else 0
+    size = len(payload)
+    if size < 126:
+        head.append(mask_bit | size)
+    elif size < 1 << 16:
+        head.append(mask_bit | 126)
+        head += struct.pack("!H", size)
+    else:
+        head.append(mask_bit | 127)
+        head += struct.pack("!Q", size)
+
+    if not mask:
+        return bytes(head) + payload
+    key = os.urandom(4)
+    return bytes(head) + key + _apply_mask(payload, key)
+
+
+class FrameParser:
+    """Incremental parser of the frames of a byte stream."""
+
+    def __init__(self, max_frame_size: int):
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> None:
+        self._buffer += data
+
+    def frames(self) -> Iterator[tuple[bool, int, bytes]]:
+        """Yield ``(fin, opcode, payload)`` for every complete frame buffered."""
+        buf = self._buffer
+        while len(buf) >= 2:
+            b0, b1 = buf[0], buf[1]
+            if b0 & 0x70:
+                raise WebSocketError("Reserved bits set without an extension")
+            size = b1 & 0x7F
+            pos = 2
+            if size == 126:
+                if len(buf) < 4:
+                    return
+                size = struct.unpack_from("!H", buf, 2)[0]
+                pos = 4
+            elif size == 127:
+                if len(buf) < 10:
+                    return
+                size = struct.unpack_from("!Q", buf, 2)[0]
+                pos = 10
+            if size > self.max_frame_size:
+                raise WebSocketError(f"Frame of {size} bytes exceeds the limit")
+
+            key = None
+            if b1 & 0x80:
+                if len(buf) < pos + 4:
+                    return
+                key = bytes(buf[pos : pos + 4])
+                pos += 4
+            if len(buf) < pos + size:
+                return
+
+            payload = bytes(buf[pos : pos + size])
+            del buf[: pos + size]
+            if key is not None:
+                payload = _apply_mask(payload, key)
+            yield bool(b0 & 0x80), b0 & 0x0F, payload
+
+
+class WebSocketConnection:
+    """
+    Open WebSocket over a trio stream.
+
+    Handles fragmentation and control frames: pings are answered, pongs are
+    reported to ``on_pong`` and a close frame is echoed before
+    ``ConnectionClosed`` is raised from ``receive``.
+    """
+
+    def __init__(
+        self,
+        stream: trio.abc.Stream,
+        *,
+        client: bool = True,
+        max_message_size: int = 16 * 1024 * 1024,
+    ):
+        self.stream = stream
+        self.max_message_size = max_message_size
+        self.on_pong: Callable[[bytes], None] | None = None
+        self.closed: ConnectionClosed | None = None
+        self._mask = client
+        self._parser = FrameParser(max_message_size)
+        self._frames: deque[tuple[bool, int, bytes]] = deque()
+        self._send_lock = trio.Lock()
+
+    async def send(self, message: Message) -> None:
+        if isinstance(message, str):
+            await self._send_frame(Opcode.TEXT, message.encode("utf-8"))
+        else:
+            await self._send_frame(Opcode.BINARY, bytes(message))
+
+    async def ping(self, payload: bytes = b"") -> None:
+        await self._send_frame(Opcode.PING, payload)
+
+    async def receive(self) -> Message:
+        """Next complete message: ``str`` for text frames, ``bytes`` for binary."""
+        fragments: list[bytes] = []
+        size = 0
+        message_opcode = None
+        while True:
+            fin, opcode, payload = await self._next_frame()
+
+            if opcode == Opcode.PING:
+                await self._send_frame(Opcode.PONG, payload)
+                continue
+            if opcode == Opcode.PONG:
+                if self.on_pong is not None:
+                    self.on_pong(payload)
+                continue
+            if opcode == Opcode.CLOSE:
+                await self._on_close_frame(payload)
+
+            if opcode == Opcode.CONTINUATION:
+                if message_opcode is None:
+                    raise WebSocketError("Continuation frame without a message")
+            elif opcode in (Opcode.TEXT, Opcode.BINARY):
+                if message_opcode is not None:
+                    raise WebSocketError("New message inside a fragmented one")
+                message_opcode = opcode
+            else:
+                raise WebSocketError(f"Unknown opcode {opcode:#x}")
+
+            size += len(payload)
+            if size > self.max_message_size:
+                raise WebSocketError(f"Message exceeds {self.max_message_size} bytes")
+            fragments.append(payload)
+
+            if fin:
+                data = b"".join(fragments)
+                if message_opcode == Opcode.TEXT:
+                    try:
+                        return data.decode("utf-8")
+                    except UnicodeDecodeError as e:
+                        raise WebSocketError("Invalid UTF-8 in a text message") from e
+                return data
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        """Send a close frame (once) and close the stream."""
+        if self.closed is None:
+            self.closed = ConnectionClosed(code, reason)
+            payload = struct.pack("!H", code) + reason.encode("utf-8")
+            try:
+                async with self._send_lock:
+                    await self.stream.send_all(
+                        encode_frame(Opcode.CLOSE, payload, mask=self._mask)
+                    )
+            except (trio.BrokenResourceError, trio.ClosedResourceError, OSError):
+                pass
+        await self.stream.aclose()
+
+    def feed(self, data: bytes) -> None:
+        """Bytes read past the handshake."""
+        self._parser.feed(data)
+
+    async def _send_frame(self, opcode: int, payload: bytes) -> None:
+        if self.closed is not None:
+            raise self.closed
+        frame = encode_frame(opcode, payload, mask=self._mask)
+        async with self._send_lock:
+            await self.stream.send_all(frame)
+
+    async def _next_frame(self) -> tuple[bool, int, bytes]:
+        while not self._frames:
+            self._frames.extend(self._parser.frames())
+            if self._frames:
+                break
+            data = await self.stream.receive_some(65536)
+            if not data:
+                self.closed = ConnectionClosed(1006, "connection lost")
+                raise self.closed
+            self._parser.feed(data)
+        return self._frames.popleft()
+
+    async def _on_close_frame(self, payload: bytes) -> None:
+        code, reason = 1005, ""
+        if len(payload) >= 2:
+            code = struct.unpack("!H", payload[:2])[0]
+            reason = payload[2:].decode("utf-8", "replace")
+        if self.closed is None:
+            await self.close(code, reason)
+        self.closed = ConnectionClosed(code, reason)
+        raise self.closed
+
+
+async def read_http_head(stream: trio.abc.Stream) -> tuple[list[str], bytes]:
+    """Read an HTTP head; return its lines and the bytes received after it."""
+    data = bytearray()
+    while b"\r\n\r\n" not in data:
+        chunk = await stream.receive_some(4096)
+        if not chunk:
+            raise WebSocketError("Connection closed during the handshake")
+        data += chunk
+        if len(data) > _MAX_HANDSHAKE:
+            raise WebSocketError("Handshake too large")
+    head, _, rest = bytes(data).partition(b"\r\n\r\n")
+    return head.decode("latin-1").split("\r\n"), rest
+
+
+def parse_headers(lines: list[str]) -> dict[str, str]:
+    headers = {}
+    for line in lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return headers
+
+
+async def connect(
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+    max_message_size: int = 16 * 1024 * 1024,
+    ssl_context: ssl.SSLContext | None = None,
+) -> WebSocketConnection:
+    """Open a ``ws://`` or ``wss://`` connection and perform the handshake."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("ws", "wss"):
+        raise WebSocketError(f"Unsupported WebSocket URL: {url}")
+    secure = parts.scheme == "wss"
+    host = parts.hostname
+    port = parts.port or (443 if secure else 80)
+
+    stream: trio.abc.Stream = await trio.open_tcp_stream(host, port)
+    try:
+        if secure:
+            stream = trio.SSLStream(
+                stream,
+                ssl_context or ssl.create_default_context(),
+                server_hostname=host,
+            )
+            await stream.do_handshake()
+
+        key = base64.b64encode(os.urandom(16)).decode()
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        request = [
+            f"GET {target} HTTP/1.1",
+            f"Host: {parts.netloc}",
+            "Upgrade: websocket",
+            "Connection: Upgrade",
+            f"Sec-WebSocket-Key: {key}",
+            "Sec-WebSocket-Version: 13",
+            *(f"{name}: {value}" for name, value in (headers or {}).items()),
+        ]
+        await stream.send_all(("\r\n".join(request) + "\r\n\r\n").encode("latin-1"))
+
+        lines, rest = await read_http_head(stream)
+        status = lines[0].split(" ", 2)
+        if len(status) < 2 or status[1] != "101":
+            raise WebSocketError(f"Handshake rejected: {lines[0]}")
+        if parse_headers(lines[1:]).get("sec-websocket-accept") != accept_key(key):
+            raise WebSocketError("Invalid Sec-WebSocket-Accept")
+    except BaseException:
+        await trio.aclose_forcefully(stream)
+        raise
+
+    connection = WebSocketConnection(
+        stream, client=True, max_message_size=max_message_size
+    )
+    connection.feed(rest)
+    return connection
+
+
+@dataclass(slots=True)
+class WebSocketStats:
+    connects: int = 0
+    received: int = 0
+    sent: int = 0
+    dropped_sends: int = 0
+    """Outgoing messages dropped because the send queue was full."""
+    dropped_messages: int = 0
+    """Incoming messages dropped or coalesced before reaching the UI."""
+    last_rtt: float | None = None
+    """Round trip of the last heartbeat, in seconds."""
+
+
+_DISCONNECT_ERRORS = (
+    WebSocketError,
+    OSError,
+    trio.BrokenResourceError,
+    trio.ClosedResourceError,
+    trio.TooSlowError,
+)
+
+
 class WebsocketClient:
-    pass
+    """
+    trio WebSocket client living in the app nursery.
+
+    ``run`` connects and keeps the connection alive: it reconnects with
+    exponential backoff and jitter after any failure, and a heartbeat ping
+    without a pong within ``heartbeat_timeout`` drops a dead connection.
+
+        client = WebsocketClient(
+            "ws://gs.local/telemetry", on_batch=self.on_telemetry, jsonify=True
+        )
+        app.nursery.start_soon(client.run)
+        client.send({"subscribe": "vehicle/1"})
+
+    Received messages are buffered and delivered on the Kivy clock at most once
+    per frame (or ``dispatch_hz`` times per second) to ``on_batch`` and then
+    ``on_message``; ``dispatch_mode="latest"`` keeps only the newest message.
+    Outgoing messages wait in a bounded queue, including while disconnected.
+    ``send`` is not thread-safe: call it from the app thread. Callbacks are
+    weakly referenced, like UrlRequest's.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        on_message: Optional[Callable] = None,
+        on_batch: Optional[Callable] = None,
+        on_connect: Optional[Callable] = None,
+        on_disconnect: Optional[Callable] = None,
+        jsonify: bool = False,
+        headers: dict[str, str] | None = None,
+        dispatch_mode: ChunkMode = "batch",
+        dispatch_hz: float | None = None,
+        max_buffered_messages: int = 1024,
+        max_send_queue: int = 256,
+        send_overflow: SendOverflow = "drop_oldest",
+        reconnect: bool = True,
+        backoff_initial: float = 0.5,
+        backoff_max: float = 30.0,
+        backoff_factor: float = 2.0,
+        backoff_jitter: float = 0.2,
+        heartbeat_interval: float | None = 20.0,
+        heartbeat_timeout: float = 10.0,
+        connect_timeout: float = 10.0,
+        max_message_size: int = 16 * 1024 * 1024,
+        ssl_context: ssl.SSLContext | None = None,
+    ):
+        if send_overflow not in ("drop_oldest", "drop_newest"):
+            raise ValueError(f"Unknown send overflow policy: {send_overflow!r}")
+
+        self.url = url
+        self.headers = headers
+        self.jsonify = jsonify
+        self.max_send_queue = max_send_queue
+        self.send_overflow = send_overflow
+        self.reconnect = reconnect
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.backoff_factor = backoff_factor
+        self.backoff_jitter = backoff_jitter
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.connect_timeout = connect_timeout
+        self.max_message_size = max_message_size
+        self.ssl_context = ssl_context
+
+        self.on_message = WeakMethod(on_message) if on_message else None
+        self.on_batch = WeakMethod(on_batch) if on_batch else None
+        self.on_connect = WeakMethod(on_connect) if on_connect else None
+        self.on_disconnect = WeakMethod(on_disconnect) if on_disconnect else None
+
+        self.state: ClientState = "idle"
+        self._inbox = ChunkBuffer(dispatch_mode, max_buffered_messages)
+        self._trigger_dispatch = Clock.create_trigger(
+            self._dispatch_messages, 1 / dispatch_hz if dispatch_hz else 0
+        )
+        self._send_queue: deque[Message] = deque()
+        self._send_ready = trio.Event()
+        self._send_space = trio.Event()
+        self._connection: WebSocketConnection | None = None
+        self._cancel_scope: trio.CancelScope | None = None
+        self._closing = False
+        self._pong: trio.Event | None = None
+        self._stats = WebSocketStats()
+
+    @property
+    def connected(self) -> bool:
+        return self.state == "open"
+
+    async def run(self) -> None:
+        """Connect and reconnect until ``close`` or cancellation."""
+        attempt = 0
+        # _closing is not reset: a close() made before the task started wins
+        with trio.CancelScope() as self._cancel_scope:
+            while not self._closing:
+                self.state = "connecting" if attempt == 0 else "reconnecting"
+                try:
+                    with trio.fail_after(self.connect_timeout):
+                        connection = await connect(
+                            self.url,
+                            headers=self.headers,
+                            max_message_size=self.max_message_size,
+                            ssl_context=self.ssl_context,
+                        )
+                except _DISCONNECT_ERRORS as e:
+                    logger.debug(
+                        "WebsocketClient: cannot connect to %s: %s", self.url, e
+                    )
+                else:
+                    attempt = 0
+                    reason = await self._serve(connection)
+                    logger.debug(
+                        "WebsocketClient: %s disconnected: %s", self.url, reason
+                    )
+
+                if self._closing or not self.reconnect:
+                    break
+                await trio.sleep(self._backoff(attempt))
+                attempt += 1
+        self.state = "closed"
+
+    def send(self, message: Any) -> bool:
+        """
+        Queue a message: ``str`` goes as text, ``bytes`` as binary, anything
+        else as JSON text. False if it was dropped because the queue is full.
+        """
+        if not isinstance(message, (str, bytes)):
+            message = json.dumps(message)
+        queue = self._send_queue
+        if len(queue) >= self.max_send_queue:
+            self._stats.dropped_sends += 1
+            if self.send_overflow == "drop_newest":
+                return False
+            queue.popleft()
+        queue.append(message)
+        self._send_ready.set()
+        return True
+
+    async def send_async(self, message: Any) -> None:
+        """Queue a message, waiting for room instead of dropping."""
+        while len(self._send_queue) >= self.max_send_queue:
+            # one event per wait round, shared by every waiter: _write sets it
+            if self._send_space.is_set():
+                self._send_space = trio.Event()
+            await self._send_space.wait()
+        self.send(message)
+
+    def close(self) -> None:
+        """Stop reconnecting and close the connection with a close frame."""
+        self._closing = True
+        if self._cancel_scope is not None:
+            self._cancel_scope.cancel()
+
+    def stats(self) -> WebSocketStats:
+        s = self._stats
+        inbox = self._inbox.stats()
+        return WebSocketStats(
+            s.connects,
+            s.received,
+            s.sent,
+            s.dropped_sends,
+            inbox.overflowed + inbox.coalesced,
+            s.last_rtt,
+        )
+
+    # ---------- Connection ----------
+
+    async def _serve(self, connection: WebSocketConnection) -> BaseException | None:
+        self._connection = connection
+        connection.on_pong = self._on_pong
+        self.state = "open"
+        self._stats.connects += 1
+        self._callback(self.on_connect)
+
+        reason: BaseException | None = None
+        try:
+            async with trio.open_nursery() as nursery:
+
+                async def guard(task):
+                    nonlocal reason
+                    try:
+                        await task(connection)
+                    except _DISCONNECT_ERRORS as e:
+                        reason = reason or e
+                    nursery.cancel_scope.cancel()
+
+                nursery.start_soon(guard, self._read)
+                nursery.start_soon(guard, self._write)
+                if self.heartbeat_interval:
+                    nursery.start_soon(guard, self._heartbeat)
+        finally:
+            self._connection = None
+            with trio.CancelScope(shield=True), trio.move_on_after(1):
+                await connection.close(1000)
+            self._callback(self.on_disconnect, reason)
+        return reason
+
+    async def _read(self, connection: WebSocketConnection) -> None:
+        while True:
+            message = await connection.receive()
+            self._stats.received += 1
+            if self.jsonify and isinstance(message, str):
+                try:
+                    message = json.loads(message)
+                except ValueError as e:
+                    logger.warning(
+                        "WebsocketClient: skipped undecodable message: %s", e
+                    )
+                    continue
+            self._inbox.put(message)
+            self._trigger_dispatch()
+
+    async def _write(self, connection: WebSocketConnection) -> None:
+        queue = self._send_queue
+        while True:
+            while not queue:
+                self._send_ready = trio.Event()
+                await self._send_ready.wait()
+            message = queue.popleft()
+            self._send_space.set()
+            try:
+                await connection.send(message)
+            except BaseException:
+                # not sent: it goes out first after reconnecting
+                queue.appendleft(message)
+                raise
+            self._stats.sent += 1
+
+    async def _heartbeat(self, connection: WebSocketConnection) -> None:
+        while True:
+            await trio.sleep(self.heartbeat_interval)
+            self._pong = trio.Event()
+            sent_at = trio.current_time()
+            await connection.ping(b"mvckivy")
+            with trio.move_on_after(self.heartbeat_timeout):
+                await self._pong.wait()
+                self._stats.last_rtt = trio.current_time() - sent_at
+                continue
+            raise WebSocketError("Heartbeat timeout")
+
+    def _on_pong(self, _payload: bytes) -> None:
+        if self._pong is not None:
+            self._pong.set()
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(
+            self.backoff_initial * self.backoff_factor**attempt, self.backoff_max
+        )
+        return delay * random.uniform(1 - self.backoff_jitter, 1 + self.backoff_jitter)
+
+    # ---------- Dispatch ----------
+
+    def _dispatch_messages(self, *_) -> None:
+        messages = self._inbox.drain()
+        if not messages:
+            return
+        if self.on_batch:
+            func = self.on_batch()
+            if func:
+                func(self, messages)
+        if self.on_message:
+            func = self.on_message()
+            if func:
+                for message in messages:
+                    func(self, message)
+
+    def _callback(self, ref: WeakMethod | None, *args) -> None:
+        func = ref() if ref else None
+        if func:
+            try:
+                func(self, *args)
+            except Exception:
+                logger.exception("WebsocketClient: callback failed")
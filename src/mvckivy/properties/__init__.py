@@ -1,3 +1,7 @@
 from .extended_dict_property import ExtendedDictProperty
 from .extended_list_property import ExtendedListProperty
+from .extended_indexed_list_property import ExtendedIndexedListProperty
+from .extended_array_property import ExtendedArrayProperty
+from .model_struct import ModelStruct, ExtendedModelStructProperty
+from .profiler import PropertyProfiler, property_profiler
 from .extended_config_parser_property import ConfigParserList, ConfigParserBool, ExtendedConfigParserProperty, ConfigParserDict
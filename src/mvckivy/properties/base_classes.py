@@ -1,28 +1,24 @@
 from __future__ import annotations
 
 import weakref
+from contextlib import contextmanager
 from copy import deepcopy
 
 from kivy.properties import AliasProperty
-from typing import Callable, Any, Type
+from typing import Callable, Any, Iterator, Self, Type
 
 from kivy.event import EventDispatcher
 
+from mvckivy.properties.profiler import owner_name, property_profiler
 
-def dispatch_on_result(func: Callable):
-    def wrapper(self: ObservableStruct, *args):
-        res = func(self, *args)
-        self.last_op = (func.__name__, args)
 
-        if not self._enable_on_change_only:
-            self.dispatcher.dispatch(f"on_{self.last_op[0]}", self, self.last_op[1])
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None), frozenset)
 
-        self.dispatcher.dispatch("on_change", self._parent_prop, self, self.last_op)
-
-        if self._dispatch_on_change_to_prop:
-            for name, observer in self._parent_prop.bound_observers.items():
-                self._parent_prop.dispatch(observer)
 
+def dispatch_on_result(func: Callable):
+    def wrapper(self: ObservableStruct, *args):
+        res = func(self, *args)
+        self._dispatch_op(func.__name__, args)
         return res
 
     return wrapper
@@ -32,6 +28,7 @@ class ObservableStructDispatcher(EventDispatcher):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.register_event_type("on_change")
+        self.register_event_type("on_batch")
 
     def on_change(
         self,
@@ -41,8 +38,25 @@ class ObservableStructDispatcher(EventDispatcher):
     ):
         pass
 
+    def on_batch(self, *largs):
+        pass
+
 
 class ObservableStruct:
+    # Слотов нет: list/dict-наследники не совместимы с непустыми слотами базы.
+    # Слотовые структуры (ModelStruct) объявляют эти атрибуты у себя.
+    __slots__ = ()
+    _struct_attrs = (
+        "last_op",
+        "dispatcher",
+        "_parent_prop",
+        "_dispatch_on_change_to_prop",
+        "_enable_on_change_only",
+        "_owner_name",
+        "_batch_ops",
+        "_batch_depth",
+    )
+
     def __init__(
         self,
         parent_prop: ExtendedStructProperty,
@@ -58,6 +72,90 @@ class ObservableStruct:
         self._parent_prop = parent_prop
         self._dispatch_on_change_to_prop = dispatch_on_change_to_prop
         self._enable_on_change_only = enable_on_change_only
+        # класс экземпляра-владельца: подклассы делят одно свойство
+        self._owner_name = ""
+        self._batch_ops: list[tuple[str, tuple[Any, ...]]] | None = None
+        self._batch_depth = 0
+
+    @contextmanager
+    def batch(self) -> Iterator[Self]:
+        """
+        Транзакция над структурой.
+
+        Операции внутри копятся и по выходу уходят одним оповещением
+        ("batch", ((op, args), ...)). При исключении структура, умеющая снимки
+        (_batch_snapshot), откатывается к состоянию до транзакции без оповещения.
+        Вложенные batch() входят во внешнюю транзакцию.
+        """
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+            return
+
+        snapshot = self._batch_snapshot()
+        self._batch_ops = []
+        self._batch_depth = 1
+        try:
+            yield self
+        except BaseException:
+            ops, self._batch_ops, self._batch_depth = self._batch_ops, None, 0
+            if ops and snapshot is not None:
+                self._batch_restore(snapshot)
+            raise
+
+        ops, self._batch_ops, self._batch_depth = self._batch_ops, None, 0
+        if ops:
+            self._dispatch_op("batch", tuple(ops))
+
+    def _batch_snapshot(self) -> Any:
+        """Снимок для отката транзакции; None — откат не поддерживается."""
+        return None
+
+    def _batch_restore(self, snapshot: Any) -> None:
+        raise NotImplementedError()
+
+    def _dispatch_op(self, op: str, args: tuple[Any, ...]) -> None:
+        """Оповестить подписчиков об операции op: on_<op>, on_change и само свойство."""
+        if self._batch_ops is not None:
+            self._batch_ops.append((op, args))
+            return
+
+        profiling = property_profiler.enabled
+        if profiling:
+            start = property_profiler.clock()
+
+        self.last_op = (op, args)
+
+        if not self._enable_on_change_only:
+            self.dispatcher.dispatch(f"on_{self.last_op[0]}", self, self.last_op[1])
+
+        self.dispatcher.dispatch("on_change", self._parent_prop, self, self.last_op)
+
+        if self._dispatch_on_change_to_prop:
+            for name, observer in self._parent_prop.bound_observers.items():
+                self._parent_prop.dispatch(observer)
+
+        if profiling:
+            property_profiler.record(
+                self._owner_name,
+                self._parent_prop.name,
+                "struct",
+                property_profiler.clock() - start,
+                self._count_observers(op),
+            )
+
+    def _count_observers(self, op: str) -> int:
+        prop = self._parent_prop
+        count = len(self.dispatcher.get_property_observers("on_change"))
+        if not self._enable_on_change_only:
+            count += len(self.dispatcher.get_property_observers(f"on_{op}"))
+        if self._dispatch_on_change_to_prop:
+            for observer in prop.bound_observers.values():
+                count += len(observer.get_property_observers(prop.name))
+        return count
 
 
 class ObserversCollectorMixin:
@@ -96,16 +194,22 @@ class ExtendedStructProperty(ObserversCollectorMixin, AliasProperty):
             return self
 
         if inst not in self._values:
-            self._values[inst] = self._struct_cls(
-                self,
-                self._dispatch_on_change_to_prop,
-                self._enable_on_change_only,
-                self._dispatcher,
-                deepcopy(self._default),
-            )
+            self._values[inst] = self._new_struct(inst, deepcopy(self._default))
 
         return self._values[inst]
 
+    def _new_struct(self, inst, *args, **kwargs) -> ObservableStruct:
+        struct = self._struct_cls(
+            self,
+            self._dispatch_on_change_to_prop,
+            self._enable_on_change_only,
+            self._dispatcher,
+            *args,
+            **kwargs,
+        )
+        struct._owner_name = owner_name(type(inst))
+        return struct
+
     def _getter(self, inst):
         return self._get_or_create(inst)
 
@@ -115,12 +219,6 @@ class ExtendedStructProperty(ObserversCollectorMixin, AliasProperty):
         if value is cur:
             return False
 
-        self._values[inst] = self._struct_cls(
-            self,
-            self._dispatch_on_change_to_prop,
-            self._enable_on_change_only,
-            self._dispatcher,
-            value,
-        )
+        self._values[inst] = self._new_struct(inst, value)
 
         return True
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from collections import deque
+from contextlib import contextmanager
 from functools import partial
-from typing import Any, Sequence
+from typing import Any, Iterator, Sequence
+import logging
+import threading
 import weakref
 
 from kivy.clock import Clock
@@ -9,6 +13,25 @@ from kivy.event import EventDispatcher
 from kivy.properties import AliasProperty
 from kivy.weakproxy import WeakProxy
 
+from mvckivy.properties.profiler import owner_name, property_profiler
+
+
+logger = logging.getLogger("mvckivy")
+
+# владелец -> {алиас: причина}; пересчёты, отложенные batch() на этом объекте
+_BATCH_PENDING_KEY = "__ap_batch_pending"
+
+
+class _BatchState(threading.local):
+    """Состояние batch() своего потока: глубина и очередь владельцев с пересчётами."""
+
+    def __init__(self):
+        self.depth = 0
+        self.owners: deque[Any] = deque()
+
+
+_batch_state = _BatchState()
+
 
 class ExtendedAliasProperty(AliasProperty):
     """
@@ -23,6 +46,10 @@ class ExtendedAliasProperty(AliasProperty):
     Семантика watch_before_use:
       True  — связать зависимости заранее (eager) при создании хранилища (link_eagerly).
       False — лениво связывать при первом взаимодействии (get/set/bind).
+
+    Внутри ExtendedAliasProperty.batch() пересчёт откладывается: каждый алиас
+    пересчитывается один раз на выходе, уже по согласованному состоянию.
+    Отложенные пересчёты хранятся на самих владельцах, глубина — на поток.
     """
 
     # ---------- Конструктор и публичный API (в порядке вызова) ----------
@@ -89,6 +116,65 @@ class ExtendedAliasProperty(AliasProperty):
         setattr(obj, self._linked_key, False)
         setattr(obj, self._cause_key, None)
 
+    @staticmethod
+    @contextmanager
+    def batch() -> Iterator[None]:
+        """Отложить пересчёт всех ExtendedAliasProperty потока до выхода из блока."""
+        state = _batch_state
+        state.depth += 1
+        try:
+            yield
+        finally:
+            try:
+                if state.depth == 1:
+                    ExtendedAliasProperty._flush_batch(state)
+            finally:
+                state.depth -= 1
+
+    @staticmethod
+    def _flush_batch(state: _BatchState) -> None:
+        """
+        Разобрать очередь владельцев циклом. Глубина ещё не сброшена, поэтому
+        пересчёты, вызванные пересчётами, встают в ту же очередь, а не в стек.
+        Упавший пересчёт не отменяет остальные: первая ошибка — после разбора.
+        """
+        error: Exception | None = None
+        owners = state.owners
+        while owners:
+            owner = ExtendedAliasProperty._deref(owners.popleft())
+            if owner is None:
+                continue
+            pending = getattr(owner, _BATCH_PENDING_KEY, None) or {}
+            setattr(owner, _BATCH_PENDING_KEY, None)
+            for prop, label in pending.items():
+                try:
+                    prop._recompute(owner, label)
+                except Exception as ex:
+                    if error is None:
+                        error = ex
+                    else:
+                        logger.exception(
+                            "ExtendedAliasProperty: batch recompute failed"
+                        )
+        if error is not None:
+            raise error
+
+    def trigger_change(self, obj: EventDispatcher, value: Any):
+        """Задиспатчить новое значение алиаса; под профайлером — с замером."""
+        if not property_profiler.enabled:
+            return super().trigger_change(obj, value)
+
+        start = property_profiler.clock()
+        res = super().trigger_change(obj, value)
+        property_profiler.record(
+            owner_name(type(obj)),
+            self.name,
+            "alias",
+            property_profiler.clock() - start,
+            len(obj.get_property_observers(self.name)),
+        )
+        return res
+
     # ---------- Интеграция с жизненным циклом Kivy.Property ----------
 
     def link_eagerly(self, obj: EventDispatcher):
@@ -223,11 +309,11 @@ class ExtendedAliasProperty(AliasProperty):
                     owner = self._deref(owner_ref)
                     if owner is None:
                         return
-                    setattr(owner, self._cause_key, ".".join(segs[: _idx + 1]))
                     if should_rebind_node(inst, _seg):
                         self._make_chain_relink(owner, path)
-                    new_val = self._user_getter(owner, self)
-                    super(ExtendedAliasProperty, self).trigger_change(owner, new_val)
+                    self._schedule_recompute(
+                        owner, owner_ref, ".".join(segs[: _idx + 1])
+                    )
 
                 fbind_and_track(disp, seg, on_node_change)
                 try:
@@ -257,9 +343,27 @@ class ExtendedAliasProperty(AliasProperty):
         owner = self._deref(owner_ref)
         if owner is None:
             return
+        self._schedule_recompute(owner, owner_ref, label)
+
+    def _schedule_recompute(
+        self, owner: EventDispatcher, owner_ref, label: str
+    ) -> None:
+        """Пересчитать сейчас или, внутри batch(), один раз на выходе из него."""
+        state = _batch_state
+        if not state.depth:
+            self._recompute(owner, label)
+            return
+        pending = getattr(owner, _BATCH_PENDING_KEY, None)
+        if pending is None:
+            pending = {}
+            setattr(owner, _BATCH_PENDING_KEY, pending)
+            state.owners.append(owner_ref)
+        pending[self] = label
+
+    def _recompute(self, owner: EventDispatcher, label: str) -> None:
         setattr(owner, self._cause_key, label)
         new_val = self._user_getter(owner, self)
-        super(ExtendedAliasProperty, self).trigger_change(owner, new_val)
+        self.trigger_change(owner, new_val)
 
     @staticmethod
     def _weak_ref(obj: Any) -> Any:
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+from mvckivy.properties.base_classes import (
+    ExtendedStructProperty,
+    ObservableStruct,
+    ObservableStructDispatcher,
+)
+
+try:
+    import numpy as np
+except ImportError:  # numpy — опциональная зависимость
+    np = None
+
+
+class ObservableArrayDispatcher(ObservableStructDispatcher):
+    """
+    События ObservableArray. Аргумент — диапазон (start, stop) в координатах
+    текущего view() после операции.
+    """
+
+    __events__ = (
+        "on_append",
+        "on_overwrite",
+        "on_clear",
+    )
+
+    def on_append(self, *largs):
+        pass
+
+    def on_overwrite(self, *largs):
+        pass
+
+    def on_clear(self, *largs):
+        pass
+
+
+class ObservableArray(ObservableStruct):
+    """
+    Числовой ряд на NumPy-буфере.
+
+    Растущий режим (maxlen=None): ёмкость удваивается при переполнении.
+    Кольцевой режим (maxlen=N): хранятся последние N записей; буфер занимает 2N,
+    поэтому окно всегда непрерывно, а сдвиг выполняется раз в N добавлений.
+
+    view() отдаёт read-only срез без копирования. Срез валиден до следующей
+    мутации — подписчик берёт новый view() в обработчике on_append/on_overwrite.
+    """
+
+    def __init__(
+        self,
+        parent_prop: ExtendedArrayProperty,
+        dispatch_on_change_to_prop: bool,
+        enable_on_change_only: bool,
+        dispatcher: ObservableArrayDispatcher,
+        data: Any = None,
+        **kwargs,
+    ):
+        super().__init__(
+            parent_prop,
+            dispatch_on_change_to_prop,
+            enable_on_change_only,
+            dispatcher,
+            **kwargs,
+        )
+        self._maxlen: int | None = parent_prop.maxlen
+        size = 2 * self._maxlen if self._maxlen else parent_prop.capacity
+        self._buf = np.empty(size, dtype=parent_prop.dtype)
+        self._start = 0
+        self._stop = 0
+
+        if data is not None:
+            block = self._coerce(data)
+            if len(block):
+                self._write(block)
+
+    # ---------- Чтение ----------
+
+    @property
+    def dtype(self):
+        return self._buf.dtype
+
+    @property
+    def maxlen(self) -> int | None:
+        return self._maxlen
+
+    @property
+    def capacity(self) -> int:
+        return self._maxlen or len(self._buf)
+
+    def view(self, start: int | None = None, stop: int | None = None):
+        """Read-only срез данных без копирования."""
+        v = self._buf[self._start : self._stop][start:stop]
+        v.flags.writeable = False
+        return v
+
+    def channel(self, name: str):
+        """Read-only view одного поля структурного dtype."""
+        return self.view()[name]
+
+    def __array__(self, dtype=None, copy=None):
+        v = self.view()
+        if dtype is not None and dtype != v.dtype:
+            return v.astype(dtype)
+        return v.copy() if copy else v
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __iter__(self) -> Iterator:
+        return iter(self.view())
+
+    def __getitem__(self, key):
+        return self.view()[key]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.view()!r})"
+
+    # ---------- Мутации ----------
+
+    def append(self, value: Any) -> None:
+        """Добавить одну запись (скаляр, кортеж полей или вектор)."""
+        self._append_block(self._coerce([value]))
+
+    def extend(self, values: Any) -> None:
+        """Добавить блок записей одним копированием и одним оповещением."""
+        self._append_block(self._coerce(values))
+
+    def __setitem__(self, key, value) -> None:
+        view = self._buf[self._start : self._stop]
+        view[key] = value
+        self._dispatch_op("overwrite", self._key_range(key, len(view)))
+
+    def clear(self) -> None:
+        self._start = self._stop = 0
+        self._dispatch_op("clear", (0, 0))
+
+    # ---------- Внутреннее ----------
+
+    def _coerce(self, values: Any):
+        item_shape = self._buf.shape[1:]
+        block = np.asarray(values, dtype=self._buf.dtype)
+        return block.reshape((-1, *item_shape))
+
+    def _append_block(self, block) -> None:
+        n = len(block)
+        if not n:
+            return
+        self._write(block)
+        length = len(self)
+        self._dispatch_op("append", (max(length - n, 0), length))
+
+    def _write(self, block) -> None:
+        n = len(block)
+        maxlen = self._maxlen
+
+        if maxlen is None:
+            need = self._stop + n
+            if need > len(self._buf):
+                grown = np.empty(
+                    (max(need, 2 * len(self._buf)), *self._buf.shape[1:]),
+                    dtype=self._buf.dtype,
+                )
+                grown[: self._stop] = self._buf[: self._stop]
+                self._buf = grown
+            self._buf[self._stop : need] = block
+            self._stop = need
+            return
+
+        if n >= maxlen:
+            self._buf[:maxlen] = block[-maxlen:]
+            self._start, self._stop = 0, maxlen
+            return
+
+        if self._stop + n > len(self._buf):
+            # Сдвигаем хвост в начало буфера: окно остаётся непрерывным
+            keep = min(len(self), maxlen - n)
+            self._buf[:keep] = self._buf[self._stop - keep : self._stop]
+            self._start, self._stop = 0, keep
+
+        self._buf[self._stop : self._stop + n] = block
+        self._stop += n
+        self._start = max(self._start, self._stop - maxlen)
+
+    @staticmethod
+    def _key_range(key, length: int) -> tuple[int, int]:
+        if isinstance(key, (int, np.integer)):
+            i = key + length if key < 0 else int(key)
+            return i, i + 1
+        if isinstance(key, slice):
+            start, stop, step = key.indices(length)
+            if step < 0:
+                start, stop = stop + 1, start + 1
+            return start, max(start, stop)
+        return 0, length
+
+
+class ExtendedArrayProperty(ExtendedStructProperty):
+    """
+    Свойство с ObservableArray: numpy-буфер вместо списка python-float.
+
+    :param dtype: dtype записи, в том числе структурный для многоканальных данных
+        (``[("lat", "f8"), ("lon", "f8")]``) или вектор (``("f8", (3,))``).
+    :param capacity: начальная ёмкость растущего буфера.
+    :param maxlen: если задан — кольцевой буфер на maxlen последних записей.
+    """
+
+    def __init__(
+        self,
+        defaultvalue=None,
+        dtype: Any = "f8",
+        capacity: int = 256,
+        maxlen: int | None = None,
+        struct_cls=ObservableArray,
+        dispatcher=None,
+        dispatch_on_change_to_prop=True,
+        enable_on_change_only=False,
+        **kwargs,
+    ):
+        if np is None:
+            raise ImportError(
+                "ExtendedArrayProperty requires numpy: pip install mvckivy[array]"
+            )
+
+        if maxlen is not None and maxlen <= 0:
+            raise ValueError(f"maxlen must be positive, got {maxlen}")
+
+        self.dtype = np.dtype(dtype)
+        self.capacity = max(int(capacity), 1)
+        self.maxlen = maxlen
+
+        if dispatcher is None:
+            dispatcher = ObservableArrayDispatcher()
+
+        super().__init__(
+            struct_cls=struct_cls,
+            dispatcher=dispatcher,
+            defaultvalue=defaultvalue,
+            dispatch_on_change_to_prop=dispatch_on_change_to_prop,
+            enable_on_change_only=enable_on_change_only,
+            **kwargs,
+        )
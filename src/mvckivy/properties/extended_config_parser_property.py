@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import json
 from contextlib import suppress
+from copy import deepcopy
 from functools import partial
 from typing import Iterable, Any, Type, Callable, TypeVar
 
+from kivy.config import ConfigParser
 from kivy.properties import ConfigParserProperty
 from kivy.weakproxy import WeakProxy
 
+from mvckivy.properties.profiler import owner_name, property_profiler
+
 
 class ExtendedConfigParserProperty(ConfigParserProperty):
     def __init__(
@@ -23,6 +27,11 @@ class ExtendedConfigParserProperty(ConfigParserProperty):
     ):
         self.options = options
         self.validators = validators
+        self._config = config
+        # Сырая строка из конфига -> разобранное и провалидированное значение
+        self.parsed_cache: dict[str, Any] = {}
+        # класс, объявивший свойство: владелец записи для профайлера по умолчанию
+        self._owner_name = ""
 
         super().__init__(
             defaultvalue,
@@ -34,27 +43,72 @@ class ExtendedConfigParserProperty(ConfigParserProperty):
                 parent_property=WeakProxy(self),
                 validators=validators,
                 options=options,
+                section=section,
+                key=key,
             ),
             **kw,
         )
 
     @staticmethod
     def _val_type(val_type: Type[Any], **kwargs) -> Callable[[Any], Any]:
-
-        if issubclass(val_type, ConfigParserString):
-            validators = (
-                *kwargs.pop("validators"),
-                OptionsValidator(kwargs.pop("options")),
+        """Собрать фабрику значений; валидаторы компилируются один раз на объявление."""
+        if not isinstance(val_type, type) or not issubclass(
+            val_type, ConfigParserValueTypeMixin
+        ):
+            return val_type
+
+        validators = tuple(kwargs.pop("validators"))
+        options = kwargs.pop("options")
+
+        if issubclass(val_type, ConfigParserString) and options:
+            validators = (*validators, OptionsValidator(options))
+
+        return partial(val_type, validators=validators, **kwargs)
+
+    def link(self, obj, name):
+        super().link(obj, name)
+        if not self._owner_name:
+            self._owner_name = next(
+                (
+                    owner_name(cls)
+                    for cls in type(obj).__mro__
+                    if cls.__dict__.get(name) is self
+                ),
+                "",
             )
-            val_type = partial(val_type, validators=validators, **kwargs)
 
-        elif issubclass(val_type, ConfigParserValueTypeMixin):
-            val_type = partial(val_type, **kwargs)
+    def get(self, obj):
+        value = super().get(obj)
+        if property_profiler.enabled and isinstance(value, ConfigParserValueTypeMixin):
+            # подклассы делят свойство: запись учитывается по классу читавшего
+            value._owner_name = owner_name(type(obj))
+        return value
 
-        return val_type
+    def set_setting(self, section: str, key: str, value: Any, owner_name: str = ""):
+        if not property_profiler.enabled:
+            self._edit_setting(section, key, value)
+            return
 
-    def set_setting(self, section: str, key: str, value: Any):
+        start = property_profiler.clock()
         self._edit_setting(section, key, value)
+        property_profiler.record(
+            owner_name or self._owner_name,
+            self.name,
+            "config",
+            property_profiler.clock() - start,
+            self._count_config_callbacks(section, key),
+        )
+
+    def _count_config_callbacks(self, section: str, key: str) -> int:
+        config = self._config
+        if isinstance(config, str):
+            with suppress(KeyError):
+                config = ConfigParser.get_configparser(config)
+        return sum(
+            1
+            for _, c_section, c_key in getattr(config, "_callbacks", ())
+            if c_section in (None, section) and c_key in (None, key)
+        )
 
 
 class PropertyWrongNameException(Exception):
@@ -68,7 +122,7 @@ class Validator:
 
 class OptionsValidator(Validator):
     def __init__(self, options: Iterable):
-        self.options = set(options)
+        self.options = frozenset(options)
 
     def validate(self, value) -> bool:
         return value in self.options if self.options else True
@@ -76,8 +130,27 @@ class OptionsValidator(Validator):
 
 T = TypeVar("T")
 
+PARSED_CACHE_SIZE = 32
+
+
+def _detached(value: T) -> T:
+    """
+    Значение из кэша, не связанное с ним. Верхний уровень списка/словаря
+    копирует конструктор ConfigParserList/Dict, копировать нужно только
+    вложенные контейнеры.
+    """
+    items = value.values() if isinstance(value, dict) else value
+    if isinstance(value, (list, dict)) and any(
+        isinstance(item, (list, dict)) for item in items
+    ):
+        return deepcopy(value)
+    return value
+
 
 class ConfigParserValueTypeMixin:
+    # класс владельца, через который значение прочитано (только под профайлером)
+    _owner_name: str = ""
+
     def __init__(
         self,
         *args,
@@ -96,7 +169,11 @@ class ConfigParserValueTypeMixin:
             super().__init__(*args, **kwargs)
 
     def _validate(self, value: T) -> T:
-        for validator in self._validators:
+        return self._apply_validators(value, self._validators)
+
+    @staticmethod
+    def _apply_validators(value: T, validators: Iterable[Validator]) -> T:
+        for validator in validators:
             if not validator.validate(value):
                 raise ValueError(
                     f"Validation failed for value: {value}. Validator: {validator}"
@@ -104,12 +181,47 @@ class ConfigParserValueTypeMixin:
 
         return value
 
+    @classmethod
+    def _parse(cls, value: str) -> Any:
+        return value
+
+    @classmethod
+    def _parse_and_validate(
+        cls,
+        value: Any,
+        parent_property: WeakProxy[ExtendedConfigParserProperty] | None,
+        validators: Iterable[Validator],
+    ) -> Any:
+        """
+        Разобрать и провалидировать значение за один проход.
+        Для строк результат кэшируется в свойстве: повторное чтение того же
+        значения из конфига — один поиск в словаре. Вложенные контейнеры
+        из кэша не выдаются: каждый читатель получает свою копию.
+        """
+        if not isinstance(value, str):
+            return cls._apply_validators(value, validators)
+
+        cache = parent_property.parsed_cache if parent_property is not None else None
+        if cache is None:
+            return cls._apply_validators(cls._parse(value), validators)
+
+        try:
+            return _detached(cache[value])
+        except KeyError:
+            pass
+
+        result = cls._apply_validators(cls._parse(value), validators)
+        if len(cache) >= PARSED_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[value] = result
+        return _detached(result)
+
     def set_setting(self, section: str, key: str):
         if self._parent_property is None:
             raise PropertyWrongNameException(
                 "Parent property is not set for this value type."
             )
-        self._parent_property.set_setting(section, key, self.str())
+        self._parent_property.set_setting(section, key, self.str(), self._owner_name)
 
     def str(self):
         return str(self)
@@ -133,24 +245,23 @@ class ConfigParserMappingTypeMixin(ConfigParserValueTypeMixin):
             )
         else:
             super().__init__(
-                self._format_and_validate_value(init_value),
+                self._parse_and_validate(init_value, parent_property, validators),
                 parent_property=parent_property,
                 validators=validators,
                 section=section,
                 key=key,
             )
 
-    def _format_and_validate_value(self, value: Iterable | str) -> Iterable:
-        if isinstance(value, str):
-            value = json.loads(value.replace("'", '"'))
-        return self._validate(value)
+    @classmethod
+    def _parse(cls, value: str) -> Iterable:
+        return json.loads(value.replace("'", '"'))
 
     def __setitem__(self, key, value):
         super().__setitem__(key, value)
         self.set_setting(self._section, self._key)
 
 
-class ConfigParserDict(ConfigParserValueTypeMixin, dict):
+class ConfigParserDict(ConfigParserMappingTypeMixin, dict):
     pass
 
 
@@ -223,29 +334,36 @@ class ConfigParserBool(ConfigParserValueTypeMixin):
 
 
 class ConfigParserString(ConfigParserValueTypeMixin, str):
+    def __new__(
+        cls,
+        init_value: str | None = None,
+        parent_property: WeakProxy[ExtendedConfigParserProperty] = None,
+        validators: Iterable[Validator] = (),
+        section: str = "",
+        key: str = "",
+    ):
+        # str неизменяем: значение разбирается здесь, __init__ лишь запоминает контекст
+        if init_value is None:
+            return super().__new__(cls)
+        return super().__new__(
+            cls, cls._parse_and_validate(init_value, parent_property, validators)
+        )
+
     def __init__(
         self,
-        init_value: str | None,
+        init_value: str | None = None,
         parent_property: WeakProxy[ExtendedConfigParserProperty] = None,
         validators: Iterable[Validator] = (),
         section: str = "",
         key: str = "",
     ):
-        if init_value is None:
-            super().__init__(
-                parent_property=parent_property,
-                validators=validators,
-                section=section,
-                key=key,
-            )
-        else:
-            super().__init__(
-                self._format_and_validate_value(init_value),
-                parent_property=parent_property,
-                validators=validators,
-                section=section,
-                key=key,
-            )
+        super().__init__(
+            parent_property=parent_property,
+            validators=validators,
+            section=section,
+            key=key,
+        )
 
-    def _format_and_validate_value(self, value: str) -> str:
-        return self._validate(value.strip())
+    @classmethod
+    def _parse(cls, value: str) -> str:
+        return value.strip()
@@ -34,7 +34,7 @@ class ObservableDictDispatcher(ObservableStructDispatcher):
     def on_update(self, *largs):
         pass
 
-    def on___delitem__(self, key):
+    def on___delitem__(self, *largs):
         pass
 
     def on___setitem__(self, key, value):
@@ -60,6 +60,17 @@ class ObservableDict(ObservableStruct, dict):
             **kwargs,
         )
 
+    # ---------- Транзакции ----------
+
+    def _batch_snapshot(self) -> dict:
+        return dict.copy(self)
+
+    def _batch_restore(self, snapshot: dict) -> None:
+        dict.clear(self)
+        dict.update(self, snapshot)
+
+    # ---------- Мутации ----------
+
     @dispatch_on_result
     def clear(self):
         """ObservableDict.clear(self, *largs)"""
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Callable, Iterable
+
+from mvckivy.properties.base_classes import dispatch_on_result
+from mvckivy.properties.extended_list_property import (
+    ExtendedListProperty,
+    ObservableList,
+    ObservableListDispatcher,
+)
+
+
+KeySpec = str | Callable[[Any], Any]
+
+
+def _key_func(spec: KeySpec) -> Callable[[Any], Any]:
+    if callable(spec):
+        return spec
+
+    def key(item):
+        return item[spec] if isinstance(item, Mapping) else getattr(item, spec)
+
+    return key
+
+
+class ObservableIndexedListDispatcher(ObservableListDispatcher):
+    __events__ = ("on_clear",)
+
+    def on_clear(self, *largs):
+        pass
+
+
+class ObservableIndexedList(ObservableList):
+    """
+    ObservableList с вторичными индексами.
+
+    Уникальный индекс: ключ -> элемент; множественный: ключ -> список элементов.
+    Индексы обновляются на каждой мутации по удалённым/добавленным элементам,
+    перестановки (sort, reverse) их не трогают. Нарушение уникальности
+    проверяется до изменения списка. Откат batch() восстанавливает и индексы.
+
+    Ключ вычисляется при добавлении элемента: если поле-ключ у элемента
+    меняется на месте, нужно вызвать reindex().
+    """
+
+    def __init__(
+        self,
+        parent_prop: ExtendedIndexedListProperty,
+        dispatch_on_change_to_prop: bool,
+        enable_on_change_only: bool,
+        dispatcher: ObservableIndexedListDispatcher,
+        *args,
+        **kwargs,
+    ):
+        super().__init__(
+            parent_prop,
+            dispatch_on_change_to_prop,
+            enable_on_change_only,
+            dispatcher,
+            *args,
+            **kwargs,
+        )
+        self._unique: dict[str, dict[Any, Any]] = {}
+        self._multi: dict[str, dict[Any, list]] = {}
+        self.reindex()
+
+    # ---------- Поиск ----------
+
+    def by_key(self, index: str, key: Any, default: Any = None) -> Any:
+        """
+        Элемент по ключу уникального индекса или кортеж элементов
+        множественного индекса (пустой, если ключа нет).
+        """
+        unique = self._unique.get(index)
+        if unique is not None:
+            return unique.get(key, default)
+
+        multi = self._multi.get(index)
+        if multi is None:
+            raise KeyError(f"Unknown index '{index}'")
+        return tuple(multi.get(key, ()))
+
+    def has_key(self, index: str, key: Any) -> bool:
+        unique = self._unique.get(index)
+        if unique is not None:
+            return key in unique
+        return bool(self._multi[index].get(key))
+
+    def index_keys(self, index: str) -> Iterable[Any]:
+        return (self._unique.get(index) or self._multi[index]).keys()
+
+    def reindex(self) -> None:
+        """Перестроить все индексы по текущему содержимому."""
+        prop = self._parent_prop
+        old = self._unique, self._multi
+        self._unique = {name: {} for name in prop.unique_keys}
+        self._multi = {name: {} for name in prop.multi_keys}
+        try:
+            self._check_unique((), self)
+        except ValueError:
+            self._unique, self._multi = old
+            raise
+        self._index_add(self)
+
+    # ---------- Мутации ----------
+
+    @dispatch_on_result
+    def append(self, x):
+        """ObservableIndexedList.append(self, x)"""
+        self._check_unique((), (x,))
+        list.append(self, x)
+        self._index_add((x,))
+
+    @dispatch_on_result
+    def extend(self, values):
+        """ObservableIndexedList.extend(self, values)"""
+        values = list(values)
+        self._check_unique((), values)
+        list.extend(self, values)
+        self._index_add(values)
+
+    @dispatch_on_result
+    def insert(self, i, x):
+        """ObservableIndexedList.insert(self, i, x)"""
+        self._check_unique((), (x,))
+        list.insert(self, i, x)
+        self._index_add((x,))
+
+    @dispatch_on_result
+    def pop(self, *largs):
+        """ObservableIndexedList.pop(self, *largs)"""
+        item = list.pop(self, *largs)
+        self._index_remove((item,))
+        return item
+
+    @dispatch_on_result
+    def remove(self, x):
+        """ObservableIndexedList.remove(self, x)"""
+        i = list.index(self, x)
+        item = list.__getitem__(self, i)
+        list.__delitem__(self, i)
+        self._index_remove((item,))
+
+    @dispatch_on_result
+    def clear(self):
+        """ObservableIndexedList.clear(self)"""
+        list.clear(self)
+        self.reindex()
+
+    @dispatch_on_result
+    def __delitem__(self, key):
+        """ObservableIndexedList.__delitem__(self, key)"""
+        removed = self._items_at(key)
+        list.__delitem__(self, key)
+        self._index_remove(removed)
+
+    @dispatch_on_result
+    def __setitem__(self, key, value):
+        """ObservableIndexedList.__setitem__(self, key, value)"""
+        removed = self._items_at(key)
+        added = list(value) if isinstance(key, slice) else [value]
+        self._check_unique(removed, added)
+        list.__setitem__(self, key, added if isinstance(key, slice) else value)
+        self._index_remove(removed)
+        self._index_add(added)
+
+    @dispatch_on_result
+    def __iadd__(self, values):
+        """ObservableIndexedList.__iadd__(self, values)"""
+        values = list(values)
+        self._check_unique((), values)
+        list.extend(self, values)
+        self._index_add(values)
+        return self
+
+    @dispatch_on_result
+    def __imul__(self, n):
+        """ObservableIndexedList.__imul__(self, n)"""
+        if n > 1:
+            self._check_unique((), list.copy(self) * (n - 1))
+        list.__imul__(self, n)
+        self.reindex()
+        return self
+
+    # ---------- Транзакции ----------
+
+    def _batch_restore(self, snapshot: list) -> None:
+        super()._batch_restore(snapshot)
+        self.reindex()
+
+    # ---------- Внутреннее ----------
+
+    def _items_at(self, key) -> list:
+        if isinstance(key, slice):
+            return list.__getitem__(self, key)
+        return [list.__getitem__(self, key)]
+
+    def _check_unique(self, removed: Iterable, added: Iterable) -> None:
+        unique_keys = self._parent_prop.unique_keys
+        if not unique_keys:
+            return
+
+        removed_ids = {id(item) for item in removed}
+        for name, key in unique_keys.items():
+            index = self._unique.get(name, {})
+            seen = set()
+            for item in added:
+                k = key(item)
+                taken = k in index and id(index[k]) not in removed_ids
+                if taken or k in seen:
+                    raise ValueError(f"Duplicate key {k!r} for unique index '{name}'")
+                seen.add(k)
+
+    def _index_add(self, items: Iterable) -> None:
+        prop = self._parent_prop
+        for item in items:
+            for name, key in prop.unique_keys.items():
+                self._unique[name][key(item)] = item
+            for name, key in prop.multi_keys.items():
+                self._multi[name].setdefault(key(item), []).append(item)
+
+    def _index_remove(self, items: Iterable) -> None:
+        prop = self._parent_prop
+        for item in items:
+            for name, key in prop.unique_keys.items():
+                self._unique[name].pop(key(item), None)
+            for name, key in prop.multi_keys.items():
+                k = key(item)
+                bucket = self._multi[name].get(k)
+                if not bucket:
+                    continue
+                for i, other in enumerate(bucket):
+                    if other is item:
+                        del bucket[i]
+                        break
+                if not bucket:
+                    del self._multi[name][k]
+
+
+class ExtendedIndexedListProperty(ExtendedListProperty):
+    """
+    ExtendedListProperty с вторичными индексами и поиском по ключу за O(1).
+
+    :param unique: имя индекса -> имя поля/ключа элемента или функция item -> key.
+    :param multi: то же для неуникальных индексов.
+
+        waypoints = ExtendedIndexedListProperty(
+            unique={"id": "id"}, multi={"vehicle": "vehicle_id"}
+        )
+        self.waypoints.by_key("id", 42)
+        self.waypoints.by_key("vehicle", "uav-1")  # -> (wp, wp, ...)
+    """
+
+    def __init__(
+        self,
+        unique: dict[str, KeySpec] | None = None,
+        multi: dict[str, KeySpec] | None = None,
+        struct_cls=ObservableIndexedList,
+        dispatcher=None,
+        defaultvalue=None,
+        dispatch_on_change_to_prop=True,
+        enable_on_change_only=False,
+        **kwargs,
+    ):
+        self.unique_keys = {n: _key_func(s) for n, s in (unique or {}).items()}
+        self.multi_keys = {n: _key_func(s) for n, s in (multi or {}).items()}
+
+        overlap = self.unique_keys.keys() & self.multi_keys.keys()
+        if overlap:
+            raise ValueError(f"Index names used twice: {sorted(overlap)}")
+
+        if dispatcher is None:
+            dispatcher = ObservableIndexedListDispatcher()
+
+        super().__init__(
+            struct_cls=struct_cls,
+            dispatcher=dispatcher,
+            defaultvalue=defaultvalue,
+            dispatch_on_change_to_prop=dispatch_on_change_to_prop,
+            enable_on_change_only=enable_on_change_only,
+            **kwargs,
+        )
@@ -44,13 +44,13 @@ class ObservableListDispatcher(ObservableStructDispatcher):
     def on_sort(self, *largs, **kwargs):
         pass
 
-    def on___delitem__(self, key):
+    def on___delitem__(self, *largs):
         pass
 
     def on___iadd__(self, *largs):
         pass
 
-    def on___imul__(self, b):
+    def on___imul__(self, *largs):
         pass
 
     def on___setitem__(self, key, value):
@@ -76,6 +76,16 @@ class ObservableList(ObservableStruct, list):
             **kwargs,
         )
 
+    # ---------- Транзакции ----------
+
+    def _batch_snapshot(self) -> list:
+        return list.copy(self)
+
+    def _batch_restore(self, snapshot: list) -> None:
+        list.__setitem__(self, slice(None), snapshot)
+
+    # ---------- Мутации ----------
+
     @dispatch_on_result
     def append(self, *largs):
         """ObservableList.append(self, *largs)"""
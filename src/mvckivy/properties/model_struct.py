@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any, Callable, Iterable
+
+from mvckivy.properties.base_classes import (
+    _IMMUTABLE_TYPES,
+    ExtendedStructProperty,
+    ObservableStruct,
+    ObservableStructDispatcher,
+)
+
+
+FieldCallback = Callable[["ModelStruct", str, Any], None]
+
+
+class ModelStructDispatcher(ObservableStructDispatcher):
+    """
+    События ModelStruct: on_set(struct, (name, value)) при записи одного поля,
+    on_update(struct, (names,)) при групповом update().
+    """
+
+    __events__ = (
+        "on_set",
+        "on_update",
+    )
+
+    def on_set(self, *largs):
+        pass
+
+    def on_update(self, *largs):
+        pass
+
+
+class ModelStructMeta(type):
+    """
+    Собирает поля из аннотаций класса: значения по умолчанию уходят в
+    __field_defaults__, а сами поля становятся слотами. Подкласс может
+    переопределить default поля базы, объявив его заново.
+    """
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        defaults: dict[str, Any] = {}
+        for base in reversed(bases):
+            defaults.update(getattr(base, "__field_defaults__", {}))
+
+        # новый default поля базы; атрибут класса заслонил бы слот
+        for field in defaults.keys() & namespace.keys():
+            defaults[field] = namespace.pop(field)
+
+        own = [
+            field
+            for field in namespace.get("__annotations__", {})
+            if not field.startswith("_") and field not in defaults
+        ]
+        for field in own:
+            defaults[field] = namespace.pop(field, None)
+
+        namespace["__slots__"] = (*namespace.get("__slots__", ()), *own)
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        cls.__field_defaults__ = defaults
+        cls.__field_index__ = {field: i for i, field in enumerate(defaults)}
+        return cls
+
+
+class ModelStruct(ObservableStruct, metaclass=ModelStructMeta):
+    """
+    Запись с объявленными полями для моделей с большим числом значений.
+
+    Поля хранятся в слотах, а для Kivy запись видна как одно свойство
+    (ExtendedModelStructProperty). Каждое изменённое поле помечается битом
+    в маске dirty; подписка на отдельное поле — обычный callback без Kivy-Property:
+
+        class VehicleState(ModelStruct):
+            lat: float = 0.0
+            lon: float = 0.0
+            mode: str = "idle"
+
+        class VehicleModel(BaseModel):
+            state = ExtendedModelStructProperty(VehicleState)
+
+        model.state.subscribe("mode", lambda struct, name, value: ...)
+        model.state.update(lat=55.7, lon=37.6)  # одно оповещение свойства
+    """
+
+    __slots__ = (*ObservableStruct._struct_attrs, "_dirty", "_subscribers")
+    __field_defaults__: dict[str, Any] = {}
+    __field_index__: dict[str, int] = {}
+
+    def __init__(
+        self,
+        parent_prop: ExtendedModelStructProperty,
+        dispatch_on_change_to_prop: bool,
+        enable_on_change_only: bool,
+        dispatcher: ModelStructDispatcher,
+        data: Any = None,
+        **kwargs,
+    ):
+        super().__init__(
+            parent_prop,
+            dispatch_on_change_to_prop,
+            enable_on_change_only,
+            dispatcher,
+            **kwargs,
+        )
+        self._dirty = 0
+        self._subscribers: dict[str, list[FieldCallback]] | None = None
+
+        for field, default in self.__field_defaults__.items():
+            if not isinstance(default, _IMMUTABLE_TYPES):
+                default = deepcopy(default)
+            object.__setattr__(self, field, default)
+
+        if data:
+            for field, value in self._items_of(data):
+                self._check_field(field)
+                object.__setattr__(self, field, value)
+
+    # ---------- Поля ----------
+
+    @classmethod
+    def fields(cls) -> tuple[str, ...]:
+        return tuple(cls.__field_index__)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {field: getattr(self, field) for field in self.__field_index__}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        index = self.__field_index__.get(name)
+        if index is None:
+            return object.__setattr__(self, name, value)
+
+        if self._assign(name, index, value):
+            self._dispatch_op("set", (name, value))
+
+    def update(self, data: Any = None, **fields) -> tuple[str, ...]:
+        """Записать несколько полей и оповестить свойство один раз."""
+        if data is not None:
+            fields = {**dict(self._items_of(data)), **fields}
+
+        changed = tuple(
+            field
+            for field, value in fields.items()
+            if self._assign(field, self._check_field(field), value)
+        )
+        if changed:
+            self._dispatch_op("update", (changed,))
+        return changed
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{k}={v!r}" for k, v in self.as_dict().items())
+        return f"{type(self).__name__}({values})"
+
+    # ---------- Dirty-биты ----------
+
+    @property
+    def dirty_fields(self) -> tuple[str, ...]:
+        dirty = self._dirty
+        return tuple(f for f, i in self.__field_index__.items() if dirty >> i & 1)
+
+    def is_dirty(self, field: str) -> bool:
+        return bool(self._dirty >> self._check_field(field) & 1)
+
+    def consume_dirty(self) -> tuple[str, ...]:
+        """Вернуть изменённые с прошлого вызова поля и сбросить маску."""
+        fields = self.dirty_fields
+        self._dirty = 0
+        return fields
+
+    # ---------- Подписки на поля ----------
+
+    def subscribe(self, field: str, callback: FieldCallback) -> FieldCallback:
+        self._check_field(field)
+        if self._subscribers is None:
+            self._subscribers = {}
+        self._subscribers.setdefault(field, []).append(callback)
+        return callback
+
+    def unsubscribe(self, field: str, callback: FieldCallback) -> None:
+        callbacks = self._subscribers.get(field) if self._subscribers else None
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
+    # ---------- Внутреннее ----------
+
+    def _check_field(self, field: str) -> int:
+        index = self.__field_index__.get(field)
+        if index is None:
+            raise AttributeError(f"{type(self).__name__} has no field '{field}'")
+        return index
+
+    def _assign(self, field: str, index: int, value: Any) -> bool:
+        old = getattr(self, field)
+        if old is value or old == value:
+            return False
+        object.__setattr__(self, field, value)
+        self._dirty |= 1 << index
+        return True
+
+    def _batch_snapshot(self) -> tuple[tuple[Any, ...], int]:
+        return tuple(getattr(self, f) for f in self.__field_index__), self._dirty
+
+    def _batch_restore(self, snapshot: tuple[tuple[Any, ...], int]) -> None:
+        values, self._dirty = snapshot
+        for field, value in zip(self.__field_index__, values):
+            object.__setattr__(self, field, value)
+
+    def _dispatch_op(self, op: str, args: tuple[Any, ...]) -> None:
+        if self._subscribers and self._batch_ops is None:
+            self._notify_fields(self._op_fields(op, args))
+        super()._dispatch_op(op, args)
+
+    @classmethod
+    def _op_fields(cls, op: str, args: tuple[Any, ...]) -> Iterable[str]:
+        if op == "set":
+            return (args[0],)
+        if op == "update":
+            return args[0]
+        # batch: поля всех вложенных операций, каждое один раз
+        return dict.fromkeys(f for sub in args for f in cls._op_fields(*sub))
+
+    def _notify_fields(self, names: Iterable[str]) -> None:
+        for field in names:
+            for callback in tuple(self._subscribers.get(field, ())):
+                callback(self, field, getattr(self, field))
+
+    @staticmethod
+    def _items_of(data: Any) -> Iterable[tuple[str, Any]]:
+        if isinstance(data, ModelStruct):
+            return data.as_dict().items()
+        return dict(data).items()
+
+
+class ExtendedModelStructProperty(ExtendedStructProperty):
+    """
+    Свойство с ModelStruct. Присваивание dict или другой записи обновляет
+    существующую запись на месте, поэтому подписки на поля сохраняются.
+    """
+
+    def __init__(
+        self,
+        struct_cls: type[ModelStruct],
+        dispatcher=None,
+        defaultvalue=None,
+        dispatch_on_change_to_prop=True,
+        enable_on_change_only=False,
+        **kwargs,
+    ):
+        if dispatcher is None:
+            dispatcher = ModelStructDispatcher()
+
+        super().__init__(
+            struct_cls=struct_cls,
+            dispatcher=dispatcher,
+            defaultvalue=defaultvalue,
+            dispatch_on_change_to_prop=dispatch_on_change_to_prop,
+            enable_on_change_only=enable_on_change_only,
+            **kwargs,
+        )
+
+    def _setter(self, inst, value):
+        cur = self._get_or_create(inst)
+        if value is not cur:
+            # update() сам диспатчит свойство, если что-то изменилось
+            cur.update(value)
+        return False
@@ -1,3 +1,6 @@
+from types import MappingProxyType
+from typing import Any, Hashable
+
 from kivy.event import EventDispatcher
 from kivy.properties import (
     ObjectProperty,
@@ -30,22 +33,109 @@ class ConstNullDispatcher(EventDispatcher):
         # ВАЖНО: здесь НЕТ dispatch — KV об этом не узнает.
 
 
-def _prop_for(value):
+def _prop_cls_for(value) -> type:
     if isinstance(value, bool):
-        return BooleanProperty(value)
+        return BooleanProperty
     if isinstance(value, (int, float)):
-        return NumericProperty(value)
+        return NumericProperty
     if isinstance(value, str):
-        return StringProperty(value)
+        return StringProperty
     if isinstance(value, (list, tuple)):
+        return ListProperty
+    if isinstance(value, dict):
+        return DictProperty
+    return ObjectProperty
+
+
+def _prop_for(value, frozen: bool = False):
+    if frozen and isinstance(value, (list, tuple, dict, set)):
+        # общий экземпляр: контейнер только для чтения, а не ObservableList
+        return ObjectProperty(_immutable(value))
+    prop_cls = _prop_cls_for(value)
+    if prop_cls is ListProperty:
         return ListProperty(list(value))
+    if prop_cls is ObjectProperty:
+        return ObjectProperty(value, allownone=True)
+    return prop_cls(value)
+
+
+def _immutable(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return tuple(_immutable(v) for v in value)
+    if isinstance(value, dict):
+        return MappingProxyType({k: _immutable(v) for k, v in value.items()})
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Хешируемый ключ значения. Для нехешируемого объекта — TypeError:
+    такой класс не кэшируется (ключ по id копил бы классы без предела).
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, tuple(_freeze(v) for v in value)
     if isinstance(value, dict):
-        return DictProperty(value)
-    return ObjectProperty(value, allownone=True)
+        # repr: ключи разных типов между собой не сравниваются
+        items = sorted(value.items(), key=lambda kv: repr(kv[0]))
+        return "dict", tuple((k, _freeze(v)) for k, v in items)
+    if isinstance(value, (set, frozenset)):
+        return type(value).__name__, frozenset(_freeze(v) for v in value)
+    hash(value)
+    return type(value).__name__, value
+
+
+class FrozenNullDispatcher(EventDispatcher):
+    """Неизменяемый null-объект: свойства только читаются, экземпляр общий."""
+
+    def __setattr__(self, name, value):
+        if self.property(name, quiet=True) is not None:
+            raise AttributeError(f"{type(self).__name__}.{name} is read-only")
+        super().__setattr__(name, value)
+
+
+# Классы null-объектов по сигнатуре (frozen, ((имя, тип свойства, значение), ...))
+_null_classes: dict[tuple, type[EventDispatcher]] = {}
+# Общие экземпляры неизменяемых null-объектов
+_null_singletons: dict[tuple, EventDispatcher] = {}
+
+
+def create_null_dispatcher(*, frozen: bool = False, **defaults):
+    """
+    Null-объект с Kivy-свойствами defaults.
+
+    Класс создаётся один раз на сигнатуру (имена, типы свойств, значения) и
+    переиспользуется; с нехешируемыми значениями — каждый раз заново, без кэша.
+    С frozen=True возвращается общий экземпляр, запись свойств в который
+    запрещена, а контейнеры заменены неизменяемыми (tuple, mappingproxy).
+    """
+    try:
+        key = (
+            frozen,
+            tuple(
+                (name, _prop_cls_for(val), _freeze(val))
+                for name, val in sorted(defaults.items())
+            ),
+        )
+    except TypeError:
+        key = None
+
+    if frozen and key is not None:
+        inst = _null_singletons.get(key)
+        if inst is not None:
+            return inst
 
+    cls = _null_classes.get(key) if key is not None else None
+    if cls is None:
+        # Динамически создаём подкласс EventDispatcher с Kivy-свойствами на классе
+        attrs = {name: _prop_for(val, frozen) for name, val in defaults.items()}
+        base = FrozenNullDispatcher if frozen else EventDispatcher
+        cls = type(f"NullDispatcher_{len(_null_classes)}", (base,), attrs)
+        if key is not None:
+            _null_classes[key] = cls
 
-def create_null_dispatcher(**defaults):
-    # Динамически создаём подкласс EventDispatcher с Kivy-свойствами на классе
-    attrs = {name: _prop_for(val) for name, val in defaults.items()}
-    cls = type(f"NullDispatcher_{id(defaults)}", (EventDispatcher,), attrs)
-    return cls()
+    inst = cls()
+    if frozen and key is not None:
+        _null_singletons[key] = inst
+    return inst
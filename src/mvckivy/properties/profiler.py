@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Literal
+
+
+SortKey = Literal["total_time", "count", "max_time", "fan_out", "mean_time"]
+
+
+def owner_name(cls: type) -> str:
+    """Ключ владельца в статистике: одноимённые классы разных модулей не сливаются."""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+@dataclass(slots=True)
+class PropertyDispatchStats:
+    owner: str
+    name: str
+    kind: str
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    fan_out: int = 0
+    max_fan_out: int = 0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.count if self.count else 0.0
+
+
+class PropertyProfiler:
+    """
+    Опциональный профайлер диспетчеризации свойств mvckivy.
+
+    Считает вызовы, суммарное/максимальное время и fan-out (сколько
+    наблюдателей оповещено) по ключу (класс владельца, имя свойства).
+    Точки замера: ExtendedAliasProperty.trigger_change, dispatch_on_result
+    (ObservableStruct._dispatch_op) и ExtendedConfigParserProperty.set_setting.
+    Выключенный профайлер стоит одной проверки флага.
+
+        from mvckivy.properties import property_profiler
+        property_profiler.enable()
+        ...
+        print(property_profiler.report(sort_by="total_time", limit=20))
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._stats: dict[tuple[str, str], PropertyDispatchStats] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+    @staticmethod
+    def clock() -> float:
+        return perf_counter()
+
+    def record(
+        self, owner: str, name: str, kind: str, elapsed: float, fan_out: int
+    ) -> None:
+        key = (owner, name)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = PropertyDispatchStats(owner, name, kind)
+        stats.count += 1
+        stats.total_time += elapsed
+        stats.fan_out += fan_out
+        if elapsed > stats.max_time:
+            stats.max_time = elapsed
+        if fan_out > stats.max_fan_out:
+            stats.max_fan_out = fan_out
+
+    def stats(
+        self, sort_by: SortKey = "total_time", limit: int | None = None
+    ) -> list[PropertyDispatchStats]:
+        rows = sorted(
+            self._stats.values(), key=lambda s: getattr(s, sort_by), reverse=True
+        )
+        return rows[:limit] if limit is not None else rows
+
+    def snapshot(
+        self, sort_by: SortKey = "total_time", limit: int | None = None
+    ) -> list[dict]:
+        return [
+            {**asdict(s), "mean_time": s.mean_time} for s in self.stats(sort_by, limit)
+        ]
+
+    def dump_json(
+        self,
+        path: str | None = None,
+        sort_by: SortKey = "total_time",
+        limit: int | None = None,
+    ) -> str:
+        data = json.dumps(self.snapshot(sort_by, limit), indent=2)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as fd:
+                fd.write(data)
+        return data
+
+    def report(self, sort_by: SortKey = "total_time", limit: int | None = None) -> str:
+        header = (
+            f"{'owner.property':<64} {'kind':<8} {'count':>8} {'total ms':>10} "
+            f"{'mean ms':>9} {'max ms':>9} {'fan-out':>8} {'max':>5}"
+        )
+        lines = [header, "-" * len(header)]
+        for s in self.stats(sort_by, limit):
+            lines.append(
+                f"{s.owner + '.' + s.name:<64.64} {s.kind:<8} {s.count:>8} "
+                f"{s.total_time * 1e3:>10.3f} {s.mean_time * 1e3:>9.3f} "
+                f"{s.max_time * 1e3:>9.3f} {s.fan_out:>8} {s.max_fan_out:>5}"
+            )
+        return "\n".join(lines)
+
+
+property_profiler = PropertyProfiler()
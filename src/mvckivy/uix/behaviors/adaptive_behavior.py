@@ -10,6 +10,8 @@ from kivy.uix.floatlayout import FloatLayout
 from kivy.event import EventDispatcher
 from kivy.app import App
 
+from mvckivy.utils.binding_scope import BindingScope
+
 
 if TYPE_CHECKING:
     from mvckivy.app import MKVApp
@@ -45,8 +47,12 @@ class MKVAdaptiveBehavior(EventDispatcher):
         super().__init__(**kwargs)
         self._app: MKVApp = App.get_running_app()
         self._last_profile: DeviceProfile | None = None
-        self._app.bind(on_device_profile_changed=self._on_device_profile_changed)
-        self._app.bind(input_mode=self._on_input_mode)
+        self._app_bindings = BindingScope(self)
+        self._app_bindings.bind(
+            self._app,
+            on_device_profile_changed=self._on_device_profile_changed,
+            input_mode=self._on_input_mode,
+        )
 
         Clock.schedule_once(
             lambda dt: self._on_device_profile_changed(
@@ -93,13 +99,15 @@ class MKVAdaptiveBehavior(EventDispatcher):
         pass
 
     def on_parent(self, instance, parent) -> None:
-        if parent is None and self._app is not None:
-            try:
-                self._app.funbind(
-                    "on_device_profile_changed", self._on_device_profile_changed
-                )
-            finally:
-                self._app = None
+        # ScreenManager detaches screens on every switch: suspend, don't release
+        if parent is None:
+            self._app_bindings.suspend()
+        elif self._app_bindings.suspended:
+            # input_mode is re-synced by resume(), events have to be replayed
+            self._app_bindings.resume()
+            self._on_device_profile_changed(
+                self._app, self._app.device_type, self._app.device_orientation
+            )
 
     def _on_device_profile_changed(
         self, _app, device_type: DeviceType, device_orientation: DeviceOrientation
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from contextlib import suppress
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from kivy.event import EventDispatcher
-from kivy.properties import ObjectProperty, Property
+from kivy.properties import AliasProperty, ObjectProperty, Property
 from kivy.uix.widget import Widget
 from kivymd.app import MDApp
 
+from mvckivy.utils.binding_scope import BindingScope, ScopedBinding
+
 if TYPE_CHECKING:
     from mvckivy.app import MVCApp
     from mvckivy.mvc_base import BaseModel, BaseScreen, BaseController
@@ -24,54 +26,160 @@ class MVCWidget(Widget):
     screen: ObjectProperty[BaseScreen] = ObjectProperty(None, allownone=False)
 
     def __init__(self, *args, **kwargs):
+        self.binding_scope = BindingScope(self)
         super().__init__(**kwargs)
         self.app = MDApp.get_running_app()
 
+    def scoped_bind(self, target: EventDispatcher, **kwargs) -> None:
+        """
+        Binds callbacks to ``target`` through the widget's binding scope.
+
+        Scoped bindings are suspended while the widget is detached from the tree
+        and released by ``release_bindings`` when the widget is destroyed.
+        """
+        self.binding_scope.bind(target, **kwargs)
+
+    def scoped_fbind(
+        self, target: EventDispatcher, name: str, callback: Callable, *args, **kwargs
+    ) -> ScopedBinding:
+        """``fbind`` counterpart of ``scoped_bind``."""
+        return self.binding_scope.fbind(target, name, callback, *args, **kwargs)
+
+    def release_bindings(self) -> None:
+        """Unbinds everything bound through the binding scope."""
+        self.binding_scope.release()
+
+
+def _mvc_context_property(name: str) -> AliasProperty:
+    def getter(self: MVCBehavior):
+        return self._get_mvc_attr(name)
+
+    def setter(self: MVCBehavior, value) -> bool:
+        return self._set_mvc_attr(name, value)
+
+    return AliasProperty(getter, setter, cache=False)
+
+
+_MVC_CONTEXT = ("model", "controller", "screen")
+
 
 class MVCBehavior(MVCWidget):
+    """
+    MVCWidget that inherits its model, controller and screen from the parent.
+
+    An attribute that was not set explicitly is resolved lazily on first access:
+    the parent's (itself cached) value is taken and cached. Detaching keeps the
+    cache, so RecycleView recycling and tab switches cost nothing; attaching to a
+    parent with a different context, or an explicit change on an ancestor,
+    refreshes the cache and is propagated to descendants that inherit it.
+    """
+
+    model: AliasProperty[BaseModel] = _mvc_context_property("model")
+    controller: AliasProperty[BaseController] = _mvc_context_property("controller")
+    screen: AliasProperty[BaseScreen] = _mvc_context_property("screen")
+
     def __init__(self, *args, ignore_parent_mvc: bool = False, **kwargs):
-        super().__init__(*args, **kwargs)
         self._ignore_parent_mvc = ignore_parent_mvc
-        self._set_mvc_attrs_from_parent()
+        self._mvc_explicit: dict[str, object] = {}
+        self._mvc_inherited: dict[str, object] = {}
+        # read before the widget was attached (KV rules run before add_widget)
+        self._mvc_unresolved: set[str] = set()
+        super().__init__(*args, **kwargs)
 
     def on_parent(self, widget, parent):
         with suppress(AttributeError):
             super().on_parent(widget, parent)
 
-        self._set_mvc_attrs_from_parent()
-
-    def _set_mvc_attrs_from_parent(self) -> None:
-        """
-        Sets MVC attributes from the parent widget if they are not already set.
+        if parent is None:
+            self.binding_scope.suspend()
+            return
 
-        This method checks whether a parent widget exists and if it implements the MVCWidget interface.
-        If the parent exists and is an instance of MVCWidget, then the current object's attributes
-        (model, view, controller, and screen) are assigned the corresponding values from the parent,
-        but only if they are not already defined.
+        self.binding_scope.resume()
+        if not self._ignore_parent_mvc:
+            self._check_parent(parent)
+            self._refresh_mvc_context()
 
+    def _check_parent(self, parent: Widget) -> None:
+        """
         Raises
         ------
         ParentClassUnsupported
-            If the parent object exists but does not implement the MVCWidget interface.
+            If the parent object does not implement the MVCWidget interface.
         """
-        if not self._ignore_parent_mvc:
+        if not isinstance(parent, MVCWidget):
+            raise ParentClassUnsupported(
+                f'Parent class "{parent}" must implement MVCWidget class. Called from: {self}'
+            )
+
+    def _get_mvc_attr(self, name: str):
+        value = self._mvc_explicit.get(name)
+        if value is not None:
+            return value
+
+        inherited = self._mvc_inherited
+        if name not in inherited:
             parent = self.parent
-
-            if parent:
-
-                if not isinstance(parent, MVCWidget):
-                    raise ParentClassUnsupported(
-                        f'Parent class "{parent}" must implement MVCWidget class. Called from: {self}'
-                    )
-
-                if not self.model and parent.model:
-                    self.model = parent.model
-
-                if not self.controller and parent.controller:
-                    self.controller = parent.controller
-
-                if not self.screen and parent.screen:
-                    self.screen = parent.screen
+            if self._ignore_parent_mvc:
+                return None
+            if parent is None:
+                self._mvc_unresolved.add(name)
+                return None
+            self._check_parent(parent)
+            inherited[name] = getattr(parent, name)
+        return inherited[name]
+
+    def _set_mvc_attr(self, name: str, value) -> bool:
+        old = self._get_mvc_attr(name)
+        if value is None:
+            self._mvc_explicit.pop(name, None)
+            # Inherit again from the parent on the next access
+            self._mvc_inherited.pop(name, None)
+        else:
+            self._mvc_explicit[name] = value
+
+        if self._get_mvc_attr(name) is old:
+            return False
+        self._propagate_mvc_context()
+        return True
+
+    def _refresh_mvc_context(self) -> None:
+        """
+        Re-reads inherited attributes that were already resolved from the parent
+        and dispatches the ones that changed. Attributes that were read or bound
+        while the widget had no parent are resolved and dispatched as well, so
+        KV rules and observers see the context; the others stay lazy.
+        """
+        inherited = self._mvc_inherited
+        names = set(inherited) | self._mvc_unresolved
+        names.update(
+            name
+            for name in _MVC_CONTEXT
+            if name not in inherited and self.get_property_observers(name)
+        )
+        if not names:
+            return
+
+        parent = self.parent
+        if parent is not None:
+            self._mvc_unresolved.clear()
+        changed = False
+        for name in names:
+            old = inherited.get(name)
+            value = None if parent is None else getattr(parent, name)
+            inherited[name] = value
+            if value is old:
+                continue
+            if name not in self._mvc_explicit:
+                changed = True
+                self.property(name).dispatch(self)
+
+        if changed:
+            self._propagate_mvc_context()
+
+    def _propagate_mvc_context(self) -> None:
+        for child in self.children:
+            if isinstance(child, MVCBehavior) and not child._ignore_parent_mvc:
+                child._refresh_mvc_context()
 
     def bind_property_to_model(
         self,
@@ -111,7 +219,9 @@ class MVCBehavior(MVCWidget):
         if not prop_source:
             prop_source = self
 
-        custom_model.bind(**{model_prop_name: prop_source.setter(prop_name)})
+        self.scoped_bind(
+            custom_model, **{model_prop_name: prop_source.setter(prop_name)}
+        )
 
     def bind_to_model(
         self, custom_model: EventDispatcher | None = None, **kwargs
@@ -137,7 +247,7 @@ class MVCBehavior(MVCWidget):
         if not custom_model:
             custom_model = self.model
 
-        custom_model.bind(**kwargs)
+        self.scoped_bind(custom_model, **kwargs)
 
     def get_property_from_model(
         self, property_name: str, custom_model: EventDispatcher | None = None
@@ -177,13 +177,13 @@ class MKVBaseListItem(
     )
 
     leading_container: ObjectProperty[BoxLayout] = ObjectProperty(
-        create_null_dispatcher(children=[]), rebind=True, cache=True
+        create_null_dispatcher(children=[], frozen=True), rebind=True, cache=True
     )
     text_container: ObjectProperty[BoxLayout] = ObjectProperty(
-        create_null_dispatcher(children=[]), rebind=True, cache=True
+        create_null_dispatcher(children=[], frozen=True), rebind=True, cache=True
     )
     trailing_container: ObjectProperty[BoxLayout] = ObjectProperty(
-        create_null_dispatcher(children=[]), rebind=True, cache=True
+        create_null_dispatcher(children=[], frozen=True), rebind=True, cache=True
     )
 
     def __init__(self, *args, **kwargs):
@@ -390,7 +390,9 @@ class MKVListItemLeadingAvatar(
     FitImage,
 ):
     _list_item = ObjectProperty(
-        create_null_dispatcher(list_opacity_value_disabled_leading_avatar=0),
+        create_null_dispatcher(
+            list_opacity_value_disabled_leading_avatar=0, frozen=True
+        ),
         cache=True,
         rebind=True,
     )
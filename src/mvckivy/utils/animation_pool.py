@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import weakref
+from dataclasses import dataclass
+
+from kivy.animation import Animation
+from kivy.event import EventDispatcher
+
+
+@dataclass(slots=True)
+class _Track:
+    anim: Animation
+    duration: float
+    transition: str
+
+
+@dataclass(slots=True)
+class AnimationPoolStats:
+    tracks: int = 0
+    active: int = 0
+    peak_active: int = 0
+    created: int = 0
+    retargeted: int = 0
+
+
+class AnimationPool:
+    """
+    One animation track per (target, property).
+
+    A new value for a property that is still animating retargets its track:
+    the running animation continues from the current value towards the new one
+    instead of a second Animation fighting over the same property. The track
+    keeps its Animation object and reuses it for later values with the same
+    duration and transition.
+    """
+
+    def __init__(self):
+        self._tracks: weakref.WeakKeyDictionary[EventDispatcher, dict[str, _Track]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats = AnimationPoolStats()
+
+    def animate(
+        self,
+        target: EventDispatcher,
+        duration: float = 1,
+        transition: str = "in_quad",
+        **properties,
+    ) -> list[Animation]:
+        """Animate each property on its own track; return the started animations."""
+        tracks = self._tracks.get(target)
+        if tracks is None:
+            tracks = self._tracks[target] = {}
+
+        started = []
+        for key, value in properties.items():
+            track = tracks.get(key)
+            if track is not None and (track.duration, track.transition) == (
+                duration,
+                transition,
+            ):
+                anim = track.anim
+                if anim.have_properties_to_animate(target):
+                    self._stats.retargeted += 1
+                # cancel() rather than stop(): retargeting must not fire on_complete
+                anim.cancel(target)
+                anim.animated_properties[key] = value
+            else:
+                if track is not None:
+                    track.anim.cancel(target)
+                anim = Animation(**{key: value}, d=duration, t=transition)
+                tracks[key] = _Track(anim, duration, transition)
+                self._stats.created += 1
+
+            anim.start(target)
+            started.append(anim)
+
+        active = self.active_count()
+        if active > self._stats.peak_active:
+            self._stats.peak_active = active
+        return started
+
+    def cancel(self, target: EventDispatcher, *properties: str) -> None:
+        """Cancel the target's tracks (all of them if no property is given)."""
+        tracks = self._tracks.get(target)
+        if not tracks:
+            return
+        for key in properties or tuple(tracks):
+            track = tracks.pop(key, None)
+            if track is not None:
+                track.anim.cancel(target)
+
+    def active_count(self) -> int:
+        """Number of tracks that are animating right now."""
+        return sum(
+            1
+            for target, tracks in self._tracks.items()
+            for track in tracks.values()
+            if track.anim.have_properties_to_animate(target)
+        )
+
+    def stats(self) -> AnimationPoolStats:
+        return AnimationPoolStats(
+            tracks=sum(len(tracks) for tracks in self._tracks.values()),
+            active=self.active_count(),
+            peak_active=self._stats.peak_active,
+            created=self._stats.created,
+            retargeted=self._stats.retargeted,
+        )
+
+    def reset_stats(self) -> None:
+        self._stats = AnimationPoolStats()
+
+
+animation_pool = AnimationPool()
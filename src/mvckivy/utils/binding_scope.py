@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import inspect
+import logging
+import traceback
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from kivy.event import EventDispatcher
+
+
+logger = logging.getLogger("mvckivy")
+
+_NO_VALUE = object()
+
+
+def _bind_site() -> str:
+    frames = [f for f in traceback.extract_stack() if f.filename != __file__]
+    return "".join(traceback.format_list(frames[-3:]))
+
+
+def _weak_callback(method) -> Callable:
+    """Calls a bound method without keeping its object alive."""
+    ref = weakref.WeakMethod(method)
+
+    def callback(*largs, **kwargs):
+        alive = ref()
+        if alive is not None:
+            return alive(*largs, **kwargs)
+
+    return callback
+
+
+@dataclass(slots=True)
+class ScopedBinding:
+    target: weakref.ref
+    name: str
+    callback: Callable
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    uid: int = 0  # 0 - not bound right now
+    site: str = ""
+    # what is bound on the target: a weak trampoline for bound methods
+    bound: Callable | None = None
+    # property value when suspended, to replay only what changed meanwhile
+    suspended_value: Any = _NO_VALUE
+
+
+@dataclass(frozen=True, slots=True)
+class LeakedBinding:
+    owner: str
+    target: str
+    name: str
+    site: str
+
+
+class BindingScope:
+    """
+    Records binds made on behalf of an owner and releases them together.
+
+    Targets are held weakly, so a scope never keeps an App, theme or model alive,
+    and bound methods are attached through weak references, so a target never
+    keeps the method's object alive either (the scope itself still does).
+    ``suspend()`` unbinds everything but remembers the bindings, ``resume()``
+    binds them again and pushes the current value of every bound property
+    that changed while suspended, so such changes are not lost (widgets
+    detached and re-attached to the tree), and ``release()`` unbinds and
+    forgets them (owner destroyed).
+
+    With ``BindingScope.debug = True`` every binding remembers where it was
+    made, and bindings that are still attached when their owner is garbage
+    collected are logged and collected in ``BindingScope.leaked()``. A lambda
+    that captures the owner still keeps it alive through the target and is
+    never reported; bind owner methods instead.
+    """
+
+    debug: bool = False
+    _leaked: list[LeakedBinding] = []
+    _scopes: weakref.WeakSet[BindingScope] = weakref.WeakSet()
+
+    def __init__(self, owner: Any = None):
+        self._owner_name = type(owner).__name__ if owner is not None else ""
+        self._bindings: list[ScopedBinding] = []
+        self._suspended = False
+        # Debug-only: (target ref, name, uid, site) without references to the owner
+        self._debug_records: list[tuple[weakref.ref, str, int, str]] | None = None
+
+        if BindingScope.debug:
+            BindingScope._scopes.add(self)
+            self._debug_records = []
+            if owner is not None:
+                weakref.finalize(
+                    owner, self._check_leaks, self._owner_name, self._debug_records
+                )
+
+    def __len__(self) -> int:
+        return len(self._bindings)
+
+    @property
+    def suspended(self) -> bool:
+        return self._suspended
+
+    def fbind(
+        self, target: EventDispatcher, name: str, callback: Callable, *args, **kwargs
+    ) -> ScopedBinding:
+        binding = ScopedBinding(weakref.ref(target), name, callback, args, kwargs)
+        binding.bound = (
+            _weak_callback(callback) if inspect.ismethod(callback) else callback
+        )
+        if self._debug_records is not None:
+            binding.site = _bind_site()
+        self._bindings.append(binding)
+        if not self._suspended:
+            self._attach(binding, target)
+        return binding
+
+    def bind(self, target: EventDispatcher, **kwargs) -> None:
+        for name, callback in kwargs.items():
+            self.fbind(target, name, callback)
+
+    def unbind(self, binding: ScopedBinding) -> None:
+        self._detach(binding)
+        self._bindings.remove(binding)
+
+    def suspend(self) -> None:
+        if self._suspended:
+            return
+        self._suspended = True
+        for binding in self._bindings:
+            if binding.uid:
+                binding.suspended_value = self._value(binding)
+            self._detach(binding)
+
+    def resume(self) -> None:
+        if not self._suspended:
+            return
+        self._suspended = False
+        alive = []
+        for binding in self._bindings:
+            target = binding.target()
+            if target is not None:
+                self._attach(binding, target)
+                alive.append(binding)
+        self._bindings[:] = alive
+        for binding in alive:
+            self._sync(binding)
+
+    def release(self) -> None:
+        for binding in self._bindings:
+            self._detach(binding)
+        self._bindings.clear()
+        self._suspended = False
+
+    def _attach(self, binding: ScopedBinding, target: EventDispatcher) -> None:
+        binding.uid = target.fbind(
+            binding.name, binding.bound, *binding.args, **binding.kwargs
+        )
+        if self._debug_records is not None:
+            self._debug_records.append(
+                (binding.target, binding.name, binding.uid, binding.site)
+            )
+
+    @staticmethod
+    def _value(binding: ScopedBinding) -> Any:
+        """Current value of the bound property; _NO_VALUE for events."""
+        target = binding.target()
+        if target is None or target.property(binding.name, quiet=True) is None:
+            return _NO_VALUE
+        return getattr(target, binding.name)
+
+    @classmethod
+    def _sync(cls, binding: ScopedBinding) -> None:
+        """Calls the callback with the current value if it changed while suspended."""
+        old, binding.suspended_value = binding.suspended_value, _NO_VALUE
+        value = cls._value(binding)
+        if old is _NO_VALUE or value is _NO_VALUE or value is old:
+            return
+        try:
+            if value == old:
+                return
+        except ValueError:  # e.g. numpy arrays: treat as changed
+            pass
+        binding.callback(*binding.args, binding.target(), value, **binding.kwargs)
+
+    def _detach(self, binding: ScopedBinding) -> None:
+        if not binding.uid:
+            return
+        target = binding.target()
+        if target is not None:
+            target.unbind_uid(binding.name, binding.uid)
+        if self._debug_records is not None:
+            record = (binding.target, binding.name, binding.uid, binding.site)
+            if record in self._debug_records:
+                self._debug_records.remove(record)
+        binding.uid = 0
+
+    @classmethod
+    def leaked(cls) -> list[LeakedBinding]:
+        """Bindings that outlived their owner (debug mode only)."""
+        return list(cls._leaked)
+
+    @classmethod
+    def open_scopes(cls) -> list[tuple[str, int]]:
+        """(owner class, active bindings) of every live scope (debug mode only)."""
+        return [(s._owner_name, len(s)) for s in cls._scopes if len(s)]
+
+    @staticmethod
+    def _check_leaks(
+        owner_name: str, records: list[tuple[weakref.ref, str, int, str]]
+    ) -> None:
+        for target_ref, name, uid, site in records:
+            target = target_ref()
+            if target is None:
+                continue
+            observers = target.get_property_observers(name, args=True)
+            if any(obs[4] == uid for obs in observers):
+                leak = LeakedBinding(owner_name, type(target).__name__, name, site)
+                BindingScope._leaked.append(leak)
+                logger.warning(
+                    "Binding %s.%s of destroyed %s was never released, bound at:\n%s",
+                    leak.target,
+                    name,
+                    owner_name,
+                    site,
+                )
+        records.clear()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Iterable, Literal
+
+from kivy.event import EventDispatcher
+
+if TYPE_CHECKING:
+    from mvckivy.app.screen_registrator import MVCTrio
+
+
+logger = logging.getLogger("mvckivy")
+
+PendingPolicy = Literal["skip", "queue", "create"]
+PENDING_POLICIES = ("skip", "queue", "create")
+
+CoroutineHandler = Callable[[str, EventDispatcher, Coroutine], Any]
+ResultHandler = Callable[[EventDispatcher, Any], Any]
+
+
+def handles_event(cls: type[EventDispatcher], event_type: str) -> bool:
+    """
+    Whether instances of ``cls`` are interested in ``event_type``.
+
+    The event must be declared in ``__events__`` somewhere in the MRO, and
+    either the default handler of the declaring class is overridden or the
+    event is listed in the class's ``routed_events`` (for default handlers that
+    do real work or events consumed through ``bind``).
+    """
+    declarer = None
+    for klass in reversed(cls.__mro__):
+        if event_type in klass.__dict__.get("__events__", ()):
+            declarer = klass
+            break
+    if declarer is None:
+        return False
+
+    if event_type in getattr(cls, "routed_events", ()):
+        return True
+    if declarer is cls:
+        return True
+    return getattr(cls, event_type, None) is not declarer.__dict__.get(event_type)
+
+
+class ControllerEventRouter:
+    """
+    Routing table of app-wide controller events.
+
+    For every event type the router lists the trios whose controller class
+    handles it (see ``handles_event``); the table is built lazily from the
+    classes, so routing never instantiates a controller. Interested trios
+    without a controller yet are handled by the pending policy:
+
+    * ``skip`` - the event is dropped for them;
+    * ``queue`` - it is replayed once the controller is created
+      (``MVCTrio.ensure_controller``);
+    * ``create`` - the controller is created to receive it (old behaviour).
+
+    Async handlers return a coroutine from ``dispatch``; it is passed to
+    ``on_coroutine(name, controller, coro)`` (the app runs it in its nursery).
+    """
+
+    def __init__(self, trios: dict[str, MVCTrio]):
+        self._trios = trios
+        self._routes: dict[str, tuple[str, ...]] = {}
+        self.on_coroutine: CoroutineHandler | None = None
+
+    def routes(self, event_type: str) -> tuple[str, ...]:
+        """Names of the trios whose controller handles ``event_type``."""
+        route = self._routes.get(event_type)
+        if route is None:
+            route = self._routes[event_type] = tuple(
+                name
+                for name, trio in self._trios.items()
+                if handles_event(trio.controller_cls, event_type)
+            )
+            logger.debug(
+                "Event '%s' routed to %d of %d controllers",
+                event_type,
+                len(route),
+                len(self._trios),
+            )
+        return route
+
+    def invalidate(self) -> None:
+        """Drop the table, e.g. after trios were added or replaced."""
+        self._routes.clear()
+
+    def dispatch(
+        self, event_type: str, *args: Any, pending: PendingPolicy = "skip"
+    ) -> int:
+        """Dispatch to the interested controllers; return how many received it."""
+        if pending not in PENDING_POLICIES:
+            raise ValueError(f"Unknown pending policy: {pending!r}")
+
+        delivered = 0
+        for name in self.routes(event_type):
+            trio = self._trios[name]
+            controller = trio.get_controller()
+            if controller is None:
+                if pending == "skip":
+                    continue
+                if pending == "queue":
+                    trio.queue_event(
+                        event_type,
+                        *args,
+                        on_result=functools.partial(self._handle_result, name),
+                    )
+                    continue
+                controller = trio.ensure_controller()
+            result = controller.dispatch(event_type, *args)
+            self._handle_result(name, controller, result)
+            delivered += 1
+        return delivered
+
+    def _handle_result(self, name: str, controller: EventDispatcher, result) -> None:
+        if not inspect.iscoroutine(result):
+            return
+        if self.on_coroutine is None:
+            logger.warning("Async handler of controller '%s' was not awaited", name)
+            result.close()
+        else:
+            self.on_coroutine(name, controller, result)
+
+
+class PendingEvents:
+    """Bounded FIFO of events waiting for a controller to be created."""
+
+    def __init__(self, maxlen: int = 64):
+        self._events: deque[tuple[str, tuple, ResultHandler | None]] = deque(
+            maxlen=maxlen
+        )
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def put(
+        self, event_type: str, args: tuple, on_result: ResultHandler | None = None
+    ) -> None:
+        if len(self._events) == self._events.maxlen:
+            self.dropped += 1
+        self._events.append((event_type, args, on_result))
+
+    def replay(self, dispatcher: EventDispatcher) -> None:
+        events: Iterable[tuple[str, tuple, ResultHandler | None]] = tuple(self._events)
+        self._events.clear()
+        for event_type, args, on_result in events:
+            result = dispatcher.dispatch(event_type, *args)
+            if on_result is not None:
+                on_result(dispatcher, result)
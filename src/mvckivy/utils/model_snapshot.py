@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Iterable, Literal
+
+from kivy.event import EventDispatcher
+from kivy.properties import (
+    AliasProperty,
+    ConfigParserProperty,
+    ReferenceListProperty,
+)
+
+from mvckivy.properties.base_classes import ExtendedStructProperty, ObservableStruct
+from mvckivy.properties.extended_alias_property import ExtendedAliasProperty
+from mvckivy.properties.extended_array_property import ObservableArray
+from mvckivy.properties.model_struct import ModelStruct
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+logger = logging.getLogger("mvckivy")
+
+SNAPSHOT_VERSION = 1
+SnapshotFormat = Literal["json", "msgpack"]
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+class ModelSnapshotter:
+    """
+    Incremental snapshot/restore of an EventDispatcher's Kivy properties.
+
+    Every plain and Extended* (list/dict/array/ModelStruct) property is
+    snapshotted, except names in ``exclude``, derived properties (aliases,
+    reference lists) and config-backed ones. Object properties holding another
+    model with ``snapshot_state``/``restore_state`` are stored recursively;
+    other values that cannot be serialized are skipped.
+
+    After the first snapshot the snapshotter watches the properties and only
+    re-encodes those that changed since the previous one. ``delta=True``
+    returns just these changes, so a caller can append small deltas to a base
+    snapshot and restore them in order.
+    """
+
+    def __init__(self, model: EventDispatcher, exclude: Iterable[str] = ()):
+        self._model = model
+        excluded = set(exclude)
+        self._names: list[str] = []
+        for name, prop in model.properties().items():
+            if name not in excluded and self._is_snapshotable(prop):
+                self._names.append(name)
+
+        self._state: dict[str, Any] = {}
+        self._dirty: set[str] = set(self._names)
+        self._tracking = False
+
+    # ---------- Snapshot ----------
+
+    def state(self, delta: bool = False) -> dict[str, Any]:
+        if not self._tracking:
+            for name in self._names:
+                self._model.fbind(name, self._mark_dirty, name)
+            self._tracking = True
+
+        dirty, self._dirty = self._dirty, set()
+        props: dict[str, Any] = {}
+        models: dict[str, Any] = {}
+
+        for name in self._names:
+            value = getattr(self._model, name)
+
+            if callable(getattr(value, "snapshot_state", None)):
+                # Changes inside a nested model do not dispatch its ObjectProperty
+                nested = value.snapshot_state(delta=delta)
+                if not delta or nested["props"] or nested["models"]:
+                    models[name] = nested
+                continue
+
+            if name in dirty:
+                try:
+                    self._state[name] = self._encode(value)
+                except TypeError:
+                    logger.debug(
+                        "Snapshot: skip %s.%s of type %s",
+                        type(self._model).__name__,
+                        name,
+                        type(value).__name__,
+                    )
+                    self._state.pop(name, None)
+                    continue
+                if delta:
+                    props[name] = self._state[name]
+
+        if not delta:
+            props = dict(self._state)
+        return {"v": SNAPSHOT_VERSION, "delta": delta, "props": props, "models": models}
+
+    def dumps(self, delta: bool = False, fmt: SnapshotFormat = "json") -> bytes:
+        state = self.state(delta=delta)
+        if fmt == "msgpack":
+            if msgpack is None:
+                raise ImportError("msgpack snapshots require the msgpack package")
+            return msgpack.packb(state, use_bin_type=True)
+        return json.dumps(state, separators=(",", ":")).encode("utf-8")
+
+    # ---------- Restore ----------
+
+    def restore(self, state: dict[str, Any]) -> None:
+        """Apply a (full or delta) state; dependents are recomputed once."""
+        if state.get("v") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {state.get('v')!r}")
+
+        with ExtendedAliasProperty.batch():
+            self._apply(state)
+
+        if self._model.is_event_type("on_restore"):
+            self._model.dispatch("on_restore")
+
+    def loads(self, blob: bytes, fmt: SnapshotFormat = "json") -> None:
+        if fmt == "msgpack":
+            if msgpack is None:
+                raise ImportError("msgpack snapshots require the msgpack package")
+            state = msgpack.unpackb(blob, raw=False, strict_map_key=False)
+        else:
+            state = json.loads(blob)
+        self.restore(state)
+
+    def _apply(self, state: dict[str, Any]) -> None:
+        model = self._model
+        known = set(self._names)
+
+        for name, value in state["props"].items():
+            if name not in known:
+                logger.debug(
+                    "Snapshot: unknown property %s.%s", type(model).__name__, name
+                )
+                continue
+            self._apply_value(name, value)
+
+        for name, nested_state in state["models"].items():
+            nested = getattr(model, name, None) if name in known else None
+            if nested is not None and callable(getattr(nested, "restore_state", None)):
+                nested.restore_state(nested_state)
+
+    def _apply_value(self, name: str, value: Any) -> None:
+        current = getattr(self._model, name)
+
+        if isinstance(current, ModelStruct):
+            current.update(value)
+        elif isinstance(current, ObservableArray):
+            if current.dtype.names:
+                value = [tuple(v) for v in value]
+            with current.batch():
+                current.clear()
+                if value:
+                    current.extend(value)
+        elif isinstance(current, ObservableStruct) and isinstance(current, list):
+            with current.batch():
+                current[:] = value
+        elif isinstance(current, ObservableStruct) and isinstance(current, dict):
+            with current.batch():
+                current.clear()
+                current.update(value)
+        else:
+            setattr(self._model, name, value)
+
+    # ---------- Internals ----------
+
+    def _mark_dirty(self, name: str, *_) -> None:
+        self._dirty.add(name)
+
+    @staticmethod
+    def _is_snapshotable(prop) -> bool:
+        if isinstance(prop, ExtendedStructProperty):
+            return True
+        return not isinstance(
+            prop, (AliasProperty, ReferenceListProperty, ConfigParserProperty)
+        )
+
+    @classmethod
+    def _encode(cls, value: Any) -> Any:
+        if isinstance(value, _PRIMITIVES):
+            return value
+        if isinstance(value, ModelStruct):
+            return {k: cls._encode(v) for k, v in value.as_dict().items()}
+        if isinstance(value, ObservableArray):
+            return value.view().tolist()
+        if isinstance(value, dict):
+            return {str(k): cls._encode(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls._encode(v) for v in value]
+        raise TypeError(type(value).__name__)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Coroutine, Literal
+
+import trio
+
+
+logger = logging.getLogger("mvckivy")
+
+HookStatus = Literal["running", "done", "failed", "timeout", "cancelled"]
+
+
+@dataclass(slots=True)
+class HookTiming:
+    name: str
+    started: float
+    elapsed: float | None = None
+    status: HookStatus = "running"
+    error: BaseException | None = None
+
+
+class StartupHooks:
+    """
+    Runs async startup hooks concurrently in a trio nursery.
+
+    Every hook gets its own timeout (``default_timeout`` unless given) and is
+    cancelled by ``cancel()``, e.g. when the app stops. A failing hook is logged
+    and does not take the nursery (and the app) down. Start time, duration and
+    outcome of each hook are kept in ``timings()``; once the last running hook
+    finishes, a summary is logged.
+    """
+
+    def __init__(self, default_timeout: float | None = 30.0):
+        self.default_timeout = default_timeout
+        self._timings: dict[str, HookTiming] = {}
+        self._scopes: dict[str, trio.CancelScope] = {}
+        self._cancelled = False
+
+    def start(
+        self,
+        nursery: trio.Nursery | None,
+        name: str,
+        coro: Coroutine[Any, Any, Any],
+        timeout: float | None = None,
+    ) -> bool:
+        """
+        Schedule ``coro``; return False (and close it) if it cannot run.
+        ``timeout`` None uses ``default_timeout``, ``math.inf`` disables it.
+        """
+        if nursery is None or self._cancelled:
+            logger.warning(
+                "Startup hook '%s' dropped: %s",
+                name,
+                "hooks are cancelled" if self._cancelled else "no trio nursery",
+            )
+            coro.close()
+            return False
+
+        if name in self._timings:
+            name = f"{name}#{len(self._timings)}"
+        if timeout is None:
+            timeout = self.default_timeout
+
+        scope = trio.CancelScope()
+        self._scopes[name] = scope
+        self._timings[name] = HookTiming(name, time.perf_counter())
+        nursery.start_soon(self._run, name, coro, scope, timeout)
+        return True
+
+    def cancel(self) -> None:
+        """Cancel all running hooks; hooks started later are dropped."""
+        self._cancelled = True
+        for scope in self._scopes.values():
+            scope.cancel()
+
+    @property
+    def running(self) -> int:
+        return sum(1 for t in self._timings.values() if t.status == "running")
+
+    def timings(self) -> list[HookTiming]:
+        """Hook timings, slowest first (running hooks at the end)."""
+        return sorted(
+            (
+                HookTiming(t.name, t.started, t.elapsed, t.status, t.error)
+                for t in self._timings.values()
+            ),
+            key=lambda t: -t.elapsed if t.elapsed is not None else math.inf,
+        )
+
+    async def _run(
+        self,
+        name: str,
+        coro: Coroutine[Any, Any, Any],
+        scope: trio.CancelScope,
+        timeout: float | None,
+    ) -> None:
+        timing = self._timings[name]
+        with scope:
+            with trio.move_on_after(
+                math.inf if timeout is None else timeout
+            ) as timeout_scope:
+                try:
+                    await coro
+                    timing.status = "done"
+                except Exception as e:
+                    timing.status = "failed"
+                    timing.error = e
+                    logger.exception("Startup hook '%s' failed", name)
+
+        if timeout_scope.cancelled_caught:
+            timing.status = "timeout"
+            logger.warning("Startup hook '%s' timed out after %s s", name, timeout)
+        elif scope.cancelled_caught:
+            timing.status = "cancelled"
+
+        timing.elapsed = time.perf_counter() - timing.started
+        self._scopes.pop(name, None)
+        logger.debug(
+            "Startup hook '%s' %s in %.3f ms",
+            name,
+            timing.status,
+            timing.elapsed * 1_000,
+        )
+        if not self.running:
+            self._log_summary()
+
+    def _log_summary(self) -> None:
+        timings = self.timings()
+        logger.info(
+            "Startup hooks: %d finished, slowest: %s",
+            len(timings),
+            ", ".join(f"{t.name} {t.elapsed * 1_000:.1f} ms" for t in timings[:3]),
+        )
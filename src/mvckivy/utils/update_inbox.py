@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+from kivy.clock import Clock
+from kivy.event import EventDispatcher
+
+from mvckivy.properties.extended_alias_property import ExtendedAliasProperty
+
+
+_UNSET = object()
+
+
+@dataclass(slots=True)
+class _Pending:
+    value: Any = _UNSET
+    items: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class UpdateInboxStats:
+    posted: int = 0
+    coalesced: int = 0
+    drains: int = 0
+
+
+class UpdateInbox:
+    """
+    Thread-safe inbox of property updates for one EventDispatcher.
+
+    Worker threads call ``post``/``post_many`` (latest value wins) or
+    ``append`` (every item is kept). The first post after a drain arms a Clock
+    trigger; on the next frame the main thread swaps the pending updates out
+    under a short lock and applies them as one batch: dependent
+    ExtendedAliasProperty values recompute once, and appended items land with
+    one ``extend`` per property.
+
+    Properties are applied in the order they were first posted to since the
+    last drain. Within one property the arrival order holds: a value posted
+    after ``append`` replaces the pending items, items appended after it are
+    extended onto the new value.
+    """
+
+    def __init__(self, target: EventDispatcher):
+        self._target = target
+        self._lock = threading.Lock()
+        self._pending: dict[str, _Pending] = {}
+        self._stats = UpdateInboxStats()
+        self._trigger = Clock.create_trigger(self.drain, 0)
+
+    def post(self, name: str, value: Any) -> None:
+        """Queue a value; an undrained earlier value of ``name`` is dropped."""
+        with self._lock:
+            self._post(name, value)
+        self._trigger()
+
+    def post_many(self, **values) -> None:
+        with self._lock:
+            for name, value in values.items():
+                self._post(name, value)
+        self._trigger()
+
+    def _post(self, name: str, value: Any) -> None:
+        self._stats.posted += 1
+        entry = self._pending.get(name)
+        if entry is None:
+            self._pending[name] = _Pending(value)
+            return
+        if entry.value is not _UNSET:
+            self._stats.coalesced += 1
+        entry.value = value
+        entry.items.clear()
+
+    def append(self, name: str, *items: Any) -> None:
+        """Queue items to be appended to the list property ``name``."""
+        with self._lock:
+            self._stats.posted += len(items)
+            entry = self._pending.get(name)
+            if entry is None:
+                entry = self._pending[name] = _Pending()
+            entry.items.extend(items)
+        self._trigger()
+
+    @property
+    def pending(self) -> bool:
+        with self._lock:
+            return bool(self._pending)
+
+    def stats(self) -> UpdateInboxStats:
+        with self._lock:
+            s = self._stats
+            return UpdateInboxStats(s.posted, s.coalesced, s.drains)
+
+    def cancel(self) -> None:
+        """Drop everything pending (e.g. when the target goes away)."""
+        self._trigger.cancel()
+        with self._lock:
+            self._pending = {}
+
+    def drain(self, *_) -> None:
+        """Apply pending updates on the main thread."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            self._stats.drains += 1
+
+        target = self._target
+        with ExtendedAliasProperty.batch():
+            for name, entry in pending.items():
+                if entry.value is not _UNSET:
+                    setattr(target, name, entry.value)
+                if entry.items:
+                    # Extended* and Kivy observable lists notify once per extend()
+                    getattr(target, name).extend(entry.items)
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import io
+import logging
+import os
+import tempfile
+import threading
+from configparser import RawConfigParser
+from contextlib import suppress
+from time import monotonic
+
+from kivy.config import ConfigParser
+
+
+logger = logging.getLogger("mvckivy")
+
+
+class WriteBehindConfigParser(ConfigParser):
+    """
+    ConfigParser whose ``write()`` only marks the config dirty.
+
+    A background thread coalesces writes and flushes the file atomically
+    (temp file + rename) once no new write arrived for ``flush_delay`` seconds.
+    ``flush()`` forces the pending write synchronously; the app calls it on
+    pause and stop. With ``flush_delay <= 0`` every write is flushed at once.
+    """
+
+    def __init__(self, name: str = "", flush_delay: float = 1.0, **kwargs):
+        self._lock = threading.RLock()  # guards config data
+        self._io_lock = threading.Lock()  # serializes flushes
+        self._cond = threading.Condition()  # guards scheduling state
+        self._dirty = False
+        self._deadline: float | None = None
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self.flush_delay = flush_delay
+        super().__init__(name=name, **kwargs)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    @property
+    def flush_delay(self) -> float:
+        return self._flush_delay
+
+    @flush_delay.setter
+    def flush_delay(self, delay: float) -> None:
+        with self._cond:
+            self._flush_delay = delay
+            if self._deadline is not None:
+                # a pending write does not wait longer than the new delay
+                self._deadline = min(self._deadline, monotonic() + max(delay, 0))
+                self._cond.notify()
+
+    # every mutation takes _lock, so a flush never serializes a half-applied change
+
+    def set(self, section, option, value):
+        with self._lock:
+            return super().set(section, option, value)
+
+    def setall(self, section, keyvalues):
+        with self._lock:
+            return super().setall(section, keyvalues)
+
+    def setdefault(self, section, option, value):
+        with self._lock:
+            return super().setdefault(section, option, value)
+
+    def setdefaults(self, section, keyvalues):
+        with self._lock:
+            return super().setdefaults(section, keyvalues)
+
+    def adddefaultsection(self, section):
+        with self._lock:
+            return super().adddefaultsection(section)
+
+    def add_section(self, section):
+        with self._lock:
+            return super().add_section(section)
+
+    def remove_option(self, section, option):
+        with self._lock:
+            return super().remove_option(section, option)
+
+    def remove_section(self, section):
+        with self._lock:
+            return super().remove_section(section)
+
+    def read(self, filename):
+        with self._lock:
+            return super().read(filename)
+
+    def write(self) -> bool:
+        if self.filename is None:
+            return False
+
+        if self.flush_delay <= 0 or self._closed:
+            with self._cond:
+                self._dirty = True
+            return self.flush()
+
+        with self._cond:
+            self._dirty = True
+            self._deadline = monotonic() + self.flush_delay
+            self._ensure_thread()
+            self._cond.notify()
+        return True
+
+    def flush(self) -> bool:
+        """Write pending changes now. Return False if the write failed."""
+        with self._io_lock:
+            with self._cond:
+                self._deadline = None
+                if not self._dirty:
+                    return True
+                self._dirty = False
+
+            with self._lock:
+                filename = self.filename
+                buf = io.StringIO()
+                RawConfigParser.write(self, buf)
+
+            ok = self._atomic_write(filename, buf.getvalue())
+            if not ok:
+                with self._cond:
+                    self._dirty = True
+            return ok
+
+    def close(self) -> None:
+        """Flush pending changes and stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self.flush()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name=f"ConfigWriter-{self.name}", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        with self._cond:
+            while not self._closed:
+                if self._deadline is None:
+                    self._cond.wait()
+                    continue
+
+                timeout = self._deadline - monotonic()
+                if timeout > 0:
+                    self._cond.wait(timeout)
+                    continue
+
+                self._deadline = None
+                self._cond.release()
+                try:
+                    self.flush()
+                finally:
+                    self._cond.acquire()
+
+    @staticmethod
+    def _atomic_write(filename: str, data: str) -> bool:
+        directory = os.path.dirname(os.path.abspath(filename))
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=f".{os.path.basename(filename)}.", suffix=".tmp", dir=directory
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as fd_obj:
+                fd_obj.write(data)
+                fd_obj.flush()
+                os.fsync(fd_obj.fileno())
+            os.replace(tmp_path, filename)
+        except OSError:
+            logger.exception("Unable to write the config <%s>", filename)
+            if tmp_path is not None:
+                with suppress(OSError):
+                    os.remove(tmp_path)
+            return False
+        return True
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import unittest
+
+from kivy.event import EventDispatcher
+from kivy.properties import NumericProperty
+
+from mvckivy.utils.animation_pool import AnimationPool
+
+
+class Model(EventDispatcher):
+    altitude = NumericProperty(0)
+    heading = NumericProperty(0)
+
+
+class TestAnimationPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = AnimationPool()
+        self.model = Model()
+
+    def tearDown(self):
+        self.pool.cancel(self.model)
+
+    def test_new_value_retargets_running_track(self):
+        completed = []
+        (first,) = self.pool.animate(self.model, duration=1, altitude=100)
+        first.bind(on_complete=lambda *_: completed.append(1))
+
+        (second,) = self.pool.animate(self.model, duration=1, altitude=50)
+
+        self.assertIs(first, second)
+        self.assertEqual({"altitude": 50}, second.animated_properties)
+        self.assertEqual([], completed)
+        stats = self.pool.stats()
+        self.assertEqual(
+            (1, 1, 1, 1),
+            (stats.tracks, stats.active, stats.created, stats.retargeted),
+        )
+
+    def test_one_track_per_property(self):
+        self.pool.animate(self.model, altitude=10, heading=90)
+        self.pool.animate(self.model, heading=180)
+
+        self.assertEqual(2, self.pool.active_count())
+        self.assertEqual(2, self.pool.stats().peak_active)
+
+    def test_changed_duration_replaces_animation(self):
+        (first,) = self.pool.animate(self.model, duration=1, altitude=10)
+        (second,) = self.pool.animate(self.model, duration=2, altitude=10)
+
+        self.assertIsNot(first, second)
+        self.assertFalse(first.have_properties_to_animate(self.model))
+        self.assertEqual(1, self.pool.active_count())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import unittest
+
+from kivy.event import EventDispatcher
+from kivy.properties import NumericProperty
+
+from mvckivy.mvc_base.base_controller import BaseController
+from mvckivy.properties import ExtendedDictProperty
+from mvckivy.properties.extended_alias_property import ExtendedAliasProperty
+
+
+class Model(EventDispatcher):
+    lat = NumericProperty(0)
+    lon = NumericProperty(0)
+    table = ExtendedDictProperty(defaultvalue={"mode": "manual"})
+    calls = 0
+
+    def _get_position(self, prop):
+        Model.calls += 1
+        return f"{self.lat}/{self.lon}"
+
+    position = ExtendedAliasProperty(_get_position, bind=["lat", "lon"], cache=True)
+
+
+class TestDispatchToModelBatch(unittest.TestCase):
+    def setUp(self):
+        self.controller = BaseController()
+        self.model = Model()
+
+    def test_alias_recomputes_once_on_final_state(self):
+        seen = []
+        self.model.bind(position=lambda _m, value: seen.append(value))
+        Model.calls = 0
+
+        self.controller.dispatch_to_model(
+            custom_model=self.model, batch=True, lat=1, lon=2
+        )
+
+        batched_calls, Model.calls = Model.calls, 0
+        self.assertEqual(["1/2"], seen)
+
+        self.model.lon = 3
+        # two values in a batch cost as much as a single change
+        self.assertEqual(Model.calls, batched_calls)
+
+    def test_nested_assignments_coalesce_into_one_notification(self):
+        ops = []
+        self.model.table.dispatcher.bind(
+            on_change=lambda _d, _prop, _data, last_op: ops.append(last_op[0])
+        )
+
+        self.controller.dispatch_to_model(
+            custom_model=self.model,
+            batch=True,
+            nested_assignment=True,
+            table=("mode", "auto"),
+        )
+
+        self.assertEqual(["batch"], ops)
+        self.assertEqual({"mode": "auto"}, self.model.table)
+
+    def test_force_dispatch_fires_once_per_property(self):
+        seen = []
+        self.model.bind(lat=lambda _m, value: seen.append(value))
+
+        self.controller.dispatch_to_model(
+            custom_model=self.model, batch=True, force_dispatch=True, lat=1
+        )
+
+        # the assignment itself and the forced dispatch after the batch
+        self.assertEqual([1, 1], seen)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import gc
+import unittest
+
+from kivy.event import EventDispatcher
+from kivy.properties import NumericProperty
+
+from mvckivy.utils.binding_scope import BindingScope
+
+
+class Source(EventDispatcher):
+    __events__ = ("on_event",)
+    value = NumericProperty(0)
+
+    def on_event(self, *largs):
+        pass
+
+
+class Owner:
+    def __init__(self):
+        self.scope = BindingScope(self)
+        self.seen = []
+
+    def on_value(self, _source, value):
+        self.seen.append(value)
+
+
+class TestBindingScope(unittest.TestCase):
+    def tearDown(self):
+        BindingScope.debug = False
+        BindingScope._leaked.clear()
+
+    def test_release_unbinds_everything(self):
+        source, owner = Source(), Owner()
+        owner.scope.bind(source, value=owner.on_value)
+        owner.scope.fbind(source, "value", owner.on_value)
+
+        source.value = 1
+        owner.scope.release()
+        source.value = 2
+
+        self.assertEqual([1, 1], owner.seen)
+        self.assertEqual([], source.get_property_observers("value"))
+        self.assertEqual(0, len(owner.scope))
+
+    def test_suspend_and_resume(self):
+        source, owner = Source(), Owner()
+        owner.scope.bind(source, value=owner.on_value)
+
+        owner.scope.suspend()
+        source.value = 1
+        source.value = 2
+        self.assertEqual([], owner.seen)
+
+        # resume() pushes the value missed while suspended
+        owner.scope.resume()
+        source.value = 3
+
+        self.assertEqual([2, 3], owner.seen)
+
+    def test_resume_resyncs_bound_args_and_skips_events(self):
+        source, owner = Source(), Owner()
+        seen = []
+        owner.scope.fbind(source, "value", lambda *largs: seen.append(largs), "tag")
+        owner.scope.fbind(source, "on_event", lambda *largs: seen.append(largs))
+
+        owner.scope.suspend()
+        source.value = 5
+        owner.scope.resume()
+
+        self.assertEqual([("tag", source, 5)], seen)
+
+    def test_resume_skips_unchanged_values(self):
+        source, owner = Source(), Owner()
+        owner.scope.bind(source, value=owner.on_value)
+        source.value = 1
+
+        owner.scope.suspend()
+        source.value = 2
+        source.value = 1
+        owner.scope.resume()
+
+        self.assertEqual([1], owner.seen)
+
+    def test_scope_does_not_keep_target_alive(self):
+        owner = Owner()
+        owner.scope.bind(Source(), value=owner.on_value)
+        gc.collect()
+        owner.scope.suspend()
+        owner.scope.resume()
+        self.assertEqual(0, len(owner.scope))
+
+    def test_debug_reports_binding_outliving_owner(self):
+        BindingScope.debug = True
+        source, owner = Source(), Owner()
+        owner.scope.bind(source, value=lambda *_: None)
+        released = Owner()
+        released.scope.bind(source, value=lambda *_: None)
+        released.scope.release()
+
+        del owner, released
+        gc.collect()
+
+        (leak,) = BindingScope.leaked()
+        self.assertEqual(
+            ("Owner", "Source", "value"), (leak.owner, leak.target, leak.name)
+        )
+        self.assertIn("test_binding_scope.py", leak.site)
+
+    def test_debug_reports_owner_method_binding(self):
+        BindingScope.debug = True
+        source, owner = Source(), Owner()
+        owner.scope.bind(source, value=owner.on_value)
+        source.value = 1
+        self.assertEqual([1], owner.seen)
+
+        del owner
+        gc.collect()
+
+        (leak,) = BindingScope.leaked()
+        self.assertEqual(("Owner", "value"), (leak.owner, leak.name))
+        source.value = 2  # the dead method is not called
+
+
+if __name__ == "__main__":
+    unittest.main()
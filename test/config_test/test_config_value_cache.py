@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from kivy.config import ConfigParser
+from kivy.event import EventDispatcher
+
+from mvckivy.properties import ConfigParserList, ExtendedConfigParserProperty
+from mvckivy.properties.extended_config_parser_property import ConfigParserString
+
+
+config = ConfigParser(name="value_cache_test")
+config.setdefaults(
+    "section", {"points": "[1, 2, 3]", "language": "en", "zones": '[{"a": 1}]'}
+)
+
+
+class Settings(EventDispatcher):
+    points = ExtendedConfigParserProperty(
+        "[1, 2, 3]", "section", "points", "value_cache_test", val_type=ConfigParserList
+    )
+    zones = ExtendedConfigParserProperty(
+        '[{"a": 1}]', "section", "zones", "value_cache_test", val_type=ConfigParserList
+    )
+    language = ExtendedConfigParserProperty(
+        "en",
+        "section",
+        "language",
+        "value_cache_test",
+        val_type=ConfigParserString,
+        options=["en", "ru"],
+    )
+
+
+class TestConfigValueCache(unittest.TestCase):
+    def test_repeated_read_skips_parsing(self):
+        settings = Settings()
+        self.assertEqual([1, 2, 3], settings.points)
+
+        with mock.patch("json.loads", side_effect=AssertionError):
+            Settings.points.set_setting("section", "points", "[1, 2, 3]")
+
+        self.assertEqual([1, 2, 3], settings.points)
+        self.assertIn("[1, 2, 3]", Settings.points.parsed_cache)
+
+    def test_element_update_writes_back(self):
+        settings = Settings()
+        settings.points[0] = 7
+
+        self.assertEqual("[7, 2, 3]", config.get("section", "points"))
+        settings.points[0] = 1
+
+    def test_nested_values_are_not_shared_with_the_cache(self):
+        raw = '[{"a": 1}]'
+        first = ConfigParserList(raw, parent_property=Settings.zones)
+        first[0]["a"] = 999
+
+        self.assertEqual(
+            [{"a": 1}], ConfigParserList(raw, parent_property=Settings.zones)
+        )
+        self.assertEqual([{"a": 1}], Settings.zones.parsed_cache[raw])
+
+    def test_options_are_validated(self):
+        settings = Settings()
+        settings.language = "ru"
+
+        self.assertEqual("ru", settings.language)
+        with self.assertRaises(ValueError):
+            settings.language = "de"
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
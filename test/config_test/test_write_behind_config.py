@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from mvckivy.utils.write_behind_config import WriteBehindConfigParser
+
+
+class TestWriteBehindConfigParser(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "app.ini")
+        self.config = WriteBehindConfigParser(flush_delay=0.1)
+        self.config.setdefaults("section", {"key": "0"})
+        self.config.filename = self.filename
+
+    def tearDown(self):
+        self.config.close()
+        self.tmp_dir.cleanup()
+
+    def read_key(self) -> str:
+        parser = WriteBehindConfigParser()
+        parser.read(self.filename)
+        return parser.get("section", "key")
+
+    def test_writes_are_coalesced(self):
+        for i in range(10):
+            self.config.set("section", "key", i)
+            self.config.write()
+
+        self.assertTrue(self.config.dirty)
+        self.assertFalse(os.path.exists(self.filename))
+
+        time.sleep(0.4)
+        self.assertFalse(self.config.dirty)
+        self.assertEqual("9", self.read_key())
+
+    def test_forced_flush(self):
+        self.config.set("section", "key", "forced")
+        self.config.write()
+
+        self.assertTrue(self.config.flush())
+        self.assertEqual("forced", self.read_key())
+        self.assertEqual(["app.ini"], os.listdir(self.tmp_dir.name))
+
+    def test_zero_delay_writes_immediately(self):
+        self.config.flush_delay = 0
+        self.config.set("section", "key", "now")
+        self.config.write()
+
+        self.assertEqual("now", self.read_key())
+
+    def test_shorter_delay_applies_to_pending_write(self):
+        self.config.flush_delay = 60
+        self.config.set("section", "key", "pending")
+        self.config.write()
+
+        self.config.flush_delay = 0.05
+        time.sleep(0.3)
+        self.assertFalse(self.config.dirty)
+        self.assertEqual("pending", self.read_key())
+
+    def test_mutations_wait_for_the_config_lock(self):
+        self.config.set("section", "key", "0")
+        self.config.write()
+        self.assertTrue(self.config.flush())
+        mutations = [
+            lambda: self.config.setdefaults("extra", {"a": "1"}),
+            lambda: self.config.add_section("other"),
+            lambda: self.config.remove_option("section", "key"),
+            lambda: self.config.remove_section("extra"),
+            lambda: self.config.read(self.filename),
+        ]
+        for mutate in mutations:
+            thread = threading.Thread(target=mutate)
+            with self.config._lock:
+                thread.start()
+                thread.join(0.05)
+                self.assertTrue(thread.is_alive())
+            thread.join(1)
+            self.assertFalse(thread.is_alive())
+
+        self.assertEqual(["section", "other"], self.config.sections())
+        self.assertEqual("0", self.config.get("section", "key"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import unittest
+
+from kivy.event import EventDispatcher
+
+from mvckivy.utils.event_router import (
+    ControllerEventRouter,
+    PendingEvents,
+    handles_event,
+)
+
+
+class Controller(EventDispatcher):
+    __events__ = ("on_app_start", "on_app_exit", "on_network")
+    routed_events = ("on_app_exit",)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.received = []
+
+    def on_app_start(self):
+        pass
+
+    def on_app_exit(self):
+        self.received.append(("on_app_exit",))
+
+    def on_network(self, online):
+        pass
+
+
+class PlainController(Controller):
+    pass
+
+
+class NetworkController(Controller):
+    def on_network(self, online):
+        self.received.append(("on_network", online))
+
+
+class AsyncStartController(Controller):
+    async def on_app_start(self):
+        self.received.append(("on_app_start",))
+
+
+class OwnEventController(Controller):
+    __events__ = ("on_sync",)
+
+    def on_sync(self):
+        pass
+
+
+class Trio:
+    instances = 0
+
+    def __init__(self, controller_cls, created=True):
+        self.controller_cls = controller_cls
+        self._controller = None
+        self._pending_events = PendingEvents()
+        if created:
+            self.ensure_controller()
+
+    def get_controller(self):
+        return self._controller
+
+    def ensure_controller(self):
+        if self._controller is None:
+            Trio.instances += 1
+            self._controller = self.controller_cls()
+            if self._pending_events:
+                self._pending_events.replay(self._controller)
+        return self._controller
+
+    def queue_event(self, event_type, *args, on_result=None):
+        self._pending_events.put(event_type, args, on_result)
+
+
+class TestHandlesEvent(unittest.TestCase):
+    def test_default_handler_is_not_routed(self):
+        self.assertFalse(handles_event(PlainController, "on_network"))
+        self.assertTrue(handles_event(NetworkController, "on_network"))
+
+    def test_routed_events_and_own_events(self):
+        self.assertTrue(handles_event(NetworkController, "on_app_exit"))
+        self.assertTrue(handles_event(OwnEventController, "on_sync"))
+        self.assertFalse(handles_event(NetworkController, "on_sync"))
+
+
+class TestControllerEventRouter(unittest.TestCase):
+    def setUp(self):
+        Trio.instances = 0
+        self.trios = {
+            "plain": Trio(PlainController),
+            "net": Trio(NetworkController),
+            "lazy_net": Trio(NetworkController, created=False),
+        }
+        self.router = ControllerEventRouter(self.trios)
+
+    def test_routes_only_interested_controllers(self):
+        self.assertEqual(self.router.routes("on_network"), ("net", "lazy_net"))
+        self.assertEqual(self.router.dispatch("on_network", True), 1)
+        self.assertEqual(
+            self.trios["net"].get_controller().received, [("on_network", True)]
+        )
+        self.assertEqual(self.trios["plain"].get_controller().received, [])
+        self.assertEqual(Trio.instances, 2)
+
+    def test_queue_replays_on_creation(self):
+        self.router.dispatch("on_network", False, pending="queue")
+        self.router.dispatch("on_network", True, pending="queue")
+        self.assertIsNone(self.trios["lazy_net"].get_controller())
+
+        controller = self.trios["lazy_net"].ensure_controller()
+        self.assertEqual(
+            controller.received, [("on_network", False), ("on_network", True)]
+        )
+
+    def test_create_policy_instantiates(self):
+        self.assertEqual(self.router.dispatch("on_network", 1, pending="create"), 2)
+        self.assertEqual(Trio.instances, 3)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            self.router.dispatch("on_network", 1, pending="later")
+
+    def test_async_handlers_go_to_on_coroutine(self):
+        self.trios["async"] = Trio(AsyncStartController)
+        self.trios["lazy_async"] = Trio(AsyncStartController, created=False)
+        self.router.invalidate()
+        started = []
+        self.router.on_coroutine = lambda name, c, coro: started.append(
+            (name, coro.close())
+        )
+
+        self.assertEqual(self.router.routes("on_app_start"), ("async", "lazy_async"))
+        self.router.dispatch("on_app_start", pending="queue")
+        self.trios["lazy_async"].ensure_controller()
+        self.assertEqual(started, [("async", None), ("lazy_async", None)])
+
+    def test_pending_events_are_bounded(self):
+        pending = PendingEvents(maxlen=2)
+        for i in range(3):
+            pending.put("on_network", (i,))
+        self.assertEqual(len(pending), 2)
+        self.assertEqual(pending.dropped, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
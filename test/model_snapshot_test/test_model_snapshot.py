@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import unittest
+
+from kivy.event import EventDispatcher
+from kivy.properties import NumericProperty, ObjectProperty, StringProperty
+
+from mvckivy.properties import (
+    ExtendedDictProperty,
+    ExtendedListProperty,
+    ExtendedModelStructProperty,
+    ModelStruct,
+)
+from mvckivy.properties.extended_alias_property import ExtendedAliasProperty
+from mvckivy.utils.model_snapshot import ModelSnapshotter
+
+
+class Snapshotable(EventDispatcher):
+    __events__ = ("on_restore",)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.snapshotter = ModelSnapshotter(self)
+        self.restored = 0
+
+    def snapshot_state(self, delta=False):
+        return self.snapshotter.state(delta=delta)
+
+    def restore_state(self, state):
+        self.snapshotter.restore(state)
+
+    def on_restore(self):
+        self.restored += 1
+
+
+class Battery(Snapshotable):
+    level = NumericProperty(100)
+
+
+class State(ModelStruct):
+    mode: str = "idle"
+    speed: float = 0.0
+
+
+class Vehicle(Snapshotable):
+    name = StringProperty("")
+    altitude = NumericProperty(0)
+    waypoints = ExtendedListProperty()
+    params = ExtendedDictProperty()
+    state = ExtendedModelStructProperty(State)
+    battery = ObjectProperty(None)
+    recomputed = 0
+
+    def _get_summary(self, prop):
+        Vehicle.recomputed += 1
+        return f"{self.name}@{self.altitude}"
+
+    summary = ExtendedAliasProperty(_get_summary, bind=["name", "altitude"])
+
+
+def make_vehicle() -> Vehicle:
+    return Vehicle(battery=Battery())
+
+
+class TestModelSnapshotter(unittest.TestCase):
+    def test_roundtrip_with_structs_and_nested_model(self):
+        src = make_vehicle()
+        src.name = "uav-1"
+        src.altitude = 120
+        src.waypoints.extend([[1, 2], [3, 4]])
+        src.params["rtl_alt"] = 50
+        src.state.mode = "auto"
+        src.battery.level = 42
+
+        dst = make_vehicle()
+        calls = []
+        dst.bind(waypoints=lambda *_: calls.append("waypoints"))
+        dst.snapshotter.loads(src.snapshotter.dumps())
+
+        self.assertEqual("uav-1@120", dst.summary)
+        self.assertEqual([[1, 2], [3, 4]], list(dst.waypoints))
+        self.assertEqual({"rtl_alt": 50}, dict(dst.params))
+        self.assertEqual("auto", dst.state.mode)
+        self.assertEqual(42, dst.battery.level)
+        self.assertEqual(["waypoints"], calls)
+        self.assertEqual((1, 1), (dst.restored, dst.battery.restored))
+
+    def test_delta_contains_only_changed_properties(self):
+        v = make_vehicle()
+        v.snapshotter.state()
+        v.altitude = 10
+        v.battery.level = 5
+
+        delta = v.snapshotter.state(delta=True)
+
+        self.assertEqual({"altitude": 10}, delta["props"])
+        self.assertEqual({"level": 5}, delta["models"]["battery"]["props"])
+        self.assertEqual({}, v.snapshotter.state(delta=True)["props"])
+
+    def test_alias_recomputed_once_on_restore(self):
+        src = make_vehicle()
+        src.name, src.altitude = "uav-2", 7
+        dst = make_vehicle()
+        dst.bind(summary=lambda *_: None)
+        Vehicle.recomputed = 0
+
+        dst.restore_state(src.snapshot_state())
+
+        single = Vehicle.recomputed
+        Vehicle.recomputed = 0
+        dst.altitude = 8
+        self.assertEqual(Vehicle.recomputed, single)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import unittest
+
+from kivy.uix.widget import Widget
+
+from mvckivy.uix.behaviors.mvc_behavior import MVCBehavior, ParentClassUnsupported
+
+
+class TestMVCContext(unittest.TestCase):
+    def setUp(self):
+        self.root = MVCBehavior(model="m1", controller="c1", ignore_parent_mvc=True)
+        self.mid = MVCBehavior()
+        self.leaf = MVCBehavior()
+        self.root.add_widget(self.mid)
+        self.mid.add_widget(self.leaf)
+
+    def test_resolved_lazily_from_ancestors(self):
+        self.assertEqual(self.mid._mvc_inherited, {})
+        self.assertEqual(self.leaf.model, "m1")
+        self.assertEqual(self.mid._mvc_inherited, {"model": "m1"})
+        self.assertIsNone(self.leaf.screen)
+
+    def test_ancestor_change_is_propagated(self):
+        self.assertEqual(self.leaf.model, "m1")
+        seen = []
+        self.leaf.bind(model=lambda _w, value: seen.append(value))
+
+        self.root.model = "m2"
+        self.assertEqual(seen, ["m2"])
+        self.assertEqual(self.leaf.model, "m2")
+
+    def test_reparent_keeps_cache_unless_context_changes(self):
+        self.assertEqual((self.leaf.model, self.leaf.controller), ("m1", "c1"))
+        seen = []
+        self.leaf.bind(model=lambda _w, value: seen.append(value))
+
+        self.root.remove_widget(self.mid)
+        self.assertEqual(self.leaf.model, "m1")
+
+        other = MVCBehavior(model="m1", controller="c2", ignore_parent_mvc=True)
+        other.add_widget(self.mid)
+        self.assertEqual(seen, [])
+        self.assertEqual(self.leaf.controller, "c2")
+
+    def test_explicit_value_wins_until_cleared(self):
+        self.assertEqual(self.leaf.model, "m1")
+        self.mid.model = "own"
+        self.assertEqual(self.leaf.model, "own")
+
+        self.root.model = "m2"
+        self.assertEqual(self.leaf.model, "own")
+
+        self.mid.model = None
+        self.assertEqual(self.leaf.model, "m2")
+
+    def test_read_or_bound_before_attach_is_dispatched(self):
+        mid, leaf = MVCBehavior(), MVCBehavior()
+        seen = []
+        leaf.bind(model=lambda _w, value: seen.append(value))
+        # a KV rule reads the context when rules are applied, before add_widget
+        self.assertIsNone(mid.controller)
+        mid.bind(controller=lambda _w, value: seen.append(value))
+
+        mid.add_widget(leaf)
+        self.assertEqual(seen, [])
+        self.root.add_widget(mid)
+
+        self.assertCountEqual(seen, ["m1", "c1"])
+        self.assertEqual(leaf.model, "m1")
+
+    def test_unsupported_parent(self):
+        with self.assertRaises(ParentClassUnsupported):
+            Widget().add_widget(MVCBehavior())
+
+
+if __name__ == "__main__":
+    unittest.main()
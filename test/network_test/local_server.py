@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterable
+
+
+Route = Callable[
+    [BaseHTTPRequestHandler], tuple[int, dict[str, str], bytes | Iterable[bytes]]
+]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self):
+        server: LocalServer = self.server.owner
+        server.hits.append((self.command, self.path, dict(self.headers)))
+        # consume the body, or it would prefix the next request on the connection
+        self.body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        route = server.routes.get(self.path.split("?")[0])
+        if route is None:
+            status, headers, body = 404, {}, b"not found"
+        else:
+            status, headers, body = route(self)
+
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        if isinstance(body, bytes):
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        # iterable body: chunked transfer, one HTTP chunk per item
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for chunk in body:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+class LocalServer:
+    """Threaded HTTP/1.1 keep-alive server on localhost for network tests."""
+
+    def __init__(self):
+        self.routes: dict[str, Route] = {}
+        self.hits: list[tuple[str, str, dict]] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.owner = self
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def json_route(self, path: str, payload, status: int = 200, headers=None):
+        body = json.dumps(payload).encode()
+        headers = {"Content-Type": "application/json", **(headers or {})}
+        self.routes[path] = lambda _h: (status, headers, body)
+
+    def __enter__(self) -> LocalServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
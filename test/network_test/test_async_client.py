@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+import unittest
+
+import trio
+from local_server import LocalServer
+
+from mvckivy.network.async_client import (
+    AsyncHttpClient,
+    AsyncRequestError,
+    ResponseStatusError,
+)
+
+
+class TestAsyncHttpClient(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalServer().__enter__()
+        self.server.json_route("/vehicles", [{"id": 1}])
+        self.server.json_route("/missing", {"error": "nope"}, status=404)
+        self.client = AsyncHttpClient(self.server.url, timeout=5)
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_request_and_json(self):
+        async def main():
+            response = await self.client.get("/vehicles", params={"page": 1})
+            self.assertEqual(response.status_code, 200)
+            return await self.client.get_json("/vehicles")
+
+        self.assertEqual(trio.run(main), [{"id": 1}])
+        self.assertEqual(self.server.hits[0][1], "/vehicles?page=1")
+
+    def test_status_and_transport_errors(self):
+        async def main():
+            with self.assertRaises(ResponseStatusError) as ctx:
+                await self.client.get("/missing")
+            self.assertEqual(ctx.exception.response.status_code, 404)
+
+            response = await self.client.get("/missing", raise_for_status=False)
+            self.assertEqual(response.json(), {"error": "nope"})
+
+            with socket.socket() as sock:
+                sock.bind(("127.0.0.1", 0))
+                port = sock.getsockname()[1]
+            with self.assertRaises(AsyncRequestError):
+                await AsyncHttpClient(f"http://127.0.0.1:{port}").get("/")
+
+        trio.run(main)
+
+    def test_stream_lines(self):
+        self.server.routes["/telemetry"] = lambda _h: (
+            200,
+            {},
+            iter([b'{"alt": 1}\n', b'{"alt": 2}\n\n', b'{"alt": 3}\n']),
+        )
+
+        async def main():
+            async with self.client.stream("/telemetry", jsonify=True) as chunks:
+                return [chunk async for chunk in chunks]
+
+        self.assertEqual(trio.run(main), [{"alt": 1}, {"alt": 2}, {"alt": 3}])
+
+    def test_cancel_scope_aborts_request(self):
+        release = threading.Event()
+
+        def slow(_handler):
+            release.wait(5)
+            return 200, {}, b"late"
+
+        self.server.routes["/slow"] = slow
+
+        async def main():
+            start = time.monotonic()
+            with trio.move_on_after(0.1) as scope:
+                await self.client.get("/slow")
+            return scope.cancelled_caught, time.monotonic() - start
+
+        cancelled, elapsed = trio.run(main)
+        release.set()
+        self.assertTrue(cancelled)
+        self.assertLess(elapsed, 1)
+
+    def test_cancelled_nursery_closes_stream(self):
+        stop = threading.Event()
+
+        def endless():
+            while not stop.is_set():
+                yield b"tick\n"
+                time.sleep(0.02)
+
+        self.server.routes["/endless"] = lambda _h: (200, {}, endless())
+        received = []
+
+        async def consume():
+            async with self.client.stream("/endless") as chunks:
+                async for chunk in chunks:
+                    received.append(chunk)
+
+        async def main():
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(consume)
+                await trio.sleep(0.2)
+                nursery.cancel_scope.cancel()
+
+        trio.run(main)
+        stop.set()
+        self.assertTrue(received)
+        self.assertEqual(set(received), {b"tick"})
+
+
+if __name__ == "__main__":
+    unittest.main()
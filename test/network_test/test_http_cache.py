@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+
+import requests
+from kivy.network.urlrequest import g_requests
+from local_server import LocalServer
+
+from mvckivy.network.http_cache import HttpCache, parse_cache_control
+from mvckivy.network.url_request_requests import UrlRequestRequests
+
+
+def wait_until(predicate, timeout=5.0, tick=None):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        if tick is not None:
+            tick()
+        time.sleep(0.01)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestHttpCache(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalServer().__enter__()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.clock = FakeClock()
+        self.cache = self._cache()
+        self.session = requests.Session()
+        self.body = b"v1"
+
+    def tearDown(self):
+        self.session.close()
+        self.server.__exit__(None, None, None)
+        self.tmp.cleanup()
+
+    def _cache(self, **kwargs) -> HttpCache:
+        return HttpCache(self.tmp.name, clock=self.clock, **kwargs)
+
+    def _route(self, path: str, headers: dict) -> None:
+        def route(handler):
+            etag = headers.get("ETag")
+            if etag and handler.headers.get("If-None-Match") == etag:
+                return 304, headers, b""
+            last_modified = headers.get("Last-Modified")
+            if (
+                last_modified
+                and handler.headers.get("If-Modified-Since") == last_modified
+            ):
+                return 304, headers, b""
+            return 200, headers, self.body
+
+        self.server.routes[path] = route
+
+    def _get(self, path: str, cache: HttpCache | None = None, **kwargs):
+        cache = cache or self.cache
+        return cache.request(self.session, "GET", f"{self.server.url}{path}", **kwargs)
+
+    def test_parse_cache_control(self):
+        self.assertEqual(
+            parse_cache_control('max-age=60, no-cache, private="x"'),
+            {"max-age": "60", "no-cache": None, "private": "x"},
+        )
+
+    def test_fresh_response_is_served_from_disk(self):
+        self._route("/catalog", {"Cache-Control": "max-age=60"})
+        first = self._get("/catalog")
+        self.clock.now += 30
+        second = self._get("/catalog")
+
+        self.assertFalse(getattr(first, "from_cache", False))
+        self.assertTrue(second.from_cache)
+        self.assertEqual(second.content, b"v1")
+        self.assertEqual(len(self.server.hits), 1)
+        self.assertEqual(self.cache.stats().hits, 1)
+
+    def test_no_store_is_not_cached(self):
+        self._route("/live", {"Cache-Control": "no-store"})
+        self._get("/live")
+        self._get("/live")
+        self.assertEqual(len(self.server.hits), 2)
+        self.assertEqual(self.cache.stats().entries, 0)
+
+    def test_etag_revalidation(self):
+        self._route("/catalog", {"Cache-Control": "max-age=10", "ETag": '"abc"'})
+        self._get("/catalog")
+        self.clock.now += 20
+        response = self._get("/catalog")
+
+        self.assertTrue(response.from_cache)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"v1")
+        self.assertEqual(self.server.hits[1][2]["If-None-Match"], '"abc"')
+        self.assertEqual(self.cache.stats().revalidated, 1)
+
+        # the 304 renewed the freshness
+        self.clock.now += 5
+        self._get("/catalog")
+        self.assertEqual(len(self.server.hits), 2)
+
+    def test_last_modified_revalidation(self):
+        last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+        self._route(
+            "/airspace", {"Cache-Control": "no-cache", "Last-Modified": last_modified}
+        )
+        self._get("/airspace")
+        response = self._get("/airspace")
+
+        self.assertTrue(response.from_cache)
+        self.assertEqual(self.server.hits[1][2]["If-Modified-Since"], last_modified)
+
+    def test_changed_resource_replaces_entry(self):
+        self._route("/catalog", {"Cache-Control": "max-age=10", "ETag": '"abc"'})
+        self._get("/catalog")
+        self.body = b"v2"
+        self._route("/catalog", {"Cache-Control": "max-age=10", "ETag": '"def"'})
+        self.clock.now += 20
+
+        response = self._get("/catalog")
+        self.assertEqual(response.content, b"v2")
+        self.assertEqual(self._get("/catalog").content, b"v2")
+        self.assertEqual(len(self.server.hits), 2)
+
+    def test_lru_eviction(self):
+        self.body = b"x" * 100
+        cache = self._cache(max_size=250)
+        for path in ("/a", "/b", "/c"):
+            self._route(path, {"Cache-Control": "max-age=60"})
+
+        self._get("/a", cache)
+        self._get("/b", cache)
+        self._get("/a", cache)  # /b is now the least recently used
+        self._get("/c", cache)
+
+        stats = cache.stats()
+        self.assertEqual((stats.entries, stats.size, stats.evicted), (2, 200, 1))
+        self.assertTrue(self._get("/a", cache).from_cache)
+        self.assertFalse(getattr(self._get("/b", cache), "from_cache", False))
+
+    def test_entries_survive_restart(self):
+        self._route("/catalog", {"Cache-Control": "max-age=60"})
+        self._get("/catalog")
+        response = self._get("/catalog", self._cache())
+        self.assertTrue(response.from_cache)
+        self.assertEqual(len(self.server.hits), 1)
+
+    def test_vary(self):
+        self._route(
+            "/catalog", {"Cache-Control": "max-age=60", "Vary": "Accept-Language"}
+        )
+        self._get("/catalog", headers={"Accept-Language": "en"})
+        self.assertTrue(
+            self._get("/catalog", headers={"Accept-Language": "en"}).from_cache
+        )
+        self._get("/catalog", headers={"Accept-Language": "ru"})
+        self.assertEqual(len(self.server.hits), 2)
+
+    def test_stale_while_revalidate(self):
+        cache = self._cache(stale_while_revalidate=True)
+        self._route("/catalog", {"Cache-Control": "max-age=10"})
+        self._get("/catalog", cache)
+        self.body = b"v2"
+        self.clock.now += 20
+
+        stale = self._get("/catalog", cache)
+        self.assertTrue(stale.from_cache)
+        self.assertEqual(stale.content, b"v1")
+
+        wait_until(lambda: cache.stats().stored == 2)
+        fresh = self._get("/catalog", cache)
+        self.assertTrue(fresh.from_cache)
+        self.assertEqual(fresh.content, b"v2")
+        self.assertEqual(cache.stats().stale_served, 1)
+
+    def test_stale_while_revalidate_respects_must_revalidate(self):
+        cache = self._cache(stale_while_revalidate=True)
+        self._route("/strict", {"Cache-Control": "max-age=10, must-revalidate"})
+        self._route("/no-cache", {"Cache-Control": "no-cache", "ETag": '"v1"'})
+        self._get("/strict", cache)
+        self._get("/no-cache", cache)
+        self.body = b"v2"
+        self.clock.now += 20
+
+        self.assertEqual(self._get("/strict", cache).content, b"v2")
+        self._get("/no-cache", cache)  # confirmed by a 304 first
+        self.assertEqual(len(self.server.hits), 4)
+        self.assertEqual(cache.stats().revalidated, 1)
+        self.assertEqual(cache.stats().stale_served, 0)
+
+    def test_lowercase_headers(self):
+        cache = self._cache(stale_while_revalidate=True)
+        headers = {"cache-control": "max-age=10, must-revalidate", "etag": '"abc"'}
+
+        def route(handler):
+            if handler.headers.get("If-None-Match") == '"abc"':
+                return 304, {"Cache-Control": "max-age=10", "ETag": '"abc"'}, b""
+            return 200, headers, self.body
+
+        self.server.routes["/lower"] = route
+        self._get("/lower", cache)
+        self.clock.now += 5
+        self.assertTrue(self._get("/lower", cache).from_cache)
+        self.assertEqual(len(self.server.hits), 1)
+
+        # must-revalidate is honoured: no stale copy, a conditional request
+        self.clock.now += 20
+        self.assertTrue(self._get("/lower", cache).from_cache)
+        self.assertEqual(cache.stats().stale_served, 0)
+        self.assertEqual(cache.stats().revalidated, 1)
+
+        entry = cache._load(cache._key(f"{self.server.url}/lower"), None)
+        names = [name.lower() for name in entry.headers]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual(entry.cache_control, {"max-age": "10"})
+
+    def test_stale_while_revalidate_directive_window(self):
+        self._route(
+            "/catalog", {"Cache-Control": "max-age=10, stale-while-revalidate=30"}
+        )
+        self._get("/catalog")
+        self.clock.now += 20
+        self.assertTrue(self._get("/catalog").from_cache)
+        wait_until(lambda: len(self.server.hits) == 2)
+
+        self.clock.now += 100
+        wait_until(lambda: not self.cache._refreshing)
+        self._get("/catalog")
+        self.assertEqual(self.cache.stats().stale_served, 1)
+
+
+class TestCachedUrlRequest(unittest.TestCase):
+    def test_url_request_uses_cache(self):
+        with LocalServer() as server, tempfile.TemporaryDirectory() as tmp:
+            server.json_route(
+                "/vehicles", [1, 2], headers={"Cache-Control": "max-age=60"}
+            )
+            cache = HttpCache(tmp)
+            results = []
+
+            for _ in range(2):
+                req = UrlRequestRequests(
+                    server.url,
+                    "/vehicles",
+                    method="GET",
+                    http_cache=cache,
+                    on_success=lambda _req, resp: results.append(resp.json()),
+                )
+                wait_until(
+                    lambda: req not in g_requests, tick=lambda: req._dispatch_result(0)
+                )
+
+            self.assertEqual(results, [[1, 2], [1, 2]])
+            self.assertEqual(len(server.hits), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from kivy.network.urlrequest import g_requests
+from local_server import LocalServer
+
+from mvckivy.network.openapi import OpenApiSchema, SchemaValidationError
+from mvckivy.network.restful_url_request_swagger_client import (
+    RestfulUrlRequestSwaggerClient,
+)
+
+
+SCHEMA_FILE = Path(__file__).with_name("openapi_sample.json")
+
+VEHICLE = {
+    "id": 7,
+    "mode": "auto",
+    "armed": True,
+    "battery": {"voltage": 15.2, "remaining": None},
+    "class": "copter",
+    "tags": {"frame": "x8"},
+}
+
+
+# a Command is a goto, a hold, or (oneOf only) ambiguous when it fits both
+UNION_DOCUMENT = {
+    "components": {
+        "schemas": {
+            "Goto": {
+                "type": "object",
+                "required": ["lat", "lon"],
+                "properties": {"lat": {"type": "number"}, "lon": {"type": "number"}},
+            },
+            "Hold": {
+                "type": "object",
+                "required": ["seconds"],
+                "properties": {"seconds": {"type": "integer"}},
+            },
+            "Command": {
+                "oneOf": [
+                    {"$ref": "#/components/schemas/Goto"},
+                    {"$ref": "#/components/schemas/Hold"},
+                ]
+            },
+            "AnyCommand": {
+                "anyOf": [
+                    {"$ref": "#/components/schemas/Goto"},
+                    {"$ref": "#/components/schemas/Hold"},
+                ]
+            },
+        }
+    }
+}
+
+
+def wait_until(predicate, timeout=5.0, tick=None):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        if tick is not None:
+            tick()
+        time.sleep(0.01)
+
+
+class TestOpenApiSchema(unittest.TestCase):
+    def setUp(self):
+        self.api = OpenApiSchema.from_file(SCHEMA_FILE)
+
+    def test_decodes_into_slotted_dataclasses(self):
+        vehicle = self.api.decode("Vehicle", VEHICLE)
+        self.assertIsInstance(vehicle, self.api.model("Vehicle"))
+        self.assertEqual(vehicle.battery.voltage, 15.2)
+        self.assertIsNone(vehicle.battery.remaining)
+        self.assertEqual(vehicle.class_, "copter")
+        self.assertEqual(vehicle.tags, {"frame": "x8"})
+        self.assertFalse(hasattr(vehicle, "__dict__"))
+        self.assertLess(sys.getsizeof(vehicle), sys.getsizeof(VEHICLE))
+
+    def test_strict_mode_reports_the_field_path(self):
+        cases = [
+            ({**VEHICLE, "battery": {"voltage": "high"}}, "$.battery.voltage"),
+            ({**VEHICLE, "mode": "loiter"}, "$.mode"),
+            ({**VEHICLE, "id": True}, "$.id"),
+            ({k: v for k, v in VEHICLE.items() if k != "battery"}, "$"),
+            ({**VEHICLE, "id": None}, "$.id"),
+            ({**VEHICLE, "battery": None}, "$.battery"),
+        ]
+        for payload, path in cases:
+            with self.assertRaises(SchemaValidationError) as ctx:
+                self.api.decode("Vehicle", payload)
+            self.assertEqual(ctx.exception.path, path)
+
+    def test_lenient_mode_coerces_and_fills_missing(self):
+        api = OpenApiSchema.from_file(SCHEMA_FILE, mode="lenient")
+        vehicle = api.decode(
+            "Vehicle",
+            {"id": "7", "mode": "loiter", "battery": {"voltage": "15.2"}, "extra": 1},
+        )
+        self.assertEqual(vehicle.id, 7)
+        self.assertEqual(vehicle.mode, "loiter")
+        self.assertEqual(vehicle.battery.voltage, 15.2)
+        self.assertIsNone(vehicle.armed)
+        self.assertIsNone(api.decode("Vehicle", {**VEHICLE, "id": None}).id)
+
+    def test_concurrent_first_use(self):
+        api = OpenApiSchema.from_file(SCHEMA_FILE)
+        barrier = threading.Barrier(8)
+        results, errors = [], []
+
+        def decode():
+            barrier.wait()
+            try:
+                decoder = api.operation_decoder("listMissions")
+                results.append(decoder([{"name": "m", "waypoints": []}]))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=decode) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(results), 8)
+
+    def test_all_of_and_recursive_refs(self):
+        decode = self.api.operation_decoder("listMissions")
+        (mission,) = decode(
+            [
+                {
+                    "name": "survey",
+                    "waypoints": [
+                        {"lat": 1.0, "lon": 2.0, "next": {"lat": 3, "lon": 4}}
+                    ],
+                }
+            ]
+        )
+        self.assertEqual(mission.name, "survey")
+        self.assertEqual(mission.waypoints[0].next.lat, 3)
+        self.assertIsNone(mission.waypoints[0].alt)
+        with self.assertRaises(SchemaValidationError) as ctx:
+            decode([{"name": "survey", "waypoints": [{"lat": 1.0}]}])
+        self.assertEqual(ctx.exception.path, "$[0].waypoints[0]")
+
+    def test_response_lookup_by_concrete_path_and_status(self):
+        self.assertIsNotNone(self.api.response_decoder("GET", "/vehicles/7"))
+        problem = self.api.response_decoder("get", "/vehicles/7", 404)({"detail": "x"})
+        self.assertEqual(problem.detail, "x")
+        self.assertIsNone(self.api.response_decoder("post", "/vehicles/7"))
+        self.assertIsNone(self.api.response_decoder("get", "/unknown"))
+
+
+class TestUnions(unittest.TestCase):
+    def test_one_of_rejects_ambiguous_payload_in_strict_mode(self):
+        api = OpenApiSchema(UNION_DOCUMENT)
+        self.assertIsInstance(api.decode("Command", {"seconds": 5}), api.model("Hold"))
+        with self.assertRaises(SchemaValidationError) as ctx:
+            api.decode("Command", {"lat": 1.0, "lon": 2.0, "seconds": 5})
+        self.assertEqual(ctx.exception.path, "$")
+        # anyOf takes the first match
+        command = api.decode("AnyCommand", {"lat": 1.0, "lon": 2.0, "seconds": 5})
+        self.assertIsInstance(command, api.model("Goto"))
+
+    def test_strict_match_is_decoded_once(self):
+        api = OpenApiSchema(UNION_DOCUMENT)
+        calls = []
+        decode_hold = api._component_decoder("Hold")
+        api._decoders["Hold"] = lambda data, path: calls.append(1) or decode_hold(
+            data, path
+        )
+        api.decode("Command", {"seconds": 5})
+        self.assertEqual(calls, [1])
+
+    def test_lenient_one_of_takes_the_first_match(self):
+        api = OpenApiSchema(UNION_DOCUMENT, mode="lenient")
+        command = api.decode("Command", {"lat": 1.0, "lon": 2.0, "seconds": 5})
+        self.assertIsInstance(command, api.model("Goto"))
+        self.assertEqual(api.decode("Command", {"x": 1}), {"x": 1})
+
+
+class TestTypedSwaggerClient(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalServer().__enter__()
+        self.server.json_route("/vehicles/7", VEHICLE)
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def _run(self, endpoint, **kwargs) -> tuple[list, list]:
+        results, errors = [], []
+        req = RestfulUrlRequestSwaggerClient(
+            self.server.url,
+            endpoint,
+            method="GET",
+            on_success=lambda _req, result: results.append(result),
+            on_error=lambda _req, error: errors.append(error),
+            **kwargs,
+        )
+        wait_until(lambda: req not in g_requests, tick=lambda: req._dispatch_result(0))
+        return results, errors
+
+    def test_typed_response(self):
+        api = OpenApiSchema.from_file(SCHEMA_FILE)
+        results, errors = self._run("/vehicles/7", openapi_schema=api)
+        self.assertEqual(errors, [])
+        self.assertIsInstance(results[0], api.model("Vehicle"))
+        self.assertEqual(results[0].battery.voltage, 15.2)
+
+    def test_strict_mismatch_is_an_error(self):
+        self.server.json_route("/vehicles/8", {**VEHICLE, "mode": "loiter"})
+        api = OpenApiSchema.from_file(SCHEMA_FILE)
+        results, errors = self._run(
+            "/vehicles/8", openapi_schema=api, operation_id="getVehicle"
+        )
+        self.assertEqual(results, [])
+        self.assertIsInstance(errors[0], SchemaValidationError)
+
+
+if __name__ == "__main__":
+    unittest.main()
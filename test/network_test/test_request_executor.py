@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+
+from kivy.network.urlrequest import g_requests
+from local_server import LocalServer
+
+from mvckivy.network.request_executor import Priority, RequestExecutor
+from mvckivy.network.url_request_requests import UrlRequestRequests
+
+
+def wait_until(predicate, timeout=5.0, tick=None):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        if tick is not None:
+            tick()
+        time.sleep(0.01)
+
+
+class TestRequestExecutor(unittest.TestCase):
+    def test_priority_order(self):
+        executor = RequestExecutor(max_workers=1)
+        gate = threading.Event()
+        order = []
+
+        executor.submit(gate.wait)
+        wait_until(lambda: executor.stats().running == 1)
+        executor.submit(lambda: order.append("bg1"), priority=Priority.BACKGROUND)
+        executor.submit(lambda: order.append("user"), priority=Priority.USER)
+        executor.submit(lambda: order.append("bg2"), priority=Priority.BACKGROUND)
+        self.assertEqual(executor.stats().queued, 3)
+
+        gate.set()
+        wait_until(lambda: executor.stats().completed == 4)
+        self.assertEqual(order, ["user", "bg1", "bg2"])
+        self.assertEqual(executor.stats().workers, 1)
+        self.assertEqual(executor.stats().peak_queued, 3)
+
+    def test_per_host_limit(self):
+        executor = RequestExecutor(max_workers=4, per_host_limit=1)
+        gate = threading.Event()
+        running = {"a": 0, "b": 0}
+        peak = {"a": 0, "b": 0}
+        lock = threading.Lock()
+
+        def job(host):
+            with lock:
+                running[host] += 1
+                peak[host] = max(peak[host], running[host])
+            gate.wait()
+            with lock:
+                running[host] -= 1
+
+        for _ in range(3):
+            executor.submit(lambda: job("a"), host="a")
+        executor.submit(lambda: job("b"), host="b")
+
+        wait_until(lambda: running == {"a": 1, "b": 1})
+        self.assertEqual(executor.stats().queued, 2)
+        gate.set()
+        wait_until(lambda: executor.stats().completed == 4)
+        self.assertEqual(peak, {"a": 1, "b": 1})
+
+        stats = executor.stats()
+        self.assertGreater(stats.max_wait, 0)
+        self.assertLessEqual(stats.avg_wait, stats.max_wait)
+
+    def test_failing_job_does_not_kill_worker(self):
+        executor = RequestExecutor(max_workers=1)
+        done = threading.Event()
+
+        with self.assertLogs("mvckivy", "ERROR"):
+            executor.submit(lambda: 1 / 0)
+            executor.submit(done.set)
+            self.assertTrue(done.wait(5))
+
+
+class TestPooledUrlRequest(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalServer().__enter__()
+        self.server.json_route("/status", {"ok": True})
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_runs_on_executor_and_releases_request(self):
+        results = []
+        req = UrlRequestRequests(
+            self.server.url,
+            "/status",
+            on_success=lambda _req, resp: results.append(resp.json()),
+            priority=Priority.BACKGROUND,
+        )
+
+        wait_until(lambda: req not in g_requests, tick=lambda: req._dispatch_result(0))
+        self.assertEqual(results, [{"ok": True}])
+        self.assertFalse(req.is_alive())
+
+    def test_join_and_wait_follow_the_worker(self):
+        executor = RequestExecutor(max_workers=1)
+        gate = threading.Event()
+        executor.submit(gate.wait)
+
+        class Request(UrlRequestRequests):
+            pass
+
+        Request.executor = executor
+        results = []
+        req = Request(
+            self.server.url,
+            "/status",
+            on_success=lambda _req, resp: results.append(resp.json()),
+        )
+        # queued behind the gate: never started as a thread, still alive
+        self.assertTrue(req.is_alive())
+        req.join(0.05)
+        self.assertTrue(req.is_alive())
+
+        gate.set()
+        req.join(5)
+        self.assertFalse(req.is_alive())
+        req.wait(0.01)
+        self.assertEqual(results, [{"ok": True}])
+        self.assertNotIn(req, g_requests)
+
+    def test_wait_returns_for_cancelled_request(self):
+        executor = RequestExecutor(max_workers=1)
+        gate = threading.Event()
+        executor.submit(gate.wait)
+
+        class Request(UrlRequestRequests):
+            pass
+
+        Request.executor = executor
+        cancelled = []
+        req = Request(
+            self.server.url, "/status", on_cancel=lambda _req: cancelled.append(1)
+        )
+        req.cancel()
+        gate.set()
+
+        req.wait(0.01)
+        self.assertEqual(cancelled, [1])
+        self.assertIsNone(req.resp_status)
+
+    def test_cancelled_while_queued(self):
+        executor = RequestExecutor(max_workers=1)
+        gate = threading.Event()
+        executor.submit(gate.wait)
+
+        cancelled = []
+
+        class Request(UrlRequestRequests):
+            pass
+
+        Request.executor = executor
+        req = Request(
+            self.server.url, "/status", on_cancel=lambda _req: cancelled.append(1)
+        )
+        req.cancel()
+        gate.set()
+
+        wait_until(lambda: req not in g_requests, tick=lambda: req._dispatch_result(0))
+        self.assertEqual(cancelled, [1])
+        self.assertEqual(self.server.hits, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
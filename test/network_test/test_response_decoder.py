@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import unittest
+
+from kivy.network.urlrequest import g_requests
+from local_server import LocalServer
+
+from mvckivy.network.response_decoder import (
+    DecoderRegistry,
+    decode_json,
+    summarize_result,
+)
+from mvckivy.network.url_request_requests import UrlRequestRequests
+
+
+def wait_until(predicate, timeout=5.0, tick=None):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        if tick is not None:
+            tick()
+        time.sleep(0.01)
+
+
+class TestDecoderRegistry(unittest.TestCase):
+    def test_lookup_by_content_type(self):
+        registry = DecoderRegistry()
+        self.assertIs(
+            registry.decoder_for("application/json; charset=utf-8"), decode_json
+        )
+        self.assertIs(registry.decoder_for("application/problem+json"), decode_json)
+        self.assertIsNone(registry.decoder_for("text/html"))
+        self.assertIsNone(registry.decoder_for(None))
+        with self.assertRaises(LookupError):
+            registry.decode("text/html", b"<html/>")
+
+    def test_custom_decoder(self):
+        registry = DecoderRegistry()
+        registry.register("text/csv", lambda data: data.decode().split(","))
+        self.assertEqual(registry.decode("text/csv", b"a,b"), ["a", "b"])
+        registry.unregister("text/csv")
+        self.assertIsNone(registry.decoder_for("text/csv"))
+
+    def test_large_bodies_use_process_pool(self):
+        registry = DecoderRegistry(process_threshold=1024, max_processes=1)
+        try:
+            payload = {"waypoints": list(range(1000))}
+            self.assertEqual(
+                registry.decode("application/json", json.dumps(payload).encode()),
+                payload,
+            )
+            self.assertIsNotNone(registry._pool)
+        finally:
+            registry.shutdown()
+
+
+class TestSummarizeResult(unittest.TestCase):
+    def test_large_payloads_are_truncated(self):
+        mission = {"waypoints": [{"lat": i, "lon": i} for i in range(100_000)]}
+        text = summarize_result(mission, max_length=200)
+        self.assertLessEqual(len(text), 200)
+        self.assertTrue(text.startswith("<dict, 1 items>"))
+
+        text = summarize_result(b"x" * 5 * 1024 * 1024)
+        self.assertTrue(text.startswith("<bytes, 5.0 MB>"))
+        self.assertLessEqual(len(text), 300)
+
+    def test_small_results_are_kept(self):
+        self.assertEqual(summarize_result(None), "None")
+        self.assertEqual(summarize_result({"ok": True}), "<dict, 1 items> {'ok': True}")
+
+
+class TestDecodingRequest(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalServer().__enter__()
+        self.server.json_route("/mission", {"waypoints": [1, 2, 3]})
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def _run(self, endpoint, **kwargs) -> list:
+        results = []
+        req = UrlRequestRequests(
+            self.server.url,
+            endpoint,
+            on_success=lambda _req, result: results.append(result),
+            **kwargs,
+        )
+        wait_until(lambda: req not in g_requests, tick=lambda: req._dispatch_result(0))
+        return results
+
+    def test_decoded_in_worker_thread(self):
+        threads = []
+
+        def decode(data):
+            threads.append(threading.current_thread())
+            return decode_json(data)
+
+        registry = DecoderRegistry()
+        registry.register("application/json", decode)
+        UrlRequestRequests.decoders = registry
+        try:
+            results = self._run("/mission", decode=True)
+        finally:
+            del UrlRequestRequests.decoders
+
+        self.assertEqual(results, [{"waypoints": [1, 2, 3]}])
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.main_thread())
+
+    def test_undecodable_body_is_passed_through(self):
+        self.server.routes["/broken"] = lambda _h: (
+            200,
+            {"Content-Type": "application/json"},
+            b"{not json",
+        )
+        results = self._run("/broken", decode=True)
+        self.assertEqual(results[0].content, b"{not json")
+
+    def test_without_decode_the_response_is_passed(self):
+        results = self._run("/mission")
+        self.assertEqual(results[0].json(), {"waypoints": [1, 2, 3]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import unittest
+
+from local_server import LocalServer
+
+from mvckivy.network.session_pool import SessionPool, SessionPoolConfig
+
+
+class TestSessionPool(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalServer().__enter__()
+        self.server.json_route("/status", {"ok": True})
+        self.pool = SessionPool(SessionPoolConfig(default_headers={"X-App": "mvc"}))
+
+    def tearDown(self):
+        self.pool.close()
+        self.server.__exit__(None, None, None)
+
+    def test_session_per_host(self):
+        url = self.server.url
+        self.assertIs(
+            self.pool.session_for(f"{url}/a"), self.pool.session_for(f"{url}/b?x=1")
+        )
+        self.assertIsNot(
+            self.pool.session_for(url), self.pool.session_for("http://example.com/")
+        )
+
+    def test_connections_are_reused(self):
+        session = self.pool.session_for(self.server.url)
+        for _ in range(5):
+            resp = session.get(f"{self.server.url}/status", timeout=5)
+            self.assertEqual(resp.json(), {"ok": True})
+
+        stats = self.pool.stats()
+        self.assertEqual(stats.hosts, 1)
+        self.assertEqual(stats.requests, 5)
+        self.assertEqual(stats.new_connections, 1)
+        self.assertEqual(stats.reused_connections, 4)
+        self.assertAlmostEqual(stats.reuse_rate, 0.8)
+        self.assertEqual(self.server.hits[0][2]["X-App"], "mvc")
+
+    def test_without_keep_alive(self):
+        self.pool.configure(SessionPoolConfig(keep_alive=False))
+        session = self.pool.session_for(self.server.url)
+        for _ in range(3):
+            session.get(f"{self.server.url}/status", timeout=5)
+        self.assertEqual(self.pool.stats().new_connections, 3)
+
+    def test_retries_idempotent_requests(self):
+        attempts = []
+
+        def flaky(_handler):
+            attempts.append(1)
+            if len(attempts) < 3:
+                return 503, {}, b""
+            return 200, {}, b"ok"
+
+        self.server.routes["/flaky"] = flaky
+        self.pool.configure(SessionPoolConfig(max_retries=3, backoff_factor=0))
+        resp = self.pool.session_for(self.server.url).get(
+            f"{self.server.url}/flaky", timeout=5
+        )
+        self.assertEqual((resp.status_code, len(attempts)), (200, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+
+from kivy.network.urlrequest import g_requests
+from local_server import LocalServer
+
+from mvckivy.network.singleflight import SingleFlight
+from mvckivy.network.url_request_requests import UrlRequestRequests
+
+
+def wait_until(predicate, timeout=5.0, tick=None):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        if tick is not None:
+            tick()
+        time.sleep(0.01)
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.gate = threading.Event()
+        self.server = LocalServer().__enter__()
+
+        def vehicle(_handler):
+            self.gate.wait(5)
+            return 200, {"Content-Type": "application/json"}, b'{"id": 1}'
+
+        self.server.routes["/vehicle"] = vehicle
+        self.group = UrlRequestRequests.singleflight = SingleFlight()
+        self.requests: list[UrlRequestRequests] = []
+        self.events: list[tuple[int, str]] = []
+
+    def tearDown(self):
+        self.gate.set()
+        del UrlRequestRequests.singleflight
+        self.server.__exit__(None, None, None)
+
+    def _request(self, endpoint="/vehicle", method="GET", **kwargs):
+        n = len(self.requests)
+        req = UrlRequestRequests(
+            self.server.url,
+            endpoint,
+            method=method,
+            decode=True,
+            on_success=lambda _req, result: self.events.append((n, result)),
+            on_cancel=lambda _req: self.events.append((n, "cancel")),
+            on_error=lambda _req, error: self.events.append((n, repr(error))),
+            **kwargs,
+        )
+        self.requests.append(req)
+        return req
+
+    def _wait_done(self):
+        def tick():
+            for req in self.requests:
+                req._dispatch_result(0)
+
+        wait_until(lambda: not any(r in g_requests for r in self.requests), tick=tick)
+
+    def test_identical_requests_share_one_call(self):
+        for _ in range(3):
+            self._request()
+        self.gate.set()
+        self._wait_done()
+
+        self.assertEqual(len(self.server.hits), 1)
+        self.assertEqual(sorted(self.events), [(i, {"id": 1}) for i in range(3)])
+        stats = self.group.stats()
+        self.assertEqual((stats.in_flight, stats.started, stats.joined), (0, 1, 2))
+
+    def test_different_requests_are_not_shared(self):
+        self.server.json_route("/other", {"id": 2})
+        self._request()
+        self._request(params={"full": 1})
+        self._request("/other")
+        self._request(method="POST")
+        self._request(dedupe=False)
+        self.gate.set()
+        self._wait_done()
+
+        self.assertEqual(len(self.server.hits), 5)
+        self.assertEqual(self.group.stats().joined, 0)
+
+    def test_cancelling_one_caller_keeps_the_others(self):
+        for _ in range(3):
+            self._request()
+        self.requests[1].cancel()
+        self.requests[0].cancel()  # the request running the call
+        self.gate.set()
+        self._wait_done()
+
+        self.assertEqual(len(self.server.hits), 1)
+        self.assertEqual(
+            sorted(self.events, key=str), [(0, "cancel"), (1, "cancel"), (2, {"id": 1})]
+        )
+
+    def test_last_caller_aborts_the_call(self):
+        runner = self._request()
+        self._request()
+        for req in self.requests:
+            req.cancel()
+        self.assertTrue(runner._cancel_event.is_set())
+
+        # a new identical request does not join the aborted call
+        self._request()
+        self.assertEqual(self.group.stats().started, 2)
+
+        self.gate.set()
+        self._wait_done()
+        self.assertEqual(
+            sorted(self.events, key=str), [(0, "cancel"), (1, "cancel"), (2, {"id": 1})]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
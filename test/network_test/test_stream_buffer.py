@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+
+from local_server import LocalServer
+
+from mvckivy.network.stream_buffer import ChunkBuffer
+from mvckivy.network.url_request_requests import UrlRequestRequests
+
+
+class TestChunkBuffer(unittest.TestCase):
+    def test_batch_is_lossless_until_bound(self):
+        buffer = ChunkBuffer("batch", maxlen=3)
+        for i in range(5):
+            buffer.put(i)
+        self.assertEqual(buffer.drain(), [2, 3, 4])
+        stats = buffer.stats()
+        self.assertEqual((stats.received, stats.delivered, stats.overflowed), (5, 3, 2))
+
+    def test_latest_keeps_newest(self):
+        buffer = ChunkBuffer("latest")
+        for i in range(4):
+            buffer.put(i)
+        self.assertEqual(buffer.drain(), [3])
+        self.assertEqual(buffer.stats().coalesced, 3)
+        self.assertEqual(buffer.drain(), [])
+
+    def test_block_applies_backpressure(self):
+        buffer = ChunkBuffer("batch", maxlen=2, overflow="block")
+        done = threading.Event()
+
+        def produce():
+            for i in range(4):
+                buffer.put(i)
+            done.set()
+
+        threading.Thread(target=produce, daemon=True).start()
+        self.assertFalse(done.wait(0.2))
+        received = buffer.drain()
+        while not done.is_set() or len(buffer):
+            received += buffer.drain()
+            time.sleep(0.01)
+        self.assertEqual(received, [0, 1, 2, 3])
+        self.assertEqual(buffer.stats().overflowed, 0)
+        self.assertGreaterEqual(buffer.stats().blocked, 1)
+
+    def test_blocked_reader_stops_on_cancel(self):
+        buffer = ChunkBuffer("batch", maxlen=1, overflow="block")
+        cancel = threading.Event()
+        buffer.put(0)
+        cancel.set()
+        self.assertFalse(buffer.put(1, cancel))
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            ChunkBuffer("all")
+
+
+class TestThrottledStream(unittest.TestCase):
+    def test_throttled_stream_loses_no_chunk(self):
+        lines = [b'{"seq": %d}\n' % i for i in range(50)]
+        with LocalServer() as server:
+            server.routes["/telemetry"] = lambda _h: (200, {}, iter(lines))
+            batches, chunks, finished = [], [], []
+
+            req = UrlRequestRequests(
+                server.url,
+                "/telemetry",
+                jsonify_stream_chunk=True,
+                chunk_polling_frequency_hz=5,
+                on_stream_batch=lambda _r, batch: batches.append(batch),
+                on_stream_chunk=lambda _r, chunk: chunks.append(chunk["seq"]),
+                on_finish=lambda _r: finished.append(len(chunks)),
+            )
+
+            deadline = time.monotonic() + 5
+            while len(finished) < 2 and time.monotonic() < deadline:
+                req._dispatch_result(0)
+                time.sleep(0.01)
+
+        self.assertEqual(chunks, list(range(50)))
+        # on_finish fires after "success" and again after "finished"
+        self.assertEqual(finished[-1], 50)
+        self.assertEqual(sum(len(b) for b in batches), 50)
+        self.assertEqual(req.chunk_buffer.stats().overflowed, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import unittest
+
+import trio
+from ws_server import LocalWebSocketServer
+
+from mvckivy.network.websocket_client import (
+    FrameParser,
+    Opcode,
+    WebsocketClient,
+    encode_frame,
+)
+
+
+async def wait_until(predicate, timeout=5.0, tick=None):
+    with trio.fail_after(timeout):
+        while not predicate():
+            if tick is not None:
+                tick()
+            await trio.sleep(0.01)
+
+
+class TestFraming(unittest.TestCase):
+    def test_round_trip(self):
+        for size in (0, 5, 125, 126, 65535, 65536, 70000):
+            payload = bytes(range(256)) * (size // 256) + bytes(size % 256)
+            for mask in (True, False):
+                parser = FrameParser(1 << 20)
+                frame = encode_frame(Opcode.BINARY, payload, mask=mask)
+                # fed in pieces, as read from a socket
+                for i in range(0, len(frame), 1000):
+                    parser.feed(frame[i : i + 1000])
+                self.assertEqual(
+                    list(parser.frames()), [(True, Opcode.BINARY, payload)], size
+                )
+
+    def test_partial_frames_wait_for_data(self):
+        parser = FrameParser(1024)
+        frame = encode_frame(Opcode.TEXT, b"hello", mask=True, fin=False)
+        parser.feed(frame[:4])
+        self.assertEqual(list(parser.frames()), [])
+        parser.feed(frame[4:])
+        self.assertEqual(list(parser.frames()), [(False, Opcode.TEXT, b"hello")])
+
+
+class TestWebsocketClient(unittest.TestCase):
+    def _run(self, test, handler=None, **client_kwargs):
+        received = []
+        client_kwargs.setdefault("backoff_initial", 0.01)
+        server = LocalWebSocketServer(*(handler,) if handler else ())
+
+        async def main():
+            async with trio.open_nursery() as nursery:
+                url = await server.start(nursery)
+                client = WebsocketClient(
+                    url + "/telemetry",
+                    on_batch=lambda _client, batch: received.append(batch),
+                    **client_kwargs,
+                )
+                nursery.start_soon(client.run)
+                with trio.fail_after(10):
+                    await test(client, server, received)
+                client.close()
+                nursery.cancel_scope.cancel()
+
+        trio.run(main)
+
+    def test_echo_text_binary_and_json(self):
+        async def test(client, _server, received):
+            client.send("text")
+            client.send(b"\x00\x01")
+            client.send({"cmd": "arm"})
+            await wait_until(
+                lambda: sum(map(len, received)) == 3, tick=client._dispatch_messages
+            )
+            self.assertEqual(
+                [m for batch in received for m in batch],
+                ["text", b"\x00\x01", '{"cmd": "arm"}'],
+            )
+            self.assertEqual(client.stats().sent, 3)
+
+        self._run(test)
+
+    def test_messages_are_coalesced_per_frame(self):
+        async def burst(connection, _path):
+            for i in range(100):
+                await connection.send(f'{{"seq": {i}}}')
+            await connection.receive()
+
+        async def test(client, _server, received):
+            await wait_until(lambda: client.stats().received == 100)
+            client._dispatch_messages()
+            self.assertEqual(received, [[{"seq": i} for i in range(100)]])
+
+        self._run(test, burst, jsonify=True)
+
+    def test_latest_mode_keeps_newest(self):
+        async def burst(connection, _path):
+            for i in range(10):
+                await connection.send(str(i))
+            await connection.receive()
+
+        async def test(client, _server, received):
+            await wait_until(lambda: client.stats().received == 10)
+            client._dispatch_messages()
+            self.assertEqual(received, [["9"]])
+            self.assertEqual(client.stats().dropped_messages, 9)
+
+        self._run(test, burst, dispatch_mode="latest")
+
+    def test_reconnects_and_flushes_queued_messages(self):
+        async def test(client, server, received):
+            await wait_until(lambda: client.connected)
+            server.reject_status = 503  # keep the client offline
+            await server.drop_all()
+            await wait_until(lambda: not client.connected)
+            client.send("queued while offline")
+
+            server.reject_status = None
+            await wait_until(lambda: client.stats().connects == 2)
+            await wait_until(
+                lambda: received == [["queued while offline"]],
+                tick=client._dispatch_messages,
+            )
+
+        self._run(test)
+
+    def test_backoff_after_rejected_handshakes(self):
+        async def test(client, server, _received):
+            server.reject_status = 503
+            await wait_until(lambda: server.attempts >= 3)
+            self.assertFalse(client.connected)
+            server.reject_status = None
+            await wait_until(lambda: client.connected)
+            self.assertEqual(client.stats().connects, 1)
+
+        self._run(test)
+
+    def test_heartbeat_drops_dead_connection(self):
+        async def mute(_connection, _path):
+            await trio.sleep_forever()  # never reads: pings go unanswered
+
+        async def test(client, server, _received):
+            await wait_until(lambda: client.stats().connects >= 2)
+
+        self._run(test, mute, heartbeat_interval=0.05, heartbeat_timeout=0.05)
+
+    def test_heartbeat_measures_rtt(self):
+        async def test(client, _server, _received):
+            await wait_until(lambda: client.stats().last_rtt is not None)
+            self.assertEqual(client.stats().connects, 1)
+
+        self._run(test, heartbeat_interval=0.05, heartbeat_timeout=1)
+
+    def test_close_sends_close_frame(self):
+        async def test(client, server, _received):
+            await wait_until(lambda: client.connected)
+            client.close()
+            await wait_until(lambda: client.state == "closed")
+            await wait_until(lambda: server.close_codes == [1000])
+
+        self._run(test)
+
+
+class TestSendQueue(unittest.TestCase):
+    def test_bounded_queue(self):
+        client = WebsocketClient("ws://127.0.0.1:1", max_send_queue=3)
+        for i in range(5):
+            self.assertTrue(client.send(i))
+        self.assertEqual(list(client._send_queue), ["2", "3", "4"])
+        self.assertEqual(client.stats().dropped_sends, 2)
+
+        client = WebsocketClient(
+            "ws://127.0.0.1:1", max_send_queue=1, send_overflow="drop_newest"
+        )
+        self.assertTrue(client.send("a"))
+        self.assertFalse(client.send("b"))
+        self.assertEqual(list(client._send_queue), ["a"])
+
+    def test_every_send_async_waiter_wakes(self):
+        client = WebsocketClient("ws://127.0.0.1:1", max_send_queue=1)
+        done = []
+
+        async def waiter(name):
+            await client.send_async(name)
+            done.append(name)
+
+        async def main():
+            client.send("first")
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(waiter, "w1")
+                nursery.start_soon(waiter, "w2")
+                with trio.fail_after(5):
+                    while len(done) < 2:
+                        await trio.sleep(0.01)
+                        # what _write does for each message it takes
+                        if client._send_queue:
+                            client._send_queue.popleft()
+                            client._send_space.set()
+
+        trio.run(main)
+        self.assertCountEqual(done, ["w1", "w2"])
+
+    def test_close_before_run_is_kept(self):
+        client = WebsocketClient("ws://127.0.0.1:1", backoff_initial=0.01)
+        client.close()
+
+        async def main():
+            with trio.fail_after(5):
+                await client.run()
+
+        trio.run(main)
+        self.assertEqual(client.state, "closed")
+        self.assertEqual(client.stats().connects, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Awaitable, Callable
+
+import trio
+
+from mvckivy.network.websocket_client import (
+    ConnectionClosed,
+    WebSocketConnection,
+    WebSocketError,
+    accept_key,
+    parse_headers,
+    read_http_head,
+)
+
+
+Handler = Callable[[WebSocketConnection, str], Awaitable[None]]
+
+
+async def echo(connection: WebSocketConnection, _path: str) -> None:
+    while True:
+        await connection.send(await connection.receive())
+
+
+class LocalWebSocketServer:
+    """In-process trio WebSocket server on localhost for network tests."""
+
+    def __init__(self, handler: Handler = echo):
+        self.handler = handler
+        self.reject_status: int | None = None
+        self.attempts = 0
+        self.connections: list[WebSocketConnection] = []
+        self.close_codes: list[int] = []
+        self.url = ""
+
+    async def start(self, nursery: trio.Nursery) -> str:
+        listeners = await nursery.start(trio.serve_tcp, self._serve, 0)
+        port = listeners[0].socket.getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}"
+        return self.url
+
+    async def drop_all(self) -> None:
+        """Close the TCP connections without a close frame."""
+        for connection in self.connections:
+            await trio.aclose_forcefully(connection.stream)
+        self.connections.clear()
+
+    async def _serve(self, stream: trio.SocketStream) -> None:
+        self.attempts += 1
+        lines, rest = await read_http_head(stream)
+        if self.reject_status is not None:
+            await stream.send_all(
+                f"HTTP/1.1 {self.reject_status} Rejected\r\n"
+                "Content-Length: 0\r\n\r\n".encode()
+            )
+            await stream.aclose()
+            return
+
+        key = parse_headers(lines[1:])["sec-websocket-key"]
+        await stream.send_all(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept_key(key)}\r\n\r\n"
+            ).encode()
+        )
+        connection = WebSocketConnection(stream, client=False)
+        connection.feed(rest)
+        self.connections.append(connection)
+        try:
+            await self.handler(connection, lines[0].split(" ")[1])
+        except ConnectionClosed as e:
+            self.close_codes.append(e.code)
+        except (WebSocketError, trio.BrokenResourceError, trio.ClosedResourceError):
+            pass
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+import unittest
+
+from kivy.event import EventDispatcher
+from kivy.properties import NumericProperty, ObjectProperty
+
+from mvckivy.properties.extended_alias_property import (
+    ExtendedAliasProperty,
+    _batch_state,
+)
+
+
+class Position(EventDispatcher):
+    lat = NumericProperty(0)
+    lon = NumericProperty(0)
+
+
+class Telemetry(EventDispatcher):
+    position = ObjectProperty(None, rebind=True)
+    calls = 0
+
+    def _get_label(self, prop):
+        Telemetry.calls += 1
+        return f"{self.position.lat}/{self.position.lon}"
+
+    label = ExtendedAliasProperty(
+        _get_label, bind=["position.lat", "position.lon"], cache=True
+    )
+
+
+class Flaky(Telemetry):
+    broken = False
+
+    def _get_label(self, prop):
+        if self.broken:
+            raise RuntimeError("boom")
+        return super()._get_label(prop)
+
+    label = ExtendedAliasProperty(
+        _get_label, bind=["position.lat", "position.lon"], cache=True
+    )
+
+
+class TestAliasBatch(unittest.TestCase):
+    def test_alias_recomputes_once_on_final_state(self):
+        t = Telemetry(position=Position())
+        seen = []
+        t.bind(label=lambda _inst, value: seen.append(value))
+        Telemetry.calls = 0
+
+        with ExtendedAliasProperty.batch():
+            t.position.lat = 1
+            t.position.lon = 2
+            with ExtendedAliasProperty.batch():
+                t.position.lat = 3
+
+        batched_calls, Telemetry.calls = Telemetry.calls, 0
+        self.assertEqual(["3/2"], seen)
+
+        t.position.lon = 4
+        # пакет из трёх изменений стоит столько же, сколько одно изменение
+        self.assertEqual(Telemetry.calls, batched_calls)
+        self.assertEqual(["3/2", "3/4"], seen)
+
+    def test_failing_recompute_does_not_drop_the_rest(self):
+        broken, ok = Flaky(position=Position()), Flaky(position=Position())
+        seen = []
+        broken.bind(label=lambda *_: None)
+        ok.bind(label=lambda _inst, value: seen.append(value))
+        broken.broken = True
+
+        with self.assertRaises(RuntimeError):
+            with ExtendedAliasProperty.batch():
+                broken.position.lat = 1
+                ok.position.lat = 5
+
+        self.assertEqual(["5/0"], seen)
+        self.assertEqual(0, _batch_state.depth)
+        self.assertFalse(_batch_state.owners)
+
+    def test_requeue_from_a_callback_is_drained_without_recursion(self):
+        t = Telemetry(position=Position())
+        seen = []
+
+        def bump(_inst, value):
+            seen.append(value)
+            if t.position.lat < 3000:
+                with ExtendedAliasProperty.batch():
+                    t.position.lat += 1
+
+        t.bind(label=bump)
+        with ExtendedAliasProperty.batch():
+            t.position.lat = 1
+
+        self.assertEqual(3000, len(seen))
+        self.assertEqual("3000/0", seen[-1])
+
+    def test_batch_does_not_defer_other_threads(self):
+        t = Telemetry(position=Position())
+        seen = []
+        t.bind(label=lambda _inst, value: seen.append(value))
+        entered, done = threading.Event(), threading.Event()
+
+        def hold_batch():
+            with ExtendedAliasProperty.batch():
+                entered.set()
+                done.wait(1)
+
+        thread = threading.Thread(target=hold_batch)
+        thread.start()
+        entered.wait(1)
+        t.position.lat = 7
+        # пересчёт сразу, а не когда другой поток выйдет из своего batch()
+        self.assertEqual(["7/0"], seen)
+        done.set()
+        thread.join()
+        self.assertEqual(["7/0"], seen)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import numpy as np
+from kivy.event import EventDispatcher
+
+from mvckivy.properties import ExtendedArrayProperty
+
+
+class Telemetry(EventDispatcher):
+    altitude = ExtendedArrayProperty(capacity=2)
+    battery = ExtendedArrayProperty(maxlen=4)
+    position = ExtendedArrayProperty(dtype=[("lat", "f8"), ("lon", "f8")])
+
+
+class TestExtendedArrayProperty(unittest.TestCase):
+    def test_growable_append_reports_range(self):
+        t = Telemetry()
+        ranges = []
+        t.altitude.dispatcher.bind(
+            on_change=lambda _d, _p, _s, last_op: ranges.append(last_op)
+        )
+
+        t.altitude.append(1.0)
+        t.altitude.extend([2.0, 3.0, 4.0])
+
+        self.assertEqual([1.0, 2.0, 3.0, 4.0], t.altitude.view().tolist())
+        self.assertEqual([("append", (0, 1)), ("append", (1, 4))], ranges)
+
+    def test_view_is_read_only_and_zero_copy(self):
+        t = Telemetry()
+        t.altitude.extend([1.0, 2.0])
+        view = t.altitude.view()
+
+        self.assertFalse(view.flags.writeable)
+        self.assertTrue(np.shares_memory(view, np.asarray(t.altitude)))
+        with self.assertRaises(ValueError):
+            view[0] = 5.0
+
+    def test_ring_buffer_keeps_last_values(self):
+        t = Telemetry()
+        for i in range(11):
+            t.battery.append(i)
+
+        self.assertEqual([7.0, 8.0, 9.0, 10.0], t.battery.view().tolist())
+        t.battery.extend(range(100, 110))
+        self.assertEqual([106.0, 107.0, 108.0, 109.0], list(t.battery))
+
+    def test_overwrite_reports_range(self):
+        t = Telemetry()
+        t.altitude.extend([0.0] * 5)
+        ranges = []
+        t.altitude.dispatcher.bind(on_overwrite=lambda _d, _s, r: ranges.append(r))
+
+        t.altitude[1:3] = 7.0
+        t.altitude[-1] = 9.0
+
+        self.assertEqual([0.0, 7.0, 7.0, 0.0, 9.0], t.altitude.view().tolist())
+        self.assertEqual([(1, 3), (4, 5)], ranges)
+
+    def test_structured_dtype_channels(self):
+        t = Telemetry()
+        t.position.append((55.7, 37.6))
+        t.position.extend([(55.8, 37.7), (55.9, 37.8)])
+
+        self.assertEqual([55.7, 55.8, 55.9], t.position.channel("lat").tolist())
+        self.assertEqual(3, len(t.position))
+
+    def test_assignment_replaces_series(self):
+        t = Telemetry()
+        t.altitude = [1.0, 2.0]
+
+        self.assertEqual([1.0, 2.0], t.altitude.view().tolist())
+
+    def test_missing_numpy_names_the_extra(self):
+        with mock.patch("mvckivy.properties.extended_array_property.np", None):
+            with self.assertRaisesRegex(ImportError, r"mvckivy\[array\]"):
+                ExtendedArrayProperty()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import unittest
+from dataclasses import dataclass
+
+from kivy.event import EventDispatcher
+
+from mvckivy.properties import ExtendedIndexedListProperty
+
+
+@dataclass
+class Waypoint:
+    id: int
+    vehicle_id: str
+
+
+class Mission(EventDispatcher):
+    waypoints = ExtendedIndexedListProperty(
+        unique={"id": "id"}, multi={"vehicle": "vehicle_id"}
+    )
+    notifications = ExtendedIndexedListProperty(unique={"id": "id"})
+
+
+class TestExtendedIndexedListProperty(unittest.TestCase):
+    def test_lookup_follows_mutations(self):
+        m = Mission()
+        a, b, c = Waypoint(1, "uav-1"), Waypoint(2, "uav-1"), Waypoint(3, "uav-2")
+        m.waypoints.extend([a, b])
+        m.waypoints.insert(0, c)
+
+        self.assertIs(b, m.waypoints.by_key("id", 2))
+        self.assertEqual((a, b), m.waypoints.by_key("vehicle", "uav-1"))
+
+        m.waypoints.remove(a)
+        del m.waypoints[0]
+        m.waypoints[0] = Waypoint(4, "uav-2")
+
+        self.assertIsNone(m.waypoints.by_key("id", 1))
+        self.assertIsNone(m.waypoints.by_key("id", 2))
+        self.assertEqual((), m.waypoints.by_key("vehicle", "uav-1"))
+        self.assertEqual(4, m.waypoints.by_key("vehicle", "uav-2")[0].id)
+
+    def test_dict_items_and_pop(self):
+        m = Mission()
+        m.notifications.append({"id": "n1", "text": "low battery"})
+        self.assertEqual("n1", m.notifications.pop()["id"])
+        self.assertFalse(m.notifications.has_key("id", "n1"))
+
+    def test_unique_violation_leaves_list_untouched(self):
+        m = Mission()
+        m.waypoints.append(Waypoint(1, "uav-1"))
+
+        with self.assertRaises(ValueError):
+            m.waypoints.append(Waypoint(1, "uav-2"))
+        with self.assertRaises(ValueError):
+            m.waypoints.extend([Waypoint(2, "uav-1"), Waypoint(2, "uav-1")])
+
+        self.assertEqual(1, len(m.waypoints))
+        # замена элемента тем же ключом допустима
+        m.waypoints[0] = Waypoint(1, "uav-3")
+        self.assertEqual("uav-3", m.waypoints.by_key("id", 1).vehicle_id)
+
+    def test_batch_coalesces_and_rolls_back_indexes(self):
+        m = Mission()
+        ops = []
+        m.waypoints.dispatcher.bind(on_change=lambda _d, _p, _s, op: ops.append(op[0]))
+
+        with m.waypoints.batch():
+            m.waypoints.append(Waypoint(1, "uav-1"))
+            m.waypoints.append(Waypoint(2, "uav-1"))
+        self.assertEqual(["batch"], ops)
+
+        with self.assertRaises(RuntimeError):
+            with m.waypoints.batch():
+                m.waypoints.pop(0)
+                m.waypoints.append(Waypoint(3, "uav-2"))
+                raise RuntimeError
+
+        self.assertEqual(["batch"], ops)
+        self.assertEqual([1, 2], [w.id for w in m.waypoints])
+        self.assertIsNotNone(m.waypoints.by_key("id", 1))
+        self.assertIsNone(m.waypoints.by_key("id", 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import unittest
+
+from kivy.event import EventDispatcher
+
+from mvckivy.properties import ExtendedModelStructProperty, ModelStruct
+
+
+class VehicleState(ModelStruct):
+    lat: float = 0.0
+    lon: float = 0.0
+    mode: str = "idle"
+    waypoints: list = []
+
+
+class RoverState(VehicleState):
+    lat: float = 5.0
+    mode = "parked"
+    speed: float = 0.0
+
+
+class Vehicle(EventDispatcher):
+    state = ExtendedModelStructProperty(VehicleState)
+
+
+class Rover(EventDispatcher):
+    state = ExtendedModelStructProperty(RoverState)
+
+
+class TestModelStruct(unittest.TestCase):
+    def test_fields_are_slots_with_independent_defaults(self):
+        a, b = Vehicle(), Vehicle()
+        a.state.waypoints.append(1)
+
+        self.assertEqual(("lat", "lon", "mode", "waypoints"), VehicleState.fields())
+        self.assertIn("lat", VehicleState.__slots__)
+        self.assertEqual([], b.state.waypoints)
+
+    def test_instances_have_no_dict(self):
+        state = Rover().state
+
+        self.assertFalse(hasattr(state, "__dict__"))
+        with self.assertRaises(AttributeError):
+            state.extra = 1
+
+    def test_subclass_overrides_base_defaults(self):
+        state = Rover().state
+
+        self.assertEqual(
+            ("lat", "lon", "mode", "waypoints", "speed"), RoverState.fields()
+        )
+        self.assertEqual((5.0, "parked", 0.0), (state.lat, state.mode, state.speed))
+        self.assertNotIn("lat", RoverState.__dict__)
+        self.assertEqual(0.0, Vehicle().state.lat)
+        state.lat = 6.0
+        self.assertEqual(("lat",), state.dirty_fields)
+
+    def test_dirty_bits_track_changed_fields(self):
+        v = Vehicle()
+        v.state.lat = 1.0
+        v.state.mode = "idle"  # то же значение — не грязное
+
+        self.assertTrue(v.state.is_dirty("lat"))
+        self.assertEqual(("lat",), v.state.consume_dirty())
+        self.assertEqual((), v.state.dirty_fields)
+
+    def test_update_notifies_property_once(self):
+        v = Vehicle()
+        calls = []
+        v.bind(state=lambda *_: calls.append(1))
+
+        changed = v.state.update(lat=1.0, lon=2.0, mode="idle")
+
+        self.assertEqual(("lat", "lon"), changed)
+        self.assertEqual(1, len(calls))
+
+    def test_field_subscription(self):
+        v = Vehicle()
+        seen = []
+        v.state.subscribe("mode", lambda s, name, value: seen.append((name, value)))
+
+        v.state.lat = 5.0
+        v.state.mode = "auto"
+        v.state = {"mode": "rtl", "lat": 6.0}
+
+        self.assertEqual([("mode", "auto"), ("mode", "rtl")], seen)
+        self.assertEqual(6.0, v.state.lat)
+
+    def test_batch_notifies_each_field_once(self):
+        v = Vehicle()
+        seen, calls = [], []
+        v.bind(state=lambda *_: calls.append(1))
+        v.state.subscribe("lat", lambda s, name, value: seen.append(value))
+
+        with v.state.batch():
+            v.state.lat = 1.0
+            v.state.lat = 2.0
+            v.state.mode = "auto"
+
+        self.assertEqual([2.0], seen)
+        self.assertEqual(1, len(calls))
+
+    def test_unknown_field(self):
+        with self.assertRaises(AttributeError):
+            Vehicle().state.update(speed=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import unittest
+
+from mvckivy.properties import null_dispatcher
+from mvckivy.properties.null_dispatcher import create_null_dispatcher
+
+
+class TestCreateNullDispatcher(unittest.TestCase):
+    def test_class_is_cached_by_signature(self):
+        a = create_null_dispatcher(children=[], height=0)
+        b = create_null_dispatcher(height=0, children=[])
+
+        self.assertIsNot(a, b)
+        self.assertIs(type(a), type(b))
+        self.assertIsNot(type(a), type(create_null_dispatcher(children=[], height=1)))
+        self.assertIsNot(type(a), type(create_null_dispatcher(children=[], height="0")))
+
+    def test_instances_do_not_share_state(self):
+        a = create_null_dispatcher(children=[])
+        b = create_null_dispatcher(children=[])
+        a.children.append(1)
+        self.assertEqual([], b.children)
+
+    def test_frozen_is_shared_and_read_only(self):
+        a = create_null_dispatcher(opacity=0, frozen=True)
+        self.assertIs(a, create_null_dispatcher(opacity=0, frozen=True))
+        self.assertEqual(0, a.opacity)
+        with self.assertRaises(AttributeError):
+            a.opacity = 1
+
+    def test_frozen_containers_are_immutable(self):
+        a = create_null_dispatcher(children=[], table={"x": [1]}, frozen=True)
+        self.assertEqual((), a.children)
+        with self.assertRaises(AttributeError):
+            a.children.append(1)
+        with self.assertRaises(TypeError):
+            a.table["y"] = 2
+        self.assertEqual((1,), a.table["x"])
+
+    def test_mixed_dict_keys(self):
+        a = create_null_dispatcher(table={1: "a", "b": 2})
+        self.assertIs(type(a), type(create_null_dispatcher(table={"b": 2, 1: "a"})))
+
+    def test_unhashable_defaults_are_not_cached(self):
+        class Unhashable:
+            __hash__ = None
+
+        cached = len(null_dispatcher._null_classes)
+        a = create_null_dispatcher(item=Unhashable())
+        b = create_null_dispatcher(item=Unhashable(), frozen=True)
+
+        self.assertIsNot(type(a), type(create_null_dispatcher(item=a.item)))
+        self.assertIsInstance(b.item, Unhashable)
+        self.assertEqual(cached, len(null_dispatcher._null_classes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+import unittest
+
+from kivy.config import ConfigParser
+from kivy.event import EventDispatcher
+
+from mvckivy.properties import (
+    ConfigParserDict,
+    ExtendedConfigParserProperty,
+    ExtendedListProperty,
+    property_profiler,
+)
+
+
+config = ConfigParser(name="profiler_test")
+config.setdefaults("section", {"table": "{}"})
+
+
+class Model(EventDispatcher):
+    items = ExtendedListProperty()
+    table = ExtendedConfigParserProperty(
+        "{}", "section", "table", "profiler_test", val_type=ConfigParserDict
+    )
+
+
+class DroneModel(Model):
+    pass
+
+
+class RoverModel(Model):
+    pass
+
+
+# same class name, different module
+OtherModel = type("Model", (Model,), {"__module__": "other.models"})
+
+MODEL, DRONE, ROVER = (f"{__name__}.{n}" for n in ("Model", "DroneModel", "RoverModel"))
+
+
+class TestPropertyProfiler(unittest.TestCase):
+    def setUp(self):
+        property_profiler.reset()
+        property_profiler.enable()
+
+    def tearDown(self):
+        property_profiler.disable()
+        property_profiler.reset()
+
+    def test_struct_dispatch_is_counted_with_fan_out(self):
+        m = Model()
+        m.bind(items=lambda *_: None)
+        m.items.append(1)
+        m.items.append(2)
+
+        (row,) = property_profiler.stats()
+        self.assertEqual((MODEL, "items", "struct"), (row.owner, row.name, row.kind))
+        self.assertEqual(2, row.count)
+        self.assertGreaterEqual(row.max_fan_out, 1)
+        self.assertEqual(MODEL, json.loads(property_profiler.dump_json())[0]["owner"])
+
+    def test_shared_property_is_counted_per_owner_class(self):
+        drone, rover = DroneModel(), RoverModel()
+        # link() runs on first access: the last linked class is RoverModel
+        drone_items, drone_table = drone.items, drone.table
+        rover.items, rover.table
+        drone_items.append(1)
+        rover.items.append(1)
+        rover.items.append(2)
+        drone_table["a"] = 1
+
+        rows = {(r.owner, r.kind): r.count for r in property_profiler.stats()}
+        self.assertEqual(
+            {
+                (DRONE, "struct"): 1,
+                (ROVER, "struct"): 2,
+                (DRONE, "config"): 1,
+            },
+            rows,
+        )
+
+    def test_same_named_classes_are_not_merged(self):
+        Model().items.append(1)
+        OtherModel().items.append(1)
+
+        owners = sorted(r.owner for r in property_profiler.stats())
+        self.assertEqual(["other.models.Model", MODEL], owners)
+
+    def test_direct_set_setting_uses_declaring_class(self):
+        RoverModel().table
+        Model.table.set_setting("section", "table", '{"b": 2}')
+
+        (row,) = property_profiler.stats()
+        self.assertEqual((MODEL, "table", "config"), (row.owner, row.name, row.kind))
+
+    def test_disabled_profiler_records_nothing(self):
+        property_profiler.disable()
+        Model().items.append(1)
+        self.assertEqual([], property_profiler.stats())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import copy
+import json
+import unittest
+
+from kivy.event import EventDispatcher
+
+from mvckivy.properties import ExtendedDictProperty, ExtendedListProperty
+
+
+class Holder(EventDispatcher):
+    options = ExtendedListProperty(defaultvalue=[1, 2, [3, 4]])
+    table = ExtendedDictProperty(defaultvalue={"a": 1, "rows": {"x": [1]}})
+    empty = ExtendedListProperty()
+
+
+class TestStructDefaults(unittest.TestCase):
+    def test_instances_read_the_default(self):
+        h1, h2 = Holder(), Holder()
+
+        self.assertEqual([1, 2, [3, 4]], h1.options)
+        self.assertEqual(3, len(h2.options))
+        self.assertIn(2, h2.options)
+        self.assertEqual(["a", "rows"], list(h1.table))
+        self.assertEqual([], Holder().empty)
+
+    def test_mutation_changes_only_owner(self):
+        h1, h2 = Holder(), Holder()
+        changes = []
+        h1.options.dispatcher.bind(on_change=lambda *largs: changes.append(largs[-1]))
+
+        h1.options.append(5)
+
+        self.assertEqual([1, 2, [3, 4], 5], h1.options)
+        self.assertEqual([1, 2, [3, 4]], h2.options)
+        self.assertEqual([("append", (5,))], changes)
+
+    def test_nested_values_are_per_instance(self):
+        h1, h2 = Holder(), Holder()
+
+        h1.options[2].append(99)
+        h1.table["rows"]["x"].append(2)
+
+        self.assertEqual([3, 4, 99], h1.options[2])
+        self.assertEqual([3, 4], h2.options[2])
+        self.assertEqual({"x": [1, 2]}, h1.table.get("rows"))
+        self.assertEqual({"x": [1]}, h2.table["rows"])
+
+    def test_iteration_does_not_leak_shared_values(self):
+        h1, h2 = Holder(), Holder()
+
+        for value in h1.options:
+            if isinstance(value, list):
+                value.append(99)
+        for _key, value in h1.table.items():
+            if isinstance(value, dict):
+                value["y"] = 1
+        h1.options[1:][1].append(100)
+        list(h1.table.values())[1]["z"] = 2
+
+        self.assertEqual([1, 2, [3, 4, 99, 100]], h1.options)
+        self.assertEqual([1, 2, [3, 4]], h2.options)
+        self.assertEqual({"x": [1]}, h2.table["rows"])
+        self.assertEqual([1, 2, [3, 4]], Holder().options)
+        self.assertEqual({"a": 1, "rows": {"x": [1]}}, Holder().table)
+
+    def test_shared_struct_serializes(self):
+        h = Holder()
+
+        self.assertEqual('{"a": 1, "rows": {"x": [1]}}', json.dumps(h.table))
+        self.assertEqual("[1, 2, [3, 4]]", json.dumps(h.options))
+
+    def test_copy(self):
+        h = Holder()
+        clone = copy.copy(h.options)
+
+        self.assertEqual([1, 2, [3, 4]], list(clone))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import math
+import unittest
+
+import trio
+from trio.testing import MockClock
+
+from mvckivy.utils.startup_hooks import StartupHooks
+
+
+class TestStartupHooks(unittest.TestCase):
+    def test_hooks_run_concurrently(self):
+        hooks = StartupHooks()
+        done = []
+
+        async def hook(name):
+            await trio.sleep(0.05)
+            done.append(name)
+
+        async def main():
+            start = trio.current_time()
+            async with trio.open_nursery() as nursery:
+                for name in ("config", "cache", "fetch"):
+                    hooks.start(nursery, name, hook(name))
+            return trio.current_time() - start
+
+        elapsed = trio.run(main, clock=MockClock(autojump_threshold=0))
+        self.assertEqual(sorted(done), ["cache", "config", "fetch"])
+        self.assertLess(elapsed, 0.1)
+        self.assertEqual({t.status for t in hooks.timings()}, {"done"})
+        self.assertEqual(hooks.running, 0)
+
+    def test_timeout_and_failure_do_not_cancel_others(self):
+        hooks = StartupHooks(default_timeout=1)
+
+        async def slow():
+            await trio.sleep(10)
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        async def ok():
+            await trio.sleep(0.5)
+
+        async def main():
+            async with trio.open_nursery() as nursery:
+                hooks.start(nursery, "slow", slow())
+                hooks.start(nursery, "broken", broken())
+                hooks.start(nursery, "ok", ok())
+
+        with self.assertLogs("mvckivy", "WARNING"):
+            trio.run(main, clock=MockClock(autojump_threshold=0))
+
+        status = {t.name: t.status for t in hooks.timings()}
+        self.assertEqual(status, {"slow": "timeout", "broken": "failed", "ok": "done"})
+        broken_timing = next(t for t in hooks.timings() if t.name == "broken")
+        self.assertIsInstance(broken_timing.error, RuntimeError)
+
+    def test_infinite_timeout_overrides_default(self):
+        hooks = StartupHooks(default_timeout=1)
+
+        async def slow():
+            await trio.sleep(100)
+
+        async def main():
+            async with trio.open_nursery() as nursery:
+                hooks.start(nursery, "slow", slow(), timeout=math.inf)
+
+        trio.run(main, clock=MockClock(autojump_threshold=0))
+        self.assertEqual([t.status for t in hooks.timings()], ["done"])
+
+    def test_cancel_stops_running_and_drops_new_hooks(self):
+        hooks = StartupHooks(default_timeout=None)
+
+        async def forever():
+            await trio.sleep_forever()
+
+        async def main():
+            async with trio.open_nursery() as nursery:
+                hooks.start(nursery, "forever", forever())
+                await trio.sleep(1)
+                hooks.cancel()
+                with self.assertLogs("mvckivy", "WARNING"):
+                    self.assertFalse(hooks.start(nursery, "late", forever()))
+
+        trio.run(main, clock=MockClock(autojump_threshold=0))
+        self.assertEqual([t.status for t in hooks.timings()], ["cancelled"])
+
+    def test_without_nursery_hook_is_closed(self):
+        hooks = StartupHooks()
+
+        async def hook():
+            pass
+
+        coro = hook()
+        with self.assertLogs("mvckivy", "WARNING"):
+            self.assertFalse(hooks.start(None, "hook", coro))
+        self.assertIsNone(coro.cr_frame)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+import unittest
+
+from kivy.event import EventDispatcher
+from kivy.properties import ListProperty, NumericProperty
+
+from mvckivy.properties import ExtendedListProperty
+from mvckivy.utils.update_inbox import UpdateInbox
+
+
+class Telemetry(EventDispatcher):
+    altitude = NumericProperty(0)
+    speed = NumericProperty(0)
+    track = ExtendedListProperty()
+    log = ListProperty()
+
+
+class TestUpdateInbox(unittest.TestCase):
+    def setUp(self):
+        self.model = Telemetry()
+        self.inbox = UpdateInbox(self.model)
+
+    def tearDown(self):
+        self.inbox.cancel()
+
+    def test_latest_value_wins_and_appends_are_kept(self):
+        seen = []
+        self.model.bind(altitude=lambda _m, v: seen.append(v))
+
+        def worker():
+            for i in range(1, 201):
+                self.inbox.post("altitude", i)
+                self.inbox.append("track", i)
+            self.inbox.append("log", "done")
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.inbox.drain()
+
+        self.assertEqual([200], seen)
+        self.assertEqual(400, len(self.model.track))
+        self.assertEqual(["done", "done"], self.model.log)
+        stats = self.inbox.stats()
+        self.assertEqual((802, 399, 1), (stats.posted, stats.coalesced, stats.drains))
+        self.assertFalse(self.inbox.pending)
+
+    def test_track_appends_notify_once_per_drain(self):
+        calls = []
+        self.model.bind(track=lambda *_: calls.append(1))
+        self.inbox.append("track", 1, 2)
+        self.inbox.append("track", 3)
+        self.inbox.post_many(altitude=5, speed=3)
+
+        self.inbox.drain()
+        self.inbox.drain()
+
+        self.assertEqual([1, 2, 3], list(self.model.track))
+        self.assertEqual((5, 3), (self.model.altitude, self.model.speed))
+        self.assertEqual(1, len(calls))
+
+    def test_drain_keeps_arrival_order(self):
+        order = []
+        self.model.bind(speed=lambda *_: order.append("speed"))
+        self.model.bind(altitude=lambda *_: order.append("altitude"))
+        self.inbox.append("log", "stale")
+        self.inbox.post("speed", 1)
+        self.inbox.post("log", ["reset"])
+        self.inbox.post("altitude", 2)
+        self.inbox.append("log", "after")
+        self.inbox.post("speed", 3)
+
+        self.inbox.drain()
+
+        self.assertEqual(["speed", "altitude"], order)
+        self.assertEqual(["reset", "after"], self.model.log)
+        self.assertEqual(3, self.model.speed)
+
+
+if __name__ == "__main__":
+    unittest.main()